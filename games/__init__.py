@@ -1,6 +1,21 @@
-from .gravity_flip import GravityFlipRunner
-from .color_match import ColorMatchShooter
-from .echo_maze import EchoMaze
-from .time_loop import TimeLoopDefender
+import importlib
 
-__all__ = ['GravityFlipRunner', 'ColorMatchShooter', 'EchoMaze', 'TimeLoopDefender']
+# Games load on first use, so headless modules such as gravity_sim and
+# the maze worker can be imported without pygame
+_modules = {
+    'GravityFlipRunner': 'gravity_flip',
+    'GravityFlipSimulation': 'gravity_sim',
+    'PopulationSimulation': 'gravity_sim',
+    'ColorMatchShooter': 'color_match',
+    'EchoMaze': 'echo_maze',
+    'TimeLoopDefender': 'time_loop',
+}
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'.{_modules[name]}', __name__),
+                   name)
+
+__all__ = ['GravityFlipRunner', 'GravityFlipSimulation', 'PopulationSimulation',
+           'ColorMatchShooter', 'EchoMaze', 'TimeLoopDefender']
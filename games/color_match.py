@@ -1,12 +1,30 @@
 import pygame
 import random
 import math
+from operator import attrgetter
 from typing import List, Dict, Tuple
 import os
+from utils.game_clock import GameClock
+from utils.object_pool import ObjectPool
+from utils.particles import ParticleEngine
+from utils.score_store import score_store
+from utils.spatial_hash import SpatialHash
+from utils.surface_factory import surface_factory
+from utils.text_cache import text_cache
+from utils.trail import Trail, TrailRenderer
 
 class Target:
+    __slots__ = ('x', 'y', 'color', 'size', 'original_size', 'hit',
+                 'hit_animation', 'rotation', 'pulse', 'level', 'vx', 'vy',
+                 'color_change_timer', 'original_color', 'serial')
+    
     def __init__(self, x: float, y: float, color: Tuple[int, int, int], 
                  size: int = 40, level: int = 1):
+        self.reset(x, y, color, size, level)
+        
+    def reset(self, x: float, y: float, color: Tuple[int, int, int], 
+              size: int = 40, level: int = 1):
+        self.serial = 0  # Spawn order, set by the game
         self.x = x
         self.y = y
         self.color = color
@@ -67,126 +85,118 @@ class Target:
         return False
         
     def draw(self, screen):
-        # Create surface for the target
-        target_surface = pygame.Surface((self.size * 2, self.size * 2), 
-                                      pygame.SRCALPHA)
+        if self.hit:
+            sprite, offset = target_atlas.get_hit(
+                self.color, self.original_size, self.hit_animation,
+                self.rotation)
+        else:
+            sprite, offset = target_atlas.get(
+                self.color, self.size, self.rotation, self.pulse)
+        screen.blit(sprite, (self.x + offset[0], self.y + offset[1]))
+
+class TargetAtlas:
+    """Pre-rendered target sprites at quantized angles and pulse steps.
+
+    Sprites are rendered lazily the first time a (color, size, angle, pulse)
+    combination is drawn and kept for the rest of the process. A target is
+    a square, so angles only need to cover 0-90 degrees.
+    """
+    
+    ANGLE_STEP = 3       # Degrees between cached rotations
+    HIT_ANGLE_STEP = 15  # Coarser for the short hit scale-up
+    PULSE_STEPS = 4      # Pulse ranges over 0-0.2
+    
+    def __init__(self):
+        self.sprites: Dict[tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        
+    def get(self, color: Tuple[int, int, int], size: int, rotation: float,
+            pulse: float):
+        angle = int(rotation % 90) // self.ANGLE_STEP * self.ANGLE_STEP
+        pulse_step = min(self.PULSE_STEPS - 1,
+                         int(pulse / 0.2 * self.PULSE_STEPS))
+        key = (color, int(size), angle, pulse_step)
+        if key not in self.sprites:
+            pulse = 0.2 * pulse_step / (self.PULSE_STEPS - 1)
+            self.sprites[key] = self.render(color, int(size), angle, pulse)
+        return self.sprites[key]
+        
+    def get_hit(self, color: Tuple[int, int, int], original_size: int,
+                hit_animation: float, rotation: float):
+        # hit_animation advances in 0.2 steps, so the scaled sizes repeat
+        size = int(original_size * (1 + math.sin(hit_animation)))
+        angle = int(rotation % 90) // self.HIT_ANGLE_STEP * self.HIT_ANGLE_STEP
+        key = (color, size, angle, 'hit')
+        if key not in self.sprites:
+            self.sprites[key] = self.render(color, size, angle, 0)
+        return self.sprites[key]
+        
+    def render(self, color: Tuple[int, int, int], size: int, angle: int,
+               pulse: float):
+        """Draw a target and return the trimmed sprite and its offset
+        from the target's center"""
+        target_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
         
         # Draw glowing effect
-        glow_size = int(self.size * (1 + self.pulse))
+        glow_size = int(size * (1 + pulse))
         for i in range(3):
             alpha = 100 - i * 30
             pygame.draw.rect(target_surface,
-                           (*self.color, alpha),
-                           (self.size - glow_size//2 + i*2,
-                            self.size - glow_size//2 + i*2,
+                           (*color, alpha),
+                           (size - glow_size//2 + i*2,
+                            size - glow_size//2 + i*2,
                             glow_size - i*4,
                             glow_size - i*4))
             
         # Draw main square
         pygame.draw.rect(target_surface,
-                        self.color,
-                        (self.size - self.size//2,
-                         self.size - self.size//2,
-                         self.size,
-                         self.size))
-        
-        # Rotate and draw
-        rotated_surface = pygame.transform.rotate(target_surface, self.rotation)
-        screen.blit(rotated_surface,
-                   (self.x - rotated_surface.get_width()//2,
-                    self.y - rotated_surface.get_height()//2))
+                        color,
+                        (size - size//2,
+                         size - size//2,
+                         size,
+                         size))
+        
+        # Rotate, then trim the empty margins the rotation leaves
+        rotated_surface = pygame.transform.rotate(target_surface, angle)
+        bounds = rotated_surface.get_bounding_rect()
+        sprite = surface_factory.convert(
+            rotated_surface.subsurface(bounds).copy(), static=True)
+        offset = (bounds.x - rotated_surface.get_width()//2,
+                  bounds.y - rotated_surface.get_height()//2)
+        return sprite, offset
 
-class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Dict] = []
-        
-    def create_hit_burst(self, x: int, y: int, color: Tuple[int, int, int]):
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 1.0,
-                'color': color,
-                'size': random.uniform(2, 4)
-            })
-            
-    def create_background_particle(self, width: int, height: int):
-        color = random.choice([
-            (255, 0, 0), (0, 255, 0), (0, 0, 255),
-            (255, 255, 0), (0, 255, 255), (255, 0, 255)
-        ])
-        self.particles.append({
-            'x': random.randint(0, width),
-            'y': height + 10,
-            'vx': random.uniform(-0.5, 0.5),
-            'vy': random.uniform(-1, -0.5),
-            'life': 1.0,
-            'color': color,
-            'size': random.uniform(3, 6)
-        })
-            
-    def update(self):
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 0.02
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                
-    def draw(self, screen):
-        for particle in self.particles:
-            alpha = int(255 * particle['life'])
-            color = (*particle['color'][:3], alpha)
-            pos = (int(particle['x']), int(particle['y']))
-            size = int(particle['size'] * particle['life'])
-            
-            particle_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, 
-                             (size, size), size)
-            screen.blit(particle_surface, 
-                       (pos[0] - size, pos[1] - size))
+target_atlas = TargetAtlas()
 
 class Projectile:
+    __slots__ = ('x', 'y', 'color', 'speed', 'trail')
+    
     def __init__(self, x: float, y: float, color: Tuple[int, int, int]):
+        self.trail = Trail(10)
+        self.reset(x, y, color)
+        
+    def reset(self, x: float, y: float, color: Tuple[int, int, int]):
         self.x = x
         self.y = y
         self.color = color
         self.speed = -10
-        self.trail: List[Dict] = []
+        self.trail.clear()
         
     def update(self):
         self.y += self.speed
         
         # Update trail
-        self.trail.insert(0, {'x': self.x, 'y': self.y, 'alpha': 255})
-        if len(self.trail) > 10:
-            self.trail.pop()
-            
-        for trail in self.trail:
-            trail['alpha'] = max(0, trail['alpha'] - 25)
-            
-    def draw(self, screen):
-        # Draw trail
-        for trail in self.trail:
-            alpha = trail['alpha']
-            trail_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface,
-                             (*self.color, alpha),
-                             (3, 3), 3)
-            screen.blit(trail_surface,
-                       (trail['x'] - 3, trail['y'] - 3))
-        
-        # Draw projectile
-        projectile_surface = pygame.Surface((8, 8), pygame.SRCALPHA)
-        pygame.draw.circle(projectile_surface,
-                          self.color,
-                          (4, 4), 4)
-        screen.blit(projectile_surface,
-                   (self.x - 4, self.y - 4))
+        self.trail.push(self.x, self.y)
+
+class PowerUp:
+    __slots__ = ('x', 'y', 'type', 'vy')
+    
+    def __init__(self, x: float, y: float, type: str, vy: float = 2):
+        self.reset(x, y, type, vy)
+        
+    def reset(self, x: float, y: float, type: str, vy: float = 2):
+        self.x = x
+        self.y = y
+        self.type = type
+        self.vy = vy
 
 class ColorMatchShooter:
     def __init__(self):
@@ -210,7 +220,34 @@ class ColorMatchShooter:
         self.current_color_index = 0
         
         # Initialize systems
-        self.particle_system = ParticleSystem()
+        self.particle_system = ParticleEngine()
+        
+        # Broad-phase grids for collisions, cleared in reset_game
+        self.target_grid = SpatialHash(64)
+        self.projectile_grid = SpatialHash(64)
+        self.power_up_grid = SpatialHash(64)
+        
+        # Entities are recycled; the live lists are unordered
+        self.target_pool = ObjectPool(Target)
+        self.projectile_pool = ObjectPool(Projectile)
+        self.power_up_pool = ObjectPool(PowerUp)
+        self.targets = self.target_pool.active
+        self.projectiles = self.projectile_pool.active
+        self.power_ups = self.power_up_pool.active
+        self.targets_spawned = 0
+        
+        # Projectile sprites, shared by every projectile of a color
+        self.trail_renderers = {
+            color: TrailRenderer(color, [6] * 10,
+                                 [230 - 25 * i for i in range(10)])
+            for color in self.COLORS
+        }
+        self.projectile_sprites = {}
+        for color in self.COLORS:
+            sprite = pygame.Surface((8, 8), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (4, 4), 4)
+            self.projectile_sprites[color] = surface_factory.convert(
+                sprite, static=True)
         
         # Game states
         self.STATE_MENU = 'menu'
@@ -218,9 +255,9 @@ class ColorMatchShooter:
         self.STATE_GAME_OVER = 'game_over'
         
         # Load fonts
-        self.title_font = pygame.font.Font(None, 74)
-        self.menu_font = pygame.font.Font(None, 36)
-        self.hud_font = pygame.font.Font(None, 24)
+        self.title_font = text_cache.get_font(74)
+        self.menu_font = text_cache.get_font(36)
+        self.hud_font = text_cache.get_font(24)
         
         # Game variables
         self.reset_game()
@@ -229,85 +266,121 @@ class ColorMatchShooter:
         self.game_state = self.STATE_MENU
         self.score = 0
         self.combo = 0
-        self.high_score = self.load_high_score()
-        self.targets: List[Target] = []
-        self.projectiles: List[Projectile] = []
+        self.high_score = score_store.get_high_score('color_match')
+        self.target_pool.release_all()
+        self.projectile_pool.release_all()
         self.spawn_timer = 0
         self.level = 1
         self.shots_fired = 0
         self.shots_hit = 0
         self.combo_text = None
         self.combo_timer = 0
-        self.power_ups: List[Dict] = []
+        self.power_up_pool.release_all()
+        
+        self.target_grid.clear()
+        self.projectile_grid.clear()
+        self.power_up_grid.clear()
         self.rainbow_shot = False
         self.rainbow_timer = 0
         self.slow_motion = False
         self.slow_timer = 0
         
-    def load_high_score(self) -> int:
-        try:
-            with open('color_match_high_score.txt', 'r') as f:
-                return int(f.read())
-        except:
-            return 0
-            
-    def save_high_score(self):
-        with open('color_match_high_score.txt', 'w') as f:
-            f.write(str(self.high_score))
+    def record_run(self):
+        """Store the current run if one was played"""
+        if self.game_state == self.STATE_MENU:
+            return
+        score_store.record_run(
+            'color_match', self.score, level=self.level,
+            shots_fired=self.shots_fired, shots_hit=self.shots_hit,
+            accuracy=self.shots_hit / max(1, self.shots_fired))
+        self.high_score = max(self.high_score, self.score)
             
     def spawn_target(self):
         x = random.randint(50, self.WINDOW_SIZE[0] - 50)
         color = random.choice(self.COLORS)
-        self.targets.append(Target(x, -20, color, level=self.level))
+        target = self.target_pool.acquire(x, -20, color, level=self.level)
+        target.serial = self.targets_spawned
+        self.targets_spawned += 1
+        self.target_grid.update(target, target.x, target.y, target.size)
+        
+    def fire_projectile(self):
+        projectile = self.projectile_pool.acquire(
+            self.player_x, self.WINDOW_SIZE[1] - 60,
+            self.COLORS[self.current_color_index])
+        # Grid insertion order is firing order, which collisions rely on
+        self.projectile_grid.update(projectile, projectile.x, projectile.y)
+        self.shots_fired += 1
         
     def spawn_power_up(self):
         if random.random() < 0.05:  # 5% chance
             x = random.randint(50, self.WINDOW_SIZE[0] - 50)
             power_up_type = random.choice(['rainbow', 'slow', 'multiplier'])
-            self.power_ups.append({
-                'x': x,
-                'y': -20,
-                'type': power_up_type,
-                'vy': 2
-            })
+            self.power_up_pool.acquire(x, -20, power_up_type)
             
     def update_power_ups(self):
-        for power_up in self.power_ups[:]:
-            power_up['y'] += power_up['vy']
-            
-            # Check collision with player
-            if (abs(power_up['x'] - self.player_x) < 30 and
-                abs(power_up['y'] - (self.WINDOW_SIZE[1] - 50)) < 30):
-                if power_up['type'] == 'rainbow':
+        power_ups = self.power_ups
+        for index in range(len(power_ups) - 1, -1, -1):
+            power_up = power_ups[index]
+            power_up.y += power_up.vy
+            if power_up.y > self.WINDOW_SIZE[1]:
+                self.power_up_grid.remove(power_up)
+                self.power_up_pool.release_at(index)
+            else:
+                self.power_up_grid.update(power_up, power_up.x, power_up.y)
+        
+        # Check collision with player, only near the player's cells
+        player_y = self.WINDOW_SIZE[1] - 50
+        collected = set()
+        for power_up in self.power_up_grid.candidates(
+                self.player_x, player_y, 30):
+            if (abs(power_up.x - self.player_x) < 30 and
+                abs(power_up.y - player_y) < 30):
+                if power_up.type == 'rainbow':
                     self.rainbow_shot = True
                     self.rainbow_timer = 300  # 5 seconds
-                elif power_up['type'] == 'slow':
+                elif power_up.type == 'slow':
                     self.slow_motion = True
                     self.slow_timer = 300
-                elif power_up['type'] == 'multiplier':
+                elif power_up.type == 'multiplier':
                     self.score *= 2
-                self.power_ups.remove(power_up)
-            elif power_up['y'] > self.WINDOW_SIZE[1]:
-                self.power_ups.remove(power_up)
+                collected.add(power_up)
+        if collected:
+            for power_up in collected:
+                self.power_up_grid.remove(power_up)
+            self.power_up_pool.release_if(collected.__contains__)
                 
     def draw_power_ups(self, screen):
         for power_up in self.power_ups:
             color = (255, 255, 255)
-            if power_up['type'] == 'rainbow':
+            if power_up.type == 'rainbow':
                 color = (random.randint(0, 255),
                         random.randint(0, 255),
                         random.randint(0, 255))
-            elif power_up['type'] == 'slow':
+            elif power_up.type == 'slow':
                 color = (0, 255, 255)
-            elif power_up['type'] == 'multiplier':
+            elif power_up.type == 'multiplier':
                 color = (255, 255, 0)
                 
             pygame.draw.circle(screen, color,
-                             (int(power_up['x']), int(power_up['y'])), 15)
+                             (int(power_up.x), int(power_up.y)), 15)
+            
+    def draw_projectiles(self, screen):
+        # Draw trails, one batch per color
+        for color, renderer in self.trail_renderers.items():
+            renderer.draw(screen, [projectile.trail 
+                                   for projectile in self.projectiles
+                                   if projectile.color == color])
+            
+        # Draw projectiles
+        screen.blits([(self.projectile_sprites[projectile.color],
+                       (projectile.x - 4, projectile.y - 4))
+                      for projectile in self.projectiles],
+                     doreturn=False)
             
     def draw_menu(self, screen):
         # Draw title
-        title = self.title_font.render("COLOR MATCH SHOOTER", True, self.WHITE)
+        title = text_cache.render(self.title_font, "COLOR MATCH SHOOTER",
+                                  self.WHITE)
         title_rect = title.get_rect(center=(self.WINDOW_SIZE[0]//2, 150))
         screen.blit(title, title_rect)
         
@@ -320,73 +393,73 @@ class ColorMatchShooter:
         ]
         
         for i, text in enumerate(controls):
-            control_text = self.menu_font.render(text, True, self.WHITE)
+            control_text = text_cache.render(self.menu_font, text, self.WHITE)
             control_rect = control_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 250 + i*40))
             screen.blit(control_text, control_rect)
             
         # Draw "Press Space to Start"
         if (pygame.time.get_ticks() // 500) % 2:
-            start_text = self.menu_font.render("Press SPACE to Start",
-                                             True, self.WHITE)
+            start_text = text_cache.render(self.menu_font,
+                                           "Press SPACE to Start", self.WHITE)
             start_rect = start_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 450))
             screen.blit(start_text, start_rect)
             
         # Draw high score
-        high_score_text = self.menu_font.render(
-            f"High Score: {self.high_score}", True, self.WHITE)
+        high_score_text = text_cache.render(
+            self.menu_font, f"High Score: {self.high_score}", self.WHITE)
         high_score_rect = high_score_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 500))
         screen.blit(high_score_text, high_score_rect)
         
     def draw_game_over(self, screen):
         # Draw "Game Over"
-        game_over = self.title_font.render("GAME OVER", True, self.WHITE)
+        game_over = text_cache.render(self.title_font, "GAME OVER", self.WHITE)
         game_over_rect = game_over.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 150))
         screen.blit(game_over, game_over_rect)
         
         # Draw score
-        score_text = self.menu_font.render(f"Score: {self.score}",
-                                         True, self.WHITE)
+        score_text = text_cache.render(self.menu_font, f"Score: {self.score}",
+                                       self.WHITE)
         score_rect = score_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 250))
         screen.blit(score_text, score_rect)
         
         # Draw high score
-        high_score_text = self.menu_font.render(
-            f"High Score: {self.high_score}", True, self.WHITE)
+        high_score_text = text_cache.render(
+            self.menu_font, f"High Score: {self.high_score}", self.WHITE)
         high_score_rect = high_score_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 300))
         screen.blit(high_score_text, high_score_rect)
         
         # Draw accuracy
         accuracy = (self.shots_hit / max(1, self.shots_fired)) * 100
-        accuracy_text = self.menu_font.render(
-            f"Accuracy: {accuracy:.1f}%", True, self.WHITE)
+        accuracy_text = text_cache.render(
+            self.menu_font, f"Accuracy: {accuracy:.1f}%", self.WHITE)
         accuracy_rect = accuracy_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 350))
         screen.blit(accuracy_text, accuracy_rect)
         
         # Draw restart instructions
         if (pygame.time.get_ticks() // 500) % 2:
-            restart_text = self.menu_font.render(
-                "Press R to Retry or ESC to Exit", True, self.WHITE)
+            restart_text = text_cache.render(
+                self.menu_font, "Press R to Retry or ESC to Exit", self.WHITE)
             restart_rect = restart_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 450))
             screen.blit(restart_text, restart_rect)
             
     def draw_hud(self, screen):
         # Draw score
-        score_text = self.hud_font.render(f"Score: {self.score}",
-                                        True, self.WHITE)
+        score_text = text_cache.render_counter(self.hud_font, "Score: ",
+                                               self.score, self.WHITE)
         screen.blit(score_text, (10, 10))
         
         # Draw combo
         if self.combo > 1:
-            combo_text = self.hud_font.render(f"Combo x{self.combo}",
-                                            True, self.WHITE)
+            combo_text = text_cache.render_counter(self.hud_font, "Combo x",
+                                                   self.combo, self.WHITE)
             screen.blit(combo_text, (10, 40))
             
         # Draw current color indicator
@@ -408,24 +481,130 @@ class ColorMatchShooter:
                 
         # Draw power-up status
         if self.rainbow_shot:
-            rainbow_text = self.hud_font.render(
-                f"Rainbow Shot: {self.rainbow_timer//60}s",
-                True, (random.randint(0, 255),
-                      random.randint(0, 255),
-                      random.randint(0, 255)))
+            # Flicker between the palette colors so every frame is a
+            # cached surface
+            rainbow_text = text_cache.render(
+                self.hud_font, f"Rainbow Shot: {self.rainbow_timer//60}s",
+                random.choice(self.COLORS))
             screen.blit(rainbow_text,
                        (self.WINDOW_SIZE[0] - 200, 60))
             
         if self.slow_motion:
-            slow_text = self.hud_font.render(
-                f"Slow Motion: {self.slow_timer//60}s",
-                True, (0, 255, 255))
+            slow_text = text_cache.render(
+                self.hud_font, f"Slow Motion: {self.slow_timer//60}s",
+                (0, 255, 255))
             screen.blit(slow_text,
                        (self.WINDOW_SIZE[0] - 200, 90))
             
+    def update(self):
+        """Advance one fixed simulation step while playing"""
+        # Move player
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT]:
+            self.player_x = max(self.player_width//2,
+                              self.player_x - 5)
+        if keys[pygame.K_RIGHT]:
+            self.player_x = min(self.WINDOW_SIZE[0] - self.player_width//2,
+                              self.player_x + 5)
+            
+        # Spawn targets
+        self.spawn_timer += 1
+        if self.spawn_timer >= 60:
+            self.spawn_target()
+            self.spawn_power_up()
+            self.spawn_timer = 0
+            
+        # Update projectiles, swap-removing from the back
+        projectiles = self.projectiles
+        for index in range(len(projectiles) - 1, -1, -1):
+            projectile = projectiles[index]
+            projectile.update()
+            if projectile.y < -10:
+                self.projectile_grid.remove(projectile)
+                self.projectile_pool.release_at(index)
+                self.combo = 0
+            else:
+                self.projectile_grid.update(projectile, projectile.x,
+                                            projectile.y)
+                
+        # Update targets
+        targets = self.targets
+        for index in range(len(targets) - 1, -1, -1):
+            target = targets[index]
+            if target.update(self.WINDOW_SIZE[0], self.WINDOW_SIZE[1]):
+                self.target_grid.remove(target)
+                self.target_pool.release_at(index)
+            elif target.y > self.WINDOW_SIZE[1]:
+                self.target_grid.remove(target)
+                self.target_pool.release_at(index)
+                self.combo = 0
+                if self.score > 0:
+                    self.score -= 10
+            else:
+                self.target_grid.update(target, target.x, target.y,
+                                        target.size)
+                    
+        # Update power-ups
+        self.update_power_ups()
+        
+        # Update power-up timers
+        if self.rainbow_timer > 0:
+            self.rainbow_timer -= 1
+            if self.rainbow_timer == 0:
+                self.rainbow_shot = False
+                
+        if self.slow_timer > 0:
+            self.slow_timer -= 1
+            if self.slow_timer == 0:
+                self.slow_motion = False
+                
+        # Check collisions: each projectile against the targets whose
+        # circle contains it, found through the grids
+        # Pairs come back in firing order, so combos build up as before
+        hits = self.target_grid.pairs(self.projectile_grid)
+        if hits:
+            for projectile, targets in hits.items():
+                # Overlapping targets: the earliest spawned wins
+                target = min(targets, key=attrgetter('serial'))
+                self.projectile_grid.remove(projectile)
+                if (self.rainbow_shot or
+                    projectile.color == target.color):
+                    # Hit with correct color
+                    target.hit = True
+                    self.score += 10 * (self.combo + 1)
+                    self.combo += 1
+                    self.shots_hit += 1
+                    self.particle_system.create_hit_burst(
+                        target.x, target.y, target.color)
+                    
+                    # Show combo text
+                    if self.combo > 1:
+                        self.combo_text = f"Combo x{self.combo}!"
+                        self.combo_timer = 60
+                else:
+                    # Hit with wrong color
+                    self.combo = 0
+            self.projectile_pool.release_if(hits.__contains__)
+                    
+        # Update particles
+        self.particle_system.update()
+        
+        # Create background particles
+        if random.random() < 0.1:
+            self.particle_system.create_background_particle(
+                self.WINDOW_SIZE[0], self.WINDOW_SIZE[1])
+            
+        # Update level
+        self.level = min(3, 1 + self.score // 200)
+        
+        # Fade combo text
+        if self.combo_timer > 0:
+            self.combo_timer -= 1
+            
     def run(self, screen):
-        clock = pygame.time.Clock()
+        clock = GameClock(self.FPS)
         self.reset_game()
+        clock.reset()
         running = True
         
         while running:
@@ -441,16 +620,13 @@ class ColorMatchShooter:
                             self.game_state = self.STATE_PLAYING
                         elif self.game_state == self.STATE_PLAYING:
                             # Shoot projectile
-                            self.projectiles.append(
-                                Projectile(self.player_x,
-                                         self.WINDOW_SIZE[1] - 60,
-                                         self.COLORS[self.current_color_index])
-                            )
-                            self.shots_fired += 1
+                            self.fire_projectile()
                     elif event.key == pygame.K_r and \
                          self.game_state == self.STATE_GAME_OVER:
+                        self.record_run()
                         self.reset_game()
                         self.game_state = self.STATE_PLAYING
+                        clock.reset()
                     elif self.game_state == self.STATE_PLAYING:
                         # Color selection
                         if event.key in [pygame.K_1, pygame.K_2,
@@ -459,91 +635,13 @@ class ColorMatchShooter:
                             if self.current_color_index >= len(self.COLORS):
                                 self.current_color_index = 0
             
-            if self.game_state == self.STATE_PLAYING:
-                # Move player
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_LEFT]:
-                    self.player_x = max(self.player_width//2,
-                                      self.player_x - 5)
-                if keys[pygame.K_RIGHT]:
-                    self.player_x = min(self.WINDOW_SIZE[0] - self.player_width//2,
-                                      self.player_x + 5)
-                    
-                # Spawn targets
-                self.spawn_timer += 1
-                if self.spawn_timer >= 60:
-                    self.spawn_target()
-                    self.spawn_power_up()
-                    self.spawn_timer = 0
-                    
-                # Update projectiles
-                for projectile in self.projectiles[:]:
-                    projectile.update()
-                    if projectile.y < -10:
-                        self.projectiles.remove(projectile)
-                        self.combo = 0
-                        
-                # Update targets
-                for target in self.targets[:]:
-                    if target.update(self.WINDOW_SIZE[0], self.WINDOW_SIZE[1]):
-                        self.targets.remove(target)
-                    elif target.y > self.WINDOW_SIZE[1]:
-                        self.targets.remove(target)
-                        self.combo = 0
-                        if self.score > 0:
-                            self.score -= 10
-                            
-                # Update power-ups
-                self.update_power_ups()
-                
-                # Update power-up timers
-                if self.rainbow_timer > 0:
-                    self.rainbow_timer -= 1
-                    if self.rainbow_timer == 0:
-                        self.rainbow_shot = False
-                        
-                if self.slow_timer > 0:
-                    self.slow_timer -= 1
-                    if self.slow_timer == 0:
-                        self.slow_motion = False
-                        
-                # Check collisions
-                for projectile in self.projectiles[:]:
-                    for target in self.targets[:]:
-                        dx = target.x - projectile.x
-                        dy = target.y - projectile.y
-                        if math.sqrt(dx*dx + dy*dy) < target.size:
-                            if (self.rainbow_shot or
-                                projectile.color == target.color):
-                                # Hit with correct color
-                                target.hit = True
-                                self.projectiles.remove(projectile)
-                                self.score += 10 * (self.combo + 1)
-                                self.combo += 1
-                                self.shots_hit += 1
-                                self.particle_system.create_hit_burst(
-                                    target.x, target.y, target.color)
-                                
-                                # Show combo text
-                                if self.combo > 1:
-                                    self.combo_text = f"Combo x{self.combo}!"
-                                    self.combo_timer = 60
-                            else:
-                                # Hit with wrong color
-                                self.combo = 0
-                                self.projectiles.remove(projectile)
-                            break
-                            
-                # Update particles
-                self.particle_system.update()
-                
-                # Create background particles
-                if random.random() < 0.1:
-                    self.particle_system.create_background_particle(
-                        self.WINDOW_SIZE[0], self.WINDOW_SIZE[1])
-                    
-                # Update level
-                self.level = min(3, 1 + self.score // 200)
+            # Slow motion slows the simulation, rendering stays at full rate
+            clock.time_scale = 0.5 if self.slow_motion else 1.0
+            
+            # Advance the game in fixed steps
+            for _ in range(clock.tick()):
+                if self.game_state == self.STATE_PLAYING:
+                    self.update()
                 
             # Draw everything
             screen.fill(self.BLACK)
@@ -559,8 +657,7 @@ class ColorMatchShooter:
                     target.draw(screen)
                     
                 # Draw projectiles
-                for projectile in self.projectiles:
-                    projectile.draw(screen)
+                self.draw_projectiles(screen)
                     
                 # Draw power-ups
                 self.draw_power_ups(screen)
@@ -581,25 +678,19 @@ class ColorMatchShooter:
                 
                 # Draw combo text
                 if self.combo_text and self.combo_timer > 0:
-                    combo_surface = self.menu_font.render(
-                        self.combo_text, True, self.WHITE)
                     alpha = min(255, self.combo_timer * 4)
-                    combo_surface.set_alpha(alpha)
+                    combo_surface = text_cache.render(
+                        self.menu_font, self.combo_text, self.WHITE,
+                        alpha=alpha)
                     combo_rect = combo_surface.get_rect(
                         center=(self.WINDOW_SIZE[0]//2,
                                self.WINDOW_SIZE[1]//2))
                     screen.blit(combo_surface, combo_rect)
-                    self.combo_timer -= 1
                     
             elif self.game_state == self.STATE_GAME_OVER:
                 self.draw_game_over(screen)
                 
             pygame.display.flip()
             
-            # Control game speed
-            if self.slow_motion:
-                clock.tick(self.FPS // 2)
-            else:
-                clock.tick(self.FPS)
-            
+        self.record_run()
         return True  # Return to main menu
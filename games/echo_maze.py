@@ -2,11 +2,31 @@ import pygame
 import random
 import math
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import os
+from .maze_grid import (cut_cells, distance_field, farthest_cell, flood_fill,
+                        relax_distances, wavefront)
+from .maze_entities import EntityGrid
+from .maze_fov import ShadowCaster, stencil_window
+from .maze_pack import LibraryWriter, MazeLibrary, PackedMaze
+from .maze_route import DStarLite, RouteCache
+from .maze_stream import MazeChunk, StreamingMaze
+from .maze_worker import (DIFFICULTIES, MazeLayout, MazePregenerator,
+                          build_layout, graded_layout)
+from utils.game_clock import GameClock
+from utils.glow_cache import glow_cache
+from utils.object_pool import ObjectPool
+from utils.score_store import score_store
+from utils.surface_factory import surface_factory
+from utils.text_cache import text_cache
 
 class Collectible:
+    __slots__ = ('x', 'y', 'type', 'collected', 'glow_radius', 'pulse')
+    
     def __init__(self, x: int, y: int, type: str):
+        self.reset(x, y, type)
+        
+    def reset(self, x: int, y: int, type: str):
         self.x = x
         self.y = y
         self.type = type
@@ -17,17 +37,15 @@ class Collectible:
     def update(self):
         self.pulse = (math.sin(pygame.time.get_ticks() * 0.003) + 1) * 0.5
         
-    def draw(self, screen, cell_size: int, visible: bool):
+    def draw(self, screen, cell_size: int, visible: bool, offset: int = 0):
         if self.collected:
             return
             
         if visible or self.type in ['key', 'treasure']:
             x = self.x * cell_size + cell_size // 2
-            y = self.y * cell_size + cell_size // 2
+            y = self.y * cell_size + cell_size // 2 - offset
             
             # Draw glow effect
-            glow_surface = pygame.Surface((cell_size * 2, cell_size * 2), 
-                                        pygame.SRCALPHA)
             glow_radius = int(cell_size * (0.5 + self.pulse * 0.2))
             
             if self.type == 'coin':
@@ -37,10 +55,9 @@ class Collectible:
             else:  # treasure
                 color = (255, 100, 100, 100)  # Red
                 
-            pygame.draw.circle(glow_surface, color, 
-                             (cell_size, cell_size), glow_radius)
+            glow_surface = glow_cache.get('circle', glow_radius, color)
             screen.blit(glow_surface, 
-                       (x - cell_size, y - cell_size))
+                       (x - glow_radius, y - glow_radius))
             
             # Draw item
             if self.type == 'coin':
@@ -57,7 +74,12 @@ class Collectible:
                 pygame.draw.rect(screen, (255, 215, 0), chest_rect, 2)
 
 class Trap:
+    __slots__ = ('x', 'y', 'type', 'active', 'animation')
+    
     def __init__(self, x: int, y: int, type: str):
+        self.reset(x, y, type)
+        
+    def reset(self, x: int, y: int, type: str):
         self.x = x
         self.y = y
         self.type = type
@@ -67,12 +89,12 @@ class Trap:
     def update(self):
         self.animation = (self.animation + 0.1) % (2 * math.pi)
         
-    def draw(self, screen, cell_size: int, visible: bool):
+    def draw(self, screen, cell_size: int, visible: bool, offset: int = 0):
         if not visible:
             return
             
         x = self.x * cell_size + cell_size // 2
-        y = self.y * cell_size + cell_size // 2
+        y = self.y * cell_size + cell_size // 2 - offset
         
         if self.type == 'spikes':
             # Draw spikes
@@ -90,6 +112,62 @@ class Trap:
             pygame.draw.circle(screen, (20, 20, 20), (x, y), 
                              cell_size//3, 2)
 
+class MazeLayer:
+    """A maze grid rendered once lit and once dimmed, fogged per cell.
+    
+    `surface` holds each cell from the lit layer if visible, the dimmed
+    layer if only visited, and black otherwise. update() recomposites
+    only the bounding box of the cells whose fog state changed.
+    """
+    
+    def __init__(self, maze: PackedMaze, cell_size: int,
+                 wall_color: Tuple[int, int, int],
+                 path_color: Tuple[int, int, int]):
+        self.cell_size = cell_size
+        height, width = maze.shape
+        size = (width * cell_size, height * cell_size)
+        self.lit = surface_factory.create(size)
+        self.dim = surface_factory.create(size)
+        for layer, dim in ((self.lit, False), (self.dim, True)):
+            wall = tuple(c // 3 for c in wall_color) if dim else wall_color
+            edge = tuple(min(255, c + 50) for c in wall)
+            floor = tuple(c // 3 for c in path_color) if dim else path_color
+            layer.fill(floor)
+            for y, x in np.argwhere(maze.unpack() == 1).tolist():
+                rect = pygame.Rect(x * cell_size, y * cell_size,
+                                   cell_size, cell_size)
+                pygame.draw.rect(layer, wall, rect)
+                pygame.draw.rect(layer, edge, rect, 1)
+                
+        self.surface = surface_factory.create(size)
+        self.surface.fill((0, 0, 0))
+        # Per cell: 0 unseen, 1 visited (dimmed), 2 visible
+        self.fog = np.zeros(maze.shape, dtype=np.uint8)
+        
+    def update(self, visible: np.ndarray, visited: np.ndarray):
+        fog = np.where(visible, 2, visited).astype(np.uint8)
+        changed = np.argwhere(fog != self.fog)
+        if not len(changed):
+            return
+        self.fog = fog
+        
+        # Composite the bounding box of the changed cells, pixel columns
+        # first as surfarray expects
+        (top, left), (bottom, right) = changed.min(0), changed.max(0) + 1
+        size = self.cell_size
+        cells = fog[top:bottom, left:right].T
+        mask = np.repeat(np.repeat(cells, size, 0), size, 1)
+        region = (slice(left * size, right * size),
+                  slice(top * size, bottom * size))
+        view = pygame.surfarray.pixels2d(self.surface)
+        lit = pygame.surfarray.pixels2d(self.lit)
+        dim = pygame.surfarray.pixels2d(self.dim)
+        view[region] = np.where(mask == 2, lit[region],
+                                np.where(mask == 1, dim[region],
+                                         self.surface.map_rgb((0, 0, 0))))
+        # Unlock the surfaces before they are blitted
+        del view, lit, dim
+
 class EchoMaze:
     def __init__(self):
         self.WINDOW_SIZE = (800, 600)
@@ -105,6 +183,36 @@ class EchoMaze:
         self.PATH_COLOR = (50, 50, 50)
         self.RUNE_COLOR = (0, 255, 255)
         
+        # Visibility mode: False lights a circle around the player, True
+        # casts shadows so walls block line of sight
+        self.LINE_OF_SIGHT = False
+        
+        # An echo ping spreads this many steps along the corridors,
+        # advancing one step every few frames
+        self.ECHO_RANGE = 20
+        self.ECHO_FRAMES_PER_STEP = 2
+        
+        # Endless mode streams the maze in chunks of this many cell rows,
+        # each holding a few coins and traps
+        self.CHUNK_CELL_ROWS = 8
+        self.COINS_PER_CHUNK = 3
+        self.TRAPS_PER_CHUNK = 2
+        
+        # Items per maze, and the maze difficulty picked on the menu
+        self.TOTAL_KEYS = 3
+        self.TOTAL_COINS = 10
+        self.NUM_TRAPS = 5 + self.GRID_WIDTH // 4
+        self.difficulty = 'normal'
+        
+        # The last few finished mazes are kept on disk, so a maze number
+        # replays the same maze even if generation changes
+        self.LIBRARY_PATH = 'echo_mazes.emzl'
+        self.LIBRARY_SIZE = 32
+        self.library: Optional[MazeLibrary] = None
+        self.library_writer = LibraryWriter(self.LIBRARY_PATH,
+                                            self.LIBRARY_SIZE)
+        self.library_version = 0  # Writer version the library was opened at
+        
         # Game states
         self.STATE_MENU = 'menu'
         self.STATE_PLAYING = 'playing'
@@ -112,240 +220,341 @@ class EchoMaze:
         self.STATE_WIN = 'win'
         
         # Load fonts
-        self.title_font = pygame.font.Font(None, 74)
-        self.menu_font = pygame.font.Font(None, 36)
-        self.hud_font = pygame.font.Font(None, 24)
-        
-        # Initialize game
-        self.reset_game()
-        
-    def reset_game(self):
+        self.title_font = text_cache.get_font(74)
+        self.menu_font = text_cache.get_font(36)
+        self.hud_font = text_cache.get_font(24)
+        
+        # Faded rune squares, one per size
+        self.rune_sprites: Dict[int, pygame.Surface] = {}
+        
+        # Items are recycled between mazes
+        self.collectible_pool = ObjectPool(Collectible)
+        self.trap_pool = ObjectPool(Trap)
+        
+        # Items and traps by cell; keys and the treasure show through fog
+        self.entities = EntityGrid(beacons=('key', 'treasure'))
+        
+        # Hint routes, one incremental search per target. The autopilot
+        # walks the same route and stays on across restarts.
+        self.routes = RouteCache()
+        self.autopilot = False
+        
+        # Mazes are built ahead in a worker process, started with the
+        # first maze; until it has one ready, reset_game() builds its own.
+        # run() sets up the first game.
+        self.pregenerator = MazePregenerator(
+            self.GRID_WIDTH, self.GRID_HEIGHT, self.TOTAL_KEYS,
+            self.TOTAL_COINS, self.NUM_TRAPS)
+        
+    def reset_game(self, seed: Optional[int] = None):
+        """Start over on a new maze, or replay the maze of `seed`"""
+        self.start_layout(self.next_layout(seed))
+        
+    def start_layout(self, layout: MazeLayout):
+        """Start over on `layout` with its collectibles and traps"""
+        self.reset_state()
+        self.layout = layout
+        self.maze, self.seed = layout.maze, layout.seed
+        self.grade = layout.grade
+        for x, y, kind in layout.collectibles:
+            self.entities.add_collectible(
+                self.collectible_pool.acquire(x, y, kind))
+        for x, y, kind in layout.traps:
+            self.entities.add_trap(self.trap_pool.acquire(x, y, kind))
+        
+        # Views and layers belong to one maze
+        self.shadow_caster = ShadowCaster(self.maze)
+        self.maze_layer = MazeLayer(self.maze, self.CELL_SIZE,
+                                    self.WALL_COLOR, self.PATH_COLOR)
+        
+    def reset_state(self):
+        """Clear the player, items and timers shared by both modes"""
         self.game_state = self.STATE_MENU
-        self.maze = self.generate_maze()
+        self.endless = False
+        self.world = None
+        self.depth = 0
+        self.camera_y = 0.0
         self.player_pos = [1, 1]
         self.visited = np.zeros((self.GRID_HEIGHT, self.GRID_WIDTH), dtype=bool)
         self.visible = np.zeros((self.GRID_HEIGHT, self.GRID_WIDTH), dtype=bool)
-        self.collectibles: List[Collectible] = []
-        self.traps: List[Trap] = []
+        self.view = None  # (x, y, radius, echo step) the cells were lit from
+        self.view_window = (slice(0, 0), slice(0, 0))
+        self.collectible_pool.release_all()
+        self.trap_pool.release_all()
+        self.entities.clear()
         self.keys_collected = 0
-        self.total_keys = 3
+        self.total_keys = self.TOTAL_KEYS
         self.coins_collected = 0
-        self.total_coins = 10
+        self.total_coins = self.TOTAL_COINS
         self.time_left = 180 * self.FPS  # 3 minutes
         self.echo_timer = 0
         self.echo_cooldown = 60  # 1 second
         self.echo_radius = 5
+        self.echo_arrival: Optional[np.ndarray] = None
+        self.echo_top = 0  # World row of the first row of echo_arrival
         self.heartbeat = 0
         self.footstep_timer = 0
         self.rune_animations: List[Dict] = []
-        
-        # Place collectibles and traps
-        self.place_items()
-        
-    def is_path_available(self, maze: np.ndarray, start: Tuple[int, int], 
-                         end: Tuple[int, int]) -> bool:
-        """Check if there's a path between start and end points using BFS."""
-        if maze[start[1]][start[0]] == 1 or maze[end[1]][end[0]] == 1:
-            return False
+        self.routes.clear()
+        self.route: List[Tuple[int, int]] = []
+        
+    def start_endless(self):
+        """Set up an endless descent through a streamed maze"""
+        self.reset_state()
+        self.endless = True
+        self.world = StreamingMaze(self.GRID_WIDTH, self.CHUNK_CELL_ROWS,
+                                   populate=self.populate_chunk,
+                                   release=self.release_chunk)
+        self.time_left = 60 * self.FPS
+        # Line-of-sight casters over three chunks, keyed by the first
+        self.band_casters: Dict[int, ShadowCaster] = {}
+        self.lit_chunks: List[MazeChunk] = []
+        
+    def populate_chunk(self, chunk: MazeChunk, rng: random.Random):
+        """Spread coins through a new chunk and set traps off its path"""
+        maze = chunk.maze
+        available = flood_fill(maze, chunk.entrance)
+        for x, y in (chunk.entrance, chunk.exit):
+            available[y, x] = False
+        # The opening into the chunk above is the only way in
+        available[0] = False
             
-        visited = set()
-        queue = [(start[0], start[1])]
-        visited.add((start[0], start[1]))
-        
-        while queue:
-            x, y = queue.pop(0)
-            if (x, y) == end:
-                return True
-                
-            # Check all four directions
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.GRID_WIDTH and 
-                    0 <= new_y < self.GRID_HEIGHT and 
-                    maze[new_y][new_x] == 0 and 
-                    (new_x, new_y) not in visited):
-                    queue.append((new_x, new_y))
-                    visited.add((new_x, new_y))
-        
-        return False
-
-    def generate_maze(self) -> np.ndarray:
-        while True:
-            # Initialize maze with walls
-            maze = np.ones((self.GRID_HEIGHT, self.GRID_WIDTH), dtype=int)
-            
-            def carve_path(x: int, y: int):
-                maze[y][x] = 0
-                directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-                random.shuffle(directions)
-                
-                for dx, dy in directions:
-                    new_x, new_y = x + dx, y + dy
-                    if (0 <= new_x < self.GRID_WIDTH and 
-                        0 <= new_y < self.GRID_HEIGHT and 
-                        maze[new_y][new_x] == 1):
-                        maze[y + dy//2][x + dx//2] = 0
-                        carve_path(new_x, new_y)
-            
-            # Start from the entrance
-            start_x, start_y = 1, 1
-            carve_path(start_x, start_y)
-            
-            # Verify maze connectivity
-            # Count accessible cells
-            accessible = 0
-            for y in range(self.GRID_HEIGHT):
-                for x in range(self.GRID_WIDTH):
-                    if maze[y][x] == 0:
-                        if self.is_path_available(maze, (1, 1), (x, y)):
-                            accessible += 1
-            
-            # Calculate total paths
-            total_paths = np.sum(maze == 0)
-            
-            # If at least 90% of paths are accessible, use this maze
-            if accessible >= total_paths * 0.9:
-                return maze
-        
-    def place_items(self):
-        # Get all accessible positions
-        accessible_positions = []
-        for y in range(self.GRID_HEIGHT):
-            for x in range(self.GRID_WIDTH):
-                if (self.maze[y][x] == 0 and 
-                    self.is_path_available(self.maze, (1, 1), (x, y))):
-                    accessible_positions.append((x, y))
-        
-        if len(accessible_positions) < (self.total_keys + self.total_coins + 1):
-            # Not enough accessible positions, regenerate maze
-            self.maze = self.generate_maze()
-            self.place_items()
-            return
+        coin_positions = []
+        nearest = distance_field(maze, [chunk.entrance, chunk.exit])
+        for _ in range(self.COINS_PER_CHUNK):
+            pos = farthest_cell(nearest, available)
+            if pos is None:
+                break
+            coin_positions.append(pos)
+            available[pos[1], pos[0]] = False
+            relax_distances(maze, nearest, pos)
+            coin = self.collectible_pool.acquire(pos[0], chunk.top + pos[1],
+                                                 'coin')
+            # Coins taken on an earlier visit stay taken
+            coin.collected = len(chunk.collectibles) in chunk.collected
+            chunk.collectibles.append(coin)
+            self.entities.add_collectible(coin)
             
-        # Remove starting position from available positions
-        if (1, 1) in accessible_positions:
-            accessible_positions.remove((1, 1))
-            
-        # Place keys in increasing distance from start
-        key_positions = []
-        remaining_positions = accessible_positions.copy()
-        for _ in range(self.total_keys):
-            # Find position with good spacing from previous keys
-            best_pos = None
-            best_score = -1
-            
-            for pos in remaining_positions:
-                # Calculate minimum distance to existing keys
-                min_key_dist = float('inf')
-                if key_positions:
-                    for key_pos in key_positions:
-                        dist = abs(pos[0] - key_pos[0]) + abs(pos[1] - key_pos[1])
-                        min_key_dist = min(min_key_dist, dist)
-                else:
-                    min_key_dist = abs(pos[0] - 1) + abs(pos[1] - 1)  # Distance from start
-                
-                # Score based on distance from start and other keys
-                score = min_key_dist
-                
-                if score > best_score:
-                    best_score = score
-                    best_pos = pos
+        # Chunks are perfect mazes, so traps kept off the critical cells
+        # can never combine to cut the way down
+        critical, _ = cut_cells(maze, chunk.entrance,
+                                coin_positions + [chunk.exit])
+        candidates = [(x, y) for y, x in
+                      np.argwhere(available & ~critical).tolist()]
+        for x, y in rng.sample(candidates,
+                               min(self.TRAPS_PER_CHUNK, len(candidates))):
+            trap = self.trap_pool.acquire(x, chunk.top + y,
+                                          rng.choice(['spikes', 'pit']))
+            chunk.traps.append(trap)
+            self.entities.add_trap(trap)
             
-            if best_pos:
-                key_positions.append(best_pos)
-                remaining_positions.remove(best_pos)
-                self.collectibles.append(Collectible(best_pos[0], best_pos[1], 'key'))
+    def release_chunk(self, chunk: MazeChunk):
+        for entity in chunk.collectibles + chunk.traps:
+            self.entities.discard(entity)
+        collectibles = set(chunk.collectibles)
+        self.collectible_pool.release_if(collectibles.__contains__)
+        traps = set(chunk.traps)
+        self.trap_pool.release_if(traps.__contains__)
+        
+    def is_open(self, x: int, y: int) -> bool:
+        if self.endless:
+            return self.world.is_open(x, y)
+        return self.maze[y, x] == 0
+        
+    def update_camera(self):
+        # Ease towards keeping the player vertically centered
+        target = (self.player_pos[1] * self.CELL_SIZE + self.CELL_SIZE // 2 -
+                  self.WINDOW_SIZE[1] // 2)
+        self.camera_y += (max(0, target) - self.camera_y) * 0.2
+        
+    def hint_route(self) -> List[Tuple[int, int]]:
+        """Shortest route from the player to the next goal, or empty.
+
+        The goal is the nearest uncollected key, then the treasure. In
+        endless mode it is the way down out of the player's chunk. Traps
+        count as walls.
+        """
+        x, y = self.player_pos
+        if self.endless:
+            chunk = self.world.chunk_at(y)
+            if (x, y - chunk.top) == chunk.exit:
+                return [(x, y), (x, y + 1)]
+            traps = [(trap.x, trap.y - chunk.top) for trap in chunk.traps]
+            planner = self.routes.get(
+                ('chunk', chunk.index),
+                lambda: DStarLite(chunk.maze, chunk.exit, traps))
+            return [(route_x, route_y + chunk.top) for route_x, route_y in
+                    planner.route((x, y - chunk.top))]
             
-        # Place coins along paths between keys
-        coin_positions = []
-        for _ in range(self.total_coins):
-            if not remaining_positions:
-                break
-                
-            # Find position with good distribution
-            best_pos = None
-            best_score = -1
-            
-            for pos in remaining_positions:
-                # Calculate distances to keys and other coins
-                min_key_dist = float('inf')
-                min_coin_dist = float('inf')
-                
-                for key_pos in key_positions:
-                    dist = abs(pos[0] - key_pos[0]) + abs(pos[1] - key_pos[1])
-                    min_key_dist = min(min_key_dist, dist)
-                    
-                for coin_pos in coin_positions:
-                    dist = abs(pos[0] - coin_pos[0]) + abs(pos[1] - coin_pos[1])
-                    min_coin_dist = min(min_coin_dist, dist)
-                
-                # Score based on balanced distribution
-                score = min(min_key_dist, min_coin_dist if coin_positions else float('inf'))
-                
-                if score > best_score:
-                    best_score = score
-                    best_pos = pos
-            
-            if best_pos:
-                coin_positions.append(best_pos)
-                remaining_positions.remove(best_pos)
-                self.collectibles.append(Collectible(best_pos[0], best_pos[1], 'coin'))
-        
-        # Place treasure at the furthest accessible point from start
-        if remaining_positions:
-            treasure_pos = max(remaining_positions,
-                             key=lambda p: abs(p[0] - 1) + abs(p[1] - 1))
-            self.collectibles.append(
-                Collectible(treasure_pos[0], treasure_pos[1], 'treasure'))
-            remaining_positions.remove(treasure_pos)
-        
-        # Place traps avoiding blocking paths
-        num_traps = min(5 + self.GRID_WIDTH // 4, len(remaining_positions))
-        for _ in range(num_traps):
-            if not remaining_positions:
-                break
-                
-            # Find position that doesn't block critical paths
-            valid_positions = []
-            for pos in remaining_positions:
-                # Temporarily place trap
-                self.maze[pos[1]][pos[0]] = 1
-                
-                # Check if all collectibles are still accessible
-                all_accessible = True
-                for collectible in self.collectibles:
-                    if not collectible.collected and not self.is_path_available(
-                        self.maze, (1, 1), (collectible.x, collectible.y)):
-                        all_accessible = False
-                        break
-                
-                # Remove temporary trap
-                self.maze[pos[1]][pos[0]] = 0
-                
-                if all_accessible:
-                    valid_positions.append(pos)
-            
-            if valid_positions:
-                trap_pos = random.choice(valid_positions)
-                remaining_positions.remove(trap_pos)
-                trap_type = random.choice(['spikes', 'pit'])
-                self.traps.append(Trap(trap_pos[0], trap_pos[1], trap_type))
-                    
+        collectibles = self.entities.collectibles
+        targets = [cell for cell, collectible in collectibles.items()
+                   if collectible.type == 'key']
+        if not targets:
+            targets = [cell for cell, collectible in collectibles.items()
+                       if collectible.type == 'treasure']
+        best: List[Tuple[int, int]] = []
+        for target in targets:
+            planner = self.routes.get(target, lambda: DStarLite(
+                self.maze, target, self.entities.traps))
+            route = planner.route((x, y))
+            if route and (not best or len(route) < len(best)):
+                best = route
+        return best
+        
+    def next_layout(self, seed: Optional[int] = None) -> MazeLayout:
+        """A maze of the chosen difficulty, pre-generated if one is ready"""
+        if seed is not None:
+            library = self.open_library()
+            if library is not None and seed in library:
+                return graded_layout(seed, *library.load(seed))
+            return build_layout(self.GRID_WIDTH, self.GRID_HEIGHT,
+                                self.TOTAL_KEYS, self.TOTAL_COINS,
+                                self.NUM_TRAPS, seed)
+        self.pregenerator.start()
+        layout = self.pregenerator.take(self.difficulty)
+        if layout is None:
+            # Build one here, whatever its difficulty; the menu swaps it
+            # for a matching one once the worker has one ready
+            layout = build_layout(self.GRID_WIDTH, self.GRID_HEIGHT,
+                                  self.TOTAL_KEYS, self.TOTAL_COINS,
+                                  self.NUM_TRAPS)
+        return layout
+        
+    def match_difficulty(self):
+        """Swap the waiting maze for one of the chosen difficulty if ready"""
+        if self.endless or self.layout.difficulty == self.difficulty:
+            return
+        layout = self.pregenerator.take(self.difficulty)
+        if layout is not None:
+            self.start_layout(layout)
+        
+    def open_library(self) -> Optional[MazeLibrary]:
+        # Reopen after the writer has replaced the file
+        if self.library_version != self.library_writer.version:
+            self.library = None
+            self.library_version = self.library_writer.version
+        if self.library is None and os.path.exists(self.LIBRARY_PATH):
+            try:
+                self.library = MazeLibrary(self.LIBRARY_PATH)
+            except (OSError, ValueError):
+                # Unreadable or from another version; replaced on save
+                return None
+        return self.library
+        
+    def start_echo(self):
+        """Send a ping out from the player through the open corridors.
+
+        Arrival steps are found once here; the ping is then animated by
+        comparing them with how far it has travelled.
+        """
+        px, py = self.player_pos
+        if self.endless:
+            # The ping covers the player's chunk and those either side
+            first = max(0, self.world.chunk_at(py).index - 1)
+            self.echo_top = first * self.world.chunk_height
+            maze = self.world.rows(first, 3)
+        else:
+            self.echo_top = 0
+            maze = self.maze
+        self.echo_arrival = wavefront(maze, (px, py - self.echo_top),
+                                      self.ECHO_RANGE)
+        self.echo_timer = self.echo_cooldown
+        
+    def echo_step(self) -> Optional[int]:
+        """Steps the current ping has travelled, or None without one"""
+        if self.echo_arrival is None:
+            return None
+        return min(self.ECHO_RANGE, (self.echo_cooldown - self.echo_timer) //
+                   self.ECHO_FRAMES_PER_STEP)
+        
+    def add_echo(self, top: int, columns: slice, mask: np.ndarray,
+                 step: int) -> Tuple[int, slice, np.ndarray]:
+        """Widen a view window by the cells the ping has reached"""
+        echo = self.echo_arrival <= step
+        first = min(top, self.echo_top)
+        last = max(top + len(mask), self.echo_top + len(echo))
+        combined = np.zeros((last - first, self.GRID_WIDTH), dtype=bool)
+        combined[self.echo_top - first:self.echo_top - first + len(echo)] = \
+            echo
+        combined[top - first:top - first + len(mask), columns] |= mask
+        return first, slice(0, self.GRID_WIDTH), combined
+        
     def update_visibility(self):
-        self.visible.fill(False)
+        if self.endless:
+            self.update_endless_visibility()
+            return
+            
         px, py = self.player_pos
         
         # Update visited cells
         self.visited[py][px] = True
         
-        # Calculate visibility using distance from player
-        for y in range(max(0, py - self.echo_radius), 
-                      min(self.GRID_HEIGHT, py + self.echo_radius + 1)):
-            for x in range(max(0, px - self.echo_radius), 
-                         min(self.GRID_WIDTH, px + self.echo_radius + 1)):
-                dist = math.sqrt((x - px)**2 + (y - py)**2)
-                if dist <= self.echo_radius:
-                    self.visible[y][x] = True
+        # Visible cells only change when the player moves or the ping
+        # travels another step
+        step = self.echo_step()
+        view = (px, py, self.echo_radius, step)
+        if view == self.view:
+            return
+        self.view = view
+        
+        if self.LINE_OF_SIGHT:
+            window, mask = self.shadow_caster.view(px, py, self.echo_radius)
+        else:
+            window, mask = stencil_window(self.visible.shape, px, py,
+                                          self.echo_radius)
+        if step is not None:
+            top, columns, mask = self.add_echo(window[0].start, window[1],
+                                               mask, step)
+            window = (slice(top, top + len(mask)), columns)
+        self.visible[self.view_window] = False
+        self.visible[window] = mask
+        self.view_window = window
+        self.entities.set_view(window[0].start, window[1].start, mask)
+                    
+    def update_endless_visibility(self):
+        px, py = self.player_pos
+        chunk = self.world.chunk_at(py)
+        height = self.world.chunk_height
+        chunk.visited[py - chunk.top][px] = True
+        
+        step = self.echo_step()
+        view = (px, py, self.echo_radius, step)
+        if view == self.view:
+            return
+        self.view = view
+        
+        # Views are computed in world rows and split across chunks. A view
+        # never reaches past the chunks either side of the player's, nor
+        # does a ping.
+        if self.LINE_OF_SIGHT:
+            first = max(0, chunk.index - 1)
+            caster = self.band_casters.get(first)
+            if caster is None:
+                if len(self.band_casters) >= 4:
+                    self.band_casters.clear()
+                caster = ShadowCaster(self.world.rows(first, 3))
+                self.band_casters[first] = caster
+            (rows, columns), mask = caster.view(px, py - first * height,
+                                                self.echo_radius)
+            top = rows.start + first * height
+        else:
+            (rows, columns), mask = stencil_window(
+                (py + self.echo_radius + 1, self.GRID_WIDTH), px, py,
+                self.echo_radius)
+            top = rows.start
+        if step is not None:
+            top, columns, mask = self.add_echo(top, columns, mask, step)
+        bottom = top + len(mask)
+        
+        for lit in self.lit_chunks:
+            lit.visible[:] = False
+        self.lit_chunks = self.world.chunks_between(top, bottom - 1)
+        for lit in self.lit_chunks:
+            start = max(top, lit.top)
+            stop = min(bottom, lit.top + height)
+            lit.visible[start - lit.top:stop - lit.top, columns] = \
+                mask[start - top:stop - top]
+        self.entities.set_view(top, columns.start, mask)
                     
     def create_rune_animation(self, x: int, y: int):
         self.rune_animations.append({
@@ -364,14 +573,23 @@ class EchoMaze:
                 
     def draw_menu(self, screen):
         # Draw title
-        title = self.title_font.render("ECHO MAZE:", True, self.WHITE)
-        subtitle = self.title_font.render("The Forgotten Temple", True, 
-                                        self.RUNE_COLOR)
+        title = text_cache.render(self.title_font, "ECHO MAZE:", self.WHITE)
+        subtitle = text_cache.render(self.title_font, "The Forgotten Temple",
+                                     self.RUNE_COLOR)
         title_rect = title.get_rect(center=(self.WINDOW_SIZE[0]//2, 150))
         subtitle_rect = subtitle.get_rect(center=(self.WINDOW_SIZE[0]//2, 220))
         screen.blit(title, title_rect)
         screen.blit(subtitle, subtitle_rect)
         
+        # Draw maze difficulty
+        difficulty_text = text_cache.render(
+            self.hud_font,
+            f"Difficulty: {self.difficulty.title()} (1-3 to change)",
+            self.RUNE_COLOR)
+        difficulty_rect = difficulty_text.get_rect(
+            center=(self.WINDOW_SIZE[0]//2, 265))
+        screen.blit(difficulty_text, difficulty_rect)
+        
         # Draw intro text
         intro_text = [
             "You are deep within an ancient maze.",
@@ -380,7 +598,7 @@ class EchoMaze:
         ]
         
         for i, text in enumerate(intro_text):
-            text_surface = self.menu_font.render(text, True, self.WHITE)
+            text_surface = text_cache.render(self.menu_font, text, self.WHITE)
             text_rect = text_surface.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 300 + i*40))
             screen.blit(text_surface, text_rect)
@@ -390,96 +608,195 @@ class EchoMaze:
             "Controls:",
             "Arrow keys/WASD: Move",
             "Space: Ping (Reveal surroundings)",
-            "M: Toggle map"
+            "H: Show route, P: Autopilot"
         ]
         
         for i, text in enumerate(controls):
-            text_surface = self.menu_font.render(text, True, self.WHITE)
+            text_surface = text_cache.render(self.menu_font, text, self.WHITE)
             text_rect = text_surface.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 420 + i*30))
             screen.blit(text_surface, text_rect)
             
         # Draw "Press Space to Start"
         if (pygame.time.get_ticks() // 500) % 2:
-            start_text = self.menu_font.render("Press SPACE to Start", 
-                                             True, self.RUNE_COLOR)
+            start_text = text_cache.render(self.menu_font,
+                                           "Press SPACE to Start, "
+                                           "E for Endless",
+                                           self.RUNE_COLOR)
             start_rect = start_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 550))
             screen.blit(start_text, start_rect)
             
+    def stats_lines(self) -> List[str]:
+        if self.endless:
+            return [
+                f"Depth Reached: {self.depth}",
+                f"Coins Collected: {self.coins_collected}",
+                f"Time Remaining: {max(0, self.time_left) // self.FPS}s"
+            ]
+        return [
+            f"Keys Collected: {self.keys_collected}/{self.total_keys}",
+            f"Coins Collected: {self.coins_collected}/{self.total_coins}",
+            f"Time Remaining: {self.time_left // self.FPS}s",
+            f"Maze #{self.seed}"
+        ]
+        
     def draw_game_over(self, screen):
         # Draw "Game Over"
-        game_over = self.title_font.render("GAME OVER", True, self.WHITE)
+        game_over = text_cache.render(self.title_font, "GAME OVER", self.WHITE)
         game_over_rect = game_over.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 200))
         screen.blit(game_over, game_over_rect)
         
         # Draw stats
-        stats = [
-            f"Keys Collected: {self.keys_collected}/{self.total_keys}",
-            f"Coins Collected: {self.coins_collected}/{self.total_coins}",
-            f"Time Remaining: {self.time_left // self.FPS}s"
-        ]
-        
-        for i, text in enumerate(stats):
-            text_surface = self.menu_font.render(text, True, self.WHITE)
+        for i, text in enumerate(self.stats_lines()):
+            text_surface = text_cache.render(self.menu_font, text, self.WHITE)
             text_rect = text_surface.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 300 + i*40))
             screen.blit(text_surface, text_rect)
             
         # Draw restart instructions
         if (pygame.time.get_ticks() // 500) % 2:
-            restart_text = self.menu_font.render(
-                "Press R to Retry or ESC to Exit", True, self.WHITE)
+            restart_text = text_cache.render(
+                self.menu_font, "Press R to Retry or ESC to Exit", self.WHITE)
             restart_rect = restart_text.get_rect(
-                center=(self.WINDOW_SIZE[0]//2, 450))
+                center=(self.WINDOW_SIZE[0]//2, 470))
             screen.blit(restart_text, restart_rect)
+            self.draw_new_maze_hint(screen)
             
     def draw_win_screen(self, screen):
         # Draw "Victory!"
-        win_text = self.title_font.render("VICTORY!", True, self.RUNE_COLOR)
+        win_text = text_cache.render(self.title_font, "VICTORY!",
+                                     self.RUNE_COLOR)
         win_rect = win_text.get_rect(center=(self.WINDOW_SIZE[0]//2, 200))
         screen.blit(win_text, win_rect)
         
         # Draw stats
-        stats = [
-            f"Keys Collected: {self.keys_collected}/{self.total_keys}",
-            f"Coins Collected: {self.coins_collected}/{self.total_coins}",
-            f"Time Remaining: {self.time_left // self.FPS}s"
-        ]
-        
-        for i, text in enumerate(stats):
-            text_surface = self.menu_font.render(text, True, self.WHITE)
+        for i, text in enumerate(self.stats_lines()):
+            text_surface = text_cache.render(self.menu_font, text, self.WHITE)
             text_rect = text_surface.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 300 + i*40))
             screen.blit(text_surface, text_rect)
             
         # Draw restart instructions
         if (pygame.time.get_ticks() // 500) % 2:
-            restart_text = self.menu_font.render(
-                "Press R to Play Again or ESC to Exit", True, self.WHITE)
+            restart_text = text_cache.render(
+                self.menu_font, "Press R to Play Again or ESC to Exit",
+                self.WHITE)
             restart_rect = restart_text.get_rect(
-                center=(self.WINDOW_SIZE[0]//2, 450))
+                center=(self.WINDOW_SIZE[0]//2, 470))
             screen.blit(restart_text, restart_rect)
+            self.draw_new_maze_hint(screen)
+            
+    def draw_new_maze_hint(self, screen):
+        # R replays the same maze, so a new one needs its own key
+        if not self.endless:
+            new_text = text_cache.render(
+                self.menu_font, "Press N for a New Maze", self.WHITE)
+            new_rect = new_text.get_rect(
+                center=(self.WINDOW_SIZE[0]//2, 510))
+            screen.blit(new_text, new_rect)
             
+    def draw_maze(self, screen):
+        self.maze_layer.update(self.visible, self.visited)
+        screen.blit(self.maze_layer.surface, (0, 0))
+        
+    def draw_endless_maze(self, screen, offset: int):
+        """Draw the chunks under the camera"""
+        chunks = self.world.chunks_between(
+            offset // self.CELL_SIZE,
+            (offset + self.WINDOW_SIZE[1]) // self.CELL_SIZE)
+        for chunk in chunks:
+            # Layers are built as chunks come into view and dropped with them
+            if chunk.layer is None:
+                chunk.layer = MazeLayer(chunk.maze, self.CELL_SIZE,
+                                        self.WALL_COLOR, self.PATH_COLOR)
+            chunk.layer.update(chunk.visible, chunk.visited)
+            screen.blit(chunk.layer.surface,
+                        (0, chunk.top * self.CELL_SIZE - offset))
+        
+    def draw_world(self, screen):
+        offset = int(self.camera_y)
+        if self.endless:
+            self.draw_endless_maze(screen, offset)
+        else:
+            self.draw_maze(screen)
+            
+        # Draw hint route
+        for x, y in self.route[1:]:
+            pygame.draw.circle(screen, self.RUNE_COLOR,
+                               (x * self.CELL_SIZE + self.CELL_SIZE // 2,
+                                y * self.CELL_SIZE + self.CELL_SIZE // 2 -
+                                offset),
+                               self.CELL_SIZE // 8)
+            
+        # Draw rune animations
+        for anim in self.rune_animations:
+            size = int(self.CELL_SIZE * anim['size'])
+            if size <= 0:
+                continue
+            # One solid square per size, faded with surface alpha
+            if size not in self.rune_sprites:
+                sprite = surface_factory.create((size, size))
+                sprite.fill(self.RUNE_COLOR[:3])
+                self.rune_sprites[size] = sprite
+            sprite = self.rune_sprites[size]
+            sprite.set_alpha(anim['alpha'])
+            screen.blit(sprite,
+                      (anim['x'] * self.CELL_SIZE +
+                       self.CELL_SIZE//2 - size//2,
+                       anim['y'] * self.CELL_SIZE +
+                       self.CELL_SIZE//2 - size//2 - offset))
+            
+        # Draw collectibles and traps
+        for collectible in self.entities.shown_collectibles:
+            collectible.draw(screen, self.CELL_SIZE, True, offset)
+        for trap in self.entities.visible_traps:
+            trap.draw(screen, self.CELL_SIZE, True, offset)
+                
+        # Draw player
+        pygame.draw.circle(screen, self.RUNE_COLOR,
+                         (self.player_pos[0] * self.CELL_SIZE + 
+                          self.CELL_SIZE // 2,
+                          self.player_pos[1] * self.CELL_SIZE + 
+                          self.CELL_SIZE // 2 - offset),
+                         self.CELL_SIZE // 3)
+        
     def draw_hud(self, screen):
         # Draw time
-        time_text = self.hud_font.render(
-            f"Time: {self.time_left // self.FPS}s", True, self.WHITE)
+        time_text = text_cache.render(
+            self.hud_font, f"Time: {self.time_left // self.FPS}s", self.WHITE)
         screen.blit(time_text, (10, 10))
         
-        # Draw keys
-        key_text = self.hud_font.render(
-            f"Keys: {self.keys_collected}/{self.total_keys}", True, 
-            (0, 255, 255))
-        screen.blit(key_text, (10, 40))
-        
-        # Draw coins
-        coin_text = self.hud_font.render(
-            f"Coins: {self.coins_collected}/{self.total_coins}", True, 
-            (255, 215, 0))
-        screen.blit(coin_text, (10, 70))
-        
+        if self.endless:
+            # Draw depth and coins
+            depth_text = text_cache.render_counter(
+                self.hud_font, "Depth: ", self.depth, (0, 255, 255))
+            screen.blit(depth_text, (10, 40))
+            coin_text = text_cache.render_counter(
+                self.hud_font, "Coins: ", self.coins_collected, (255, 215, 0))
+            screen.blit(coin_text, (10, 70))
+        else:
+            # Draw keys
+            key_text = text_cache.render(
+                self.hud_font,
+                f"Keys: {self.keys_collected}/{self.total_keys}",
+                (0, 255, 255))
+            screen.blit(key_text, (10, 40))
+            
+            # Draw coins
+            coin_text = text_cache.render(
+                self.hud_font,
+                f"Coins: {self.coins_collected}/{self.total_coins}",
+                (255, 215, 0))
+            screen.blit(coin_text, (10, 70))
+        
+        # Draw autopilot
+        if self.autopilot:
+            autopilot_text = text_cache.render(self.hud_font, "AUTOPILOT",
+                                               self.RUNE_COLOR)
+            screen.blit(autopilot_text, (10, 100))
+            
         # Draw echo cooldown
         if self.echo_timer > 0:
             cooldown = self.echo_timer / self.echo_cooldown
@@ -489,9 +806,114 @@ class EchoMaze:
                            (self.WINDOW_SIZE[0] - 110, 10, 
                             100 * (1 - cooldown), 20))
             
+    def update(self):
+        """Advance one fixed simulation step while playing"""
+        # Move player
+        keys = pygame.key.get_pressed()
+        new_pos = self.player_pos.copy()
+        moved = False
+        
+        if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and \
+           self.player_pos[0] > 0:
+            new_pos[0] -= 1
+            moved = True
+        elif (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and \
+             self.player_pos[0] < self.GRID_WIDTH - 1:
+            new_pos[0] += 1
+            moved = True
+        elif (keys[pygame.K_UP] or keys[pygame.K_w]) and \
+             self.player_pos[1] > 0:
+            new_pos[1] -= 1
+            moved = True
+        elif (keys[pygame.K_DOWN] or keys[pygame.K_s]) and \
+             (self.endless or self.player_pos[1] < self.GRID_HEIGHT - 1):
+            new_pos[1] += 1
+            moved = True
+            
+        # The route from the end of the last step still starts here
+        if self.autopilot and len(self.route) > 1:
+            new_pos = list(self.route[1])
+            moved = True
+                
+        # Check if move is valid
+        if moved and self.is_open(*new_pos):
+            self.player_pos = new_pos
+            self.create_rune_animation(*self.player_pos)
+            self.footstep_timer = 10
+            
+        if self.endless:
+            # Each new chunk reached buys more time
+            depth = self.player_pos[1] // self.world.chunk_height
+            if depth > self.depth:
+                self.depth = depth
+                self.time_left += 20 * self.FPS
+            self.update_camera()
+            
+        # Update collectibles
+        # The treasure stays put until every key is held
+        collectible = self.entities.collectible_at(*self.player_pos)
+        if collectible is not None and (
+                collectible.type != 'treasure' or
+                self.keys_collected >= self.total_keys):
+            self.entities.collect(collectible)
+            if collectible.type == 'key':
+                self.keys_collected += 1
+            elif collectible.type == 'coin':
+                self.coins_collected += 1
+            else:
+                self.game_state = self.STATE_WIN
+                
+        # Check traps
+        trap = self.entities.trap_at(*self.player_pos)
+        if trap is not None and trap.active:
+            self.game_state = self.STATE_GAME_OVER
+                
+        # Update timers
+        if self.echo_timer > 0:
+            self.echo_timer -= 1
+            if self.echo_timer == 0:
+                self.echo_arrival = None
+                
+        self.time_left -= 1
+        if self.time_left <= 0:
+            self.game_state = self.STATE_GAME_OVER
+            
+        # Update animations
+        self.update_rune_animations()
+        # Update the hint route while it is shown
+        if self.autopilot or keys[pygame.K_h]:
+            self.route = self.hint_route()
+        else:
+            self.route = []
+            
+        # Only what can be drawn is animated
+        for collectible in self.entities.shown_collectibles:
+            collectible.update()
+        for trap in self.entities.visible_traps:
+            trap.update()
+            
+        # Update visibility
+        self.update_visibility()
+        
+        # Record the run once it ends
+        if self.game_state != self.STATE_PLAYING and self.endless:
+            score_store.record_run('echo_maze_endless', self.depth,
+                                   coins=self.coins_collected)
+        elif self.game_state != self.STATE_PLAYING:
+            score_store.record_run(
+                'echo_maze', self.coins_collected,
+                won=self.game_state == self.STATE_WIN,
+                keys=self.keys_collected,
+                time_remaining=self.time_left // self.FPS)
+            # Kept for replays; the writer thread does the disk work
+            layout = self.layout
+            self.library_writer.save(layout.seed, layout.maze,
+                                     layout.collectibles, layout.traps)
+            
     def run(self, screen):
-        clock = pygame.time.Clock()
+        clock = GameClock(self.FPS)
         self.reset_game()
+        clock.reset()
         running = True
         
         while running:
@@ -507,149 +929,45 @@ class EchoMaze:
                             self.game_state = self.STATE_PLAYING
                         elif (self.game_state == self.STATE_PLAYING and 
                               self.echo_timer <= 0):
-                            self.echo_timer = self.echo_cooldown
-                            # Create echo effect
-                            self.echo_radius = 8  # Temporary larger radius
-                    elif event.key == pygame.K_r and self.game_state in [
-                        self.STATE_GAME_OVER, self.STATE_WIN]:
-                        self.reset_game()
+                            self.start_echo()
+                    elif event.key == pygame.K_p and \
+                         self.game_state == self.STATE_PLAYING:
+                        self.autopilot = not self.autopilot
+                    elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3) \
+                         and self.game_state == self.STATE_MENU:
+                        # The menu swaps in a maze of the new difficulty
+                        self.difficulty = DIFFICULTIES[event.key - pygame.K_1]
+                    elif event.key == pygame.K_e and \
+                         self.game_state == self.STATE_MENU:
+                        self.start_endless()
                         self.game_state = self.STATE_PLAYING
+                    elif event.key in (pygame.K_r, pygame.K_n) and \
+                         self.game_state in [self.STATE_GAME_OVER,
+                                             self.STATE_WIN]:
+                        if self.endless:
+                            self.start_endless()
+                        elif event.key == pygame.K_r:
+                            # Replay the same maze
+                            self.reset_game(self.seed)
+                        else:
+                            self.reset_game()
+                        self.game_state = self.STATE_PLAYING
+                        clock.reset()
                         
-            if self.game_state == self.STATE_PLAYING:
-                # Move player
-                keys = pygame.key.get_pressed()
-                new_pos = self.player_pos.copy()
-                moved = False
-                
-                if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and \
-                   self.player_pos[0] > 0:
-                    new_pos[0] -= 1
-                    moved = True
-                elif (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and \
-                     self.player_pos[0] < self.GRID_WIDTH - 1:
-                    new_pos[0] += 1
-                    moved = True
-                elif (keys[pygame.K_UP] or keys[pygame.K_w]) and \
-                     self.player_pos[1] > 0:
-                    new_pos[1] -= 1
-                    moved = True
-                elif (keys[pygame.K_DOWN] or keys[pygame.K_s]) and \
-                     self.player_pos[1] < self.GRID_HEIGHT - 1:
-                    new_pos[1] += 1
-                    moved = True
-                    
-                # Check if move is valid
-                if moved and self.maze[new_pos[1]][new_pos[0]] == 0:
-                    self.player_pos = new_pos
-                    self.create_rune_animation(*self.player_pos)
-                    self.footstep_timer = 10
-                    
-                # Update collectibles
-                for collectible in self.collectibles:
-                    if not collectible.collected and \
-                       collectible.x == self.player_pos[0] and \
-                       collectible.y == self.player_pos[1]:
-                        collectible.collected = True
-                        if collectible.type == 'key':
-                            self.keys_collected += 1
-                        elif collectible.type == 'coin':
-                            self.coins_collected += 1
-                        elif collectible.type == 'treasure' and \
-                             self.keys_collected >= self.total_keys:
-                            self.game_state = self.STATE_WIN
-                            
-                # Check traps
-                for trap in self.traps:
-                    if trap.active and \
-                       trap.x == self.player_pos[0] and \
-                       trap.y == self.player_pos[1]:
-                        self.game_state = self.STATE_GAME_OVER
-                        
-                # Update timers
-                if self.echo_timer > 0:
-                    self.echo_timer -= 1
-                    if self.echo_timer == 0:
-                        self.echo_radius = 5  # Reset to normal radius
-                        
-                self.time_left -= 1
-                if self.time_left <= 0:
-                    self.game_state = self.STATE_GAME_OVER
-                    
-                # Update animations
-                self.update_rune_animations()
-                for collectible in self.collectibles:
-                    collectible.update()
-                for trap in self.traps:
-                    trap.update()
-                    
-                # Update visibility
-                self.update_visibility()
+            # Advance the game in fixed steps
+            for _ in range(clock.tick()):
+                if self.game_state == self.STATE_PLAYING:
+                    self.update()
                 
             # Draw everything
             screen.fill(self.BLACK)
             
             if self.game_state == self.STATE_MENU:
+                self.match_difficulty()
                 self.draw_menu(screen)
             else:
-                # Draw maze
-                for y in range(self.GRID_HEIGHT):
-                    for x in range(self.GRID_WIDTH):
-                        if self.visible[y][x] or self.visited[y][x]:
-                            rect = pygame.Rect(x * self.CELL_SIZE,
-                                            y * self.CELL_SIZE,
-                                            self.CELL_SIZE,
-                                            self.CELL_SIZE)
-                            
-                            if self.maze[y][x] == 1:
-                                # Draw wall
-                                color = self.WALL_COLOR
-                                if not self.visible[y][x]:
-                                    color = tuple(c // 3 for c in color)
-                                pygame.draw.rect(screen, color, rect)
-                                # Add edge highlight
-                                pygame.draw.rect(screen, 
-                                               tuple(min(255, c + 50) 
-                                                     for c in color),
-                                               rect, 1)
-                            else:
-                                # Draw floor
-                                color = self.PATH_COLOR
-                                if not self.visible[y][x]:
-                                    color = tuple(c // 3 for c in color)
-                                pygame.draw.rect(screen, color, rect)
-                                
-                # Draw rune animations
-                for anim in self.rune_animations:
-                    surface = pygame.Surface((self.CELL_SIZE * 2, 
-                                           self.CELL_SIZE * 2), 
-                                          pygame.SRCALPHA)
-                    size = int(self.CELL_SIZE * anim['size'])
-                    pygame.draw.rect(surface,
-                                   (*self.RUNE_COLOR[:3], anim['alpha']),
-                                   (self.CELL_SIZE - size//2,
-                                    self.CELL_SIZE - size//2,
-                                    size, size))
-                    screen.blit(surface,
-                              (anim['x'] * self.CELL_SIZE - self.CELL_SIZE//2,
-                               anim['y'] * self.CELL_SIZE - self.CELL_SIZE//2))
-                    
-                # Draw collectibles
-                for collectible in self.collectibles:
-                    collectible.draw(screen, self.CELL_SIZE,
-                                   self.visible[collectible.y][collectible.x])
-                    
-                # Draw traps
-                for trap in self.traps:
-                    trap.draw(screen, self.CELL_SIZE,
-                            self.visible[trap.y][trap.x])
-                    
-                # Draw player
-                pygame.draw.circle(screen, self.RUNE_COLOR,
-                                 (self.player_pos[0] * self.CELL_SIZE + 
-                                  self.CELL_SIZE // 2,
-                                  self.player_pos[1] * self.CELL_SIZE + 
-                                  self.CELL_SIZE // 2),
-                                 self.CELL_SIZE // 3)
+                # Draw maze, items and player
+                self.draw_world(screen)
                 
                 # Draw HUD
                 self.draw_hud(screen)
@@ -660,6 +978,5 @@ class EchoMaze:
                     self.draw_win_screen(screen)
                     
             pygame.display.flip()
-            clock.tick(self.FPS)
             
         return True  # Return to main menu
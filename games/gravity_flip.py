@@ -1,91 +1,122 @@
 import pygame
 import random
 import math
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Optional, Tuple
 import os
+from .gravity_sim import GravityFlipSimulation
+from utils.game_clock import GameClock
+from utils.glow_cache import glow_cache
+from utils.particles import ParticleEngine
+from utils.score_store import score_store
+from utils.surface_factory import surface_factory
+from utils.text_cache import text_cache
+from utils.trail import Trail, TrailRenderer
 
-class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Dict] = []
-        
-    def create_burst(self, x: int, y: int, direction: int, color: tuple):
-        for _ in range(20):
-            angle = random.uniform(-math.pi/4, math.pi/4)
-            if direction < 0:  # Flipping upward
-                angle += math.pi
-            speed = random.uniform(2, 5)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 1.0,
-                'color': color
-            })
-            
-    def update(self):
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 0.02
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                
-    def draw(self, screen):
-        for particle in self.particles:
-            alpha = int(255 * particle['life'])
-            color = (*particle['color'][:3], alpha)
-            pos = (int(particle['x']), int(particle['y']))
-            size = int(5 * particle['life'])
-            
-            particle_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, (size, size), size)
-            screen.blit(particle_surface, 
-                       (pos[0] - size, pos[1] - size))
+# Parallax layers are expensive to build, so they are generated once per
+# process and shared by every Background (retries just reset the scroll)
+_layer_cache: Dict[tuple, pygame.Surface] = {}
+_star_stamps: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+def get_star_stamps() -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """Pixel offsets covered by pygame.draw.circle for star sizes 1-3"""
+    if not _star_stamps:
+        stamp = pygame.Surface((9, 9), 0, 8)
+        for size in range(1, 4):
+            stamp.fill(0)
+            pygame.draw.circle(stamp, 1, (4, 4), size)
+            dx, dy = np.nonzero(pygame.surfarray.array2d(stamp))
+            _star_stamps[size] = (dx - 4, dy - 4)
+    return _star_stamps
 
 class Background:
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, compact: bool = False):
         self.width = width
         self.height = height
+        # Compact layers are 8-bit colorkeyed surfaces (1 byte per pixel)
+        # instead of 32-bit per-pixel alpha
+        self.compact = compact
         self.layers = [
             {
-                'image': self.create_star_layer(0.2),
+                'image': self.get_layer('stars', 0.2),
                 'scroll': 0,
                 'speed': 0.5
             },
             {
-                'image': self.create_star_layer(0.3),
+                'image': self.get_layer('stars', 0.3),
                 'scroll': 0,
                 'speed': 1.0
             },
             {
-                'image': self.create_grid_layer(),
+                'image': self.get_layer('grid'),
                 'scroll': 0,
                 'speed': 2.0
             }
         ]
         
+    def get_layer(self, kind: str, density: float = 0.0) -> pygame.Surface:
+        key = (kind, self.width, self.height, density, self.compact)
+        if key not in _layer_cache:
+            if kind == 'stars':
+                _layer_cache[key] = self.create_star_layer(density)
+            else:
+                _layer_cache[key] = self.create_grid_layer()
+        return _layer_cache[key]
+        
+    def create_layer_surface(self, pixels: np.ndarray, 
+                             color: Tuple[int, int, int]) -> pygame.Surface:
+        """Build a layer from an array of 0-255 intensities (0 = empty)"""
+        if self.compact:
+            surface = pygame.Surface((self.width, self.height), 0, 8)
+            surface.set_palette([tuple(c * i // 255 for c in color)
+                                 for i in range(256)])
+            surface.set_colorkey(0)
+            pygame.surfarray.blit_array(surface, pixels)
+            return surface_factory.convert(surface, static=True)
+            
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[...] = (pixels[..., None].astype(np.uint16) * color // 255)
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[...] = np.where(pixels > 0, 255, 0)
+        del alpha
+        return surface_factory.convert(surface, static=True)
+        
     def create_star_layer(self, density: float) -> pygame.Surface:
-        surface = pygame.Surface((self.width * 2, self.height), pygame.SRCALPHA)
-        num_stars = int(self.width * self.height * density)
-        for _ in range(num_stars):
-            x = random.randint(0, surface.get_width())
-            y = random.randint(0, surface.get_height())
-            brightness = random.randint(100, 255)
-            size = random.randint(1, 3)
-            pygame.draw.circle(surface, (brightness, brightness, brightness), 
-                             (x, y), size)
-        return surface
+        # Layers are one screen wide and wrap horizontally, drawn twice side
+        # by side; keep the star count per pixel of the old double-width layer
+        num_stars = int(self.width * self.height * density) // 2
+        xs = np.random.randint(0, self.width, num_stars)
+        ys = np.random.randint(0, self.height, num_stars)
+        brightness = np.random.randint(100, 256, num_stars).astype(np.uint8)
+        sizes = np.random.randint(1, 4, num_stars)
+        
+        # Stamp every star of a size at once; later stars overwrite earlier
+        # ones just like successive draw calls did
+        pixels = np.zeros((self.width, self.height), dtype=np.uint8)
+        for size, (dx, dy) in get_star_stamps().items():
+            selected = sizes == size
+            px = (xs[selected, None] + dx) % self.width
+            py = ys[selected, None] + dy
+            values = np.broadcast_to(brightness[selected, None], px.shape)
+            inside = (py >= 0) & (py < self.height)
+            pixels[px[inside], py[inside]] = values[inside]
+        return self.create_layer_surface(pixels, (255, 255, 255))
         
     def create_grid_layer(self) -> pygame.Surface:
-        surface = pygame.Surface((self.width * 2, self.height), pygame.SRCALPHA)
         grid_size = 40
-        for x in range(0, surface.get_width(), grid_size):
-            pygame.draw.line(surface, (0, 255, 255, 30), 
-                           (x, 0), (x, self.height))
-        for y in range(0, surface.get_height(), grid_size):
-            pygame.draw.line(surface, (0, 255, 255, 30), 
-                           (0, y), (surface.get_width(), y))
+        pixels = np.zeros((self.width, self.height), dtype=np.uint8)
+        pixels[::grid_size, :] = 255
+        pixels[:, ::grid_size] = 255
+        if self.compact:
+            # No per-pixel alpha, so pre-blend the faint lines onto black
+            faint = np.where(pixels > 0, 30, 0).astype(np.uint8)
+            return self.create_layer_surface(faint, (0, 255, 255))
+        surface = self.create_layer_surface(pixels, (0, 255, 255))
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[pixels > 0] = 30
+        del alpha
         return surface
         
     def update(self, speed: float):
@@ -117,13 +148,29 @@ class GravityFlipRunner:
         self.gravity = 0.8
         self.jump_speed = -15
         
+        # Game rules run headless; this class only handles input and drawing
+        self.simulation = GravityFlipSimulation(
+            self.WINDOW_SIZE[0], self.WINDOW_SIZE[1],
+            player_size=self.player_size,
+            obstacle_width=self.obstacle_width,
+            obstacle_gap=self.obstacle_gap,
+            gravity=self.gravity)
+        self.flip_requested = False
+        
         # Initialize systems
-        self.particle_system = ParticleSystem()
+        self.particle_system = ParticleEngine()
         self.background = None  # Will be initialized in reset_game
+        self.compact_background = False  # 8-bit layers to save memory
         
         # Trail effect
-        self.trail: List[Dict] = []
         self.trail_length = 10
+        self.trail = Trail(self.trail_length)
+        # Each frame every point fades by 10 and shrinks towards the tail
+        self.trail_renderer = TrailRenderer(
+            self.NEON_YELLOW,
+            [self.player_size * (1 - i/self.trail_length)
+             for i in range(self.trail_length)],
+            [245 - 10 * i for i in range(self.trail_length)])
         
         # Game states
         self.STATE_MENU = 'menu'
@@ -132,152 +179,145 @@ class GravityFlipRunner:
         self.STATE_GAME_OVER = 'game_over'
         
         # Load fonts
-        self.title_font = pygame.font.Font(None, 74)
-        self.menu_font = pygame.font.Font(None, 36)
-        self.score_font = pygame.font.Font(None, 48)
+        self.title_font = text_cache.get_font(74)
+        self.menu_font = text_cache.get_font(36)
+        self.score_font = text_cache.get_font(48)
         
         # Load high score
-        self.high_score = self.load_high_score()
+        self.high_score = score_store.get_high_score('gravity_flip')
         
-    def load_high_score(self) -> int:
-        try:
-            with open('high_score.txt', 'r') as f:
-                return int(f.read())
-        except:
-            return 0
-            
-    def save_high_score(self):
-        with open('high_score.txt', 'w') as f:
-            f.write(str(self.high_score))
-            
-    def reset_game(self):
-        self.player_pos = pygame.Vector2(100, self.WINDOW_SIZE[1] // 2)
-        self.player_velocity = 0
-        self.gravity_flip = False
-        self.score = 0
-        self.game_speed = 5
-        self.obstacles = []
-        self.spawn_initial_obstacles()
+    def reset_game(self, seed: Optional[int] = None):
+        self.simulation.reset(seed)
+        self.previous_player_y = self.simulation.player_y
+        self.flip_requested = False
+        self.trail.clear()
         self.game_state = self.STATE_MENU
-        self.background = Background(self.WINDOW_SIZE[0], self.WINDOW_SIZE[1])
+        self.background = Background(self.WINDOW_SIZE[0], self.WINDOW_SIZE[1],
+                                     self.compact_background)
         self.show_controls = True
         self.controls_timer = 5 * self.FPS  # 5 seconds
         self.screen_shake = 0
         
-    def spawn_initial_obstacles(self):
-        for i in range(3):
-            x = self.WINDOW_SIZE[0] + i * 300
-            self.spawn_obstacle(x)
-            
-    def spawn_obstacle(self, x: float):
-        height = random.randint(100, 300)
-        self.obstacles.append({
-            'x': x,
-            'height': height,
-            'passed': False,
-            'glow': 0,
-            'offset': random.uniform(-2, 2)  # For wiggle effect
-        })
-        
     def update_trail(self):
-        self.trail.insert(0, {
-            'pos': self.player_pos.copy(),
-            'alpha': 255
-        })
-        if len(self.trail) > self.trail_length:
-            self.trail.pop()
-            
-        for trail in self.trail:
-            trail['alpha'] = max(0, trail['alpha'] - 10)
+        self.trail.push(self.simulation.player_x, self.simulation.player_y)
             
     def draw_trail(self, screen):
-        for i, trail in enumerate(self.trail):
-            alpha = trail['alpha']
-            size = self.player_size * (1 - i/self.trail_length)
-            trail_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, 
-                             (*self.NEON_YELLOW[:3], alpha),
-                             (size/2, size/2), size/2)
-            screen.blit(trail_surface, 
-                       (trail['pos'].x - size/2, trail['pos'].y - size/2))
+        self.trail_renderer.draw(screen, [self.trail])
             
     def draw_menu(self, screen):
         # Draw title
-        title = self.title_font.render("GRAVITY FLIP RUNNER", True, self.NEON_BLUE)
+        title = text_cache.render(self.title_font, "GRAVITY FLIP RUNNER",
+                                  self.NEON_BLUE)
         title_rect = title.get_rect(center=(self.WINDOW_SIZE[0]//2, 150))
         screen.blit(title, title_rect)
         
         # Draw blinking "Press SPACE to Start"
         if (pygame.time.get_ticks() // 500) % 2:
-            start_text = self.menu_font.render("Press SPACE to Start", 
-                                             True, self.WHITE)
+            start_text = text_cache.render(self.menu_font,
+                                           "Press SPACE to Start", self.WHITE)
             start_rect = start_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 300))
             screen.blit(start_text, start_rect)
             
         # Draw controls
-        controls_text = self.menu_font.render("Controls: SPACE to Flip Gravity", 
-                                            True, self.WHITE)
+        controls_text = text_cache.render(
+            self.menu_font, "Controls: SPACE to Flip Gravity", self.WHITE)
         controls_rect = controls_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 400))
         screen.blit(controls_text, controls_rect)
         
         # Draw goal
-        goal_text = self.menu_font.render("Goal: Survive as long as you can!", 
-                                        True, self.WHITE)
+        goal_text = text_cache.render(
+            self.menu_font, "Goal: Survive as long as you can!", self.WHITE)
         goal_rect = goal_text.get_rect(center=(self.WINDOW_SIZE[0]//2, 450))
         screen.blit(goal_text, goal_rect)
         
         # Draw high score
-        high_score_text = self.menu_font.render(
-            f"High Score: {self.high_score}", True, self.NEON_GREEN)
+        high_score_text = text_cache.render(
+            self.menu_font, f"High Score: {self.high_score}", self.NEON_GREEN)
         high_score_rect = high_score_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 500))
         screen.blit(high_score_text, high_score_rect)
         
     def draw_game_over(self, screen):
         # Draw "Game Over"
-        game_over = self.title_font.render("GAME OVER", True, self.NEON_BLUE)
+        game_over = text_cache.render(self.title_font, "GAME OVER",
+                                      self.NEON_BLUE)
         game_over_rect = game_over.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 200))
         screen.blit(game_over, game_over_rect)
         
         # Draw score
-        score_text = self.score_font.render(f"Score: {self.score}", 
-                                          True, self.WHITE)
+        score_text = text_cache.render(
+            self.score_font, f"Score: {self.simulation.score}", self.WHITE)
         score_rect = score_text.get_rect(center=(self.WINDOW_SIZE[0]//2, 300))
         screen.blit(score_text, score_rect)
         
         # Draw high score
-        high_score_text = self.score_font.render(
-            f"High Score: {self.high_score}", True, self.NEON_GREEN)
+        high_score_text = text_cache.render(
+            self.score_font, f"High Score: {self.high_score}", self.NEON_GREEN)
         high_score_rect = high_score_text.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 350))
         screen.blit(high_score_text, high_score_rect)
         
         # Draw restart instructions
         if (pygame.time.get_ticks() // 500) % 2:
-            restart_text = self.menu_font.render(
-                "Press R to Retry or ESC to Exit", True, self.WHITE)
+            restart_text = text_cache.render(
+                self.menu_font, "Press R to Retry or ESC to Exit", self.WHITE)
             restart_rect = restart_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 450))
             screen.blit(restart_text, restart_rect)
             
     def draw_pause_screen(self, screen):
         # Draw semi-transparent overlay
-        overlay = pygame.Surface(self.WINDOW_SIZE, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
+        screen.blit(surface_factory.get_overlay(self.WINDOW_SIZE,
+                                                self.BLACK, 128), (0, 0))
         
         # Draw "PAUSED"
-        pause_text = self.title_font.render("PAUSED", True, self.WHITE)
+        pause_text = text_cache.render(self.title_font, "PAUSED", self.WHITE)
         pause_rect = pause_text.get_rect(center=(self.WINDOW_SIZE[0]//2, 
                                                self.WINDOW_SIZE[1]//2))
         screen.blit(pause_text, pause_rect)
         
+    def update(self):
+        """Advance one fixed simulation step while playing"""
+        # Update game logic
+        self.previous_player_y = self.simulation.player_y
+        alive = self.simulation.step(self.flip_requested)
+        self.flip_requested = False
+        
+        # Update background
+        self.background.update(self.simulation.game_speed)
+        
+        # Update particle system
+        self.particle_system.update()
+        
+        # Update trail
+        self.update_trail()
+        
+        if not alive:
+            # Written in the background, the frame never waits on disk
+            score_store.record_run('gravity_flip', self.simulation.score,
+                                   seed=self.simulation.seed,
+                                   frames=self.simulation.frame,
+                                   speed=self.simulation.game_speed)
+            self.high_score = max(self.high_score, self.simulation.score)
+            self.game_state = self.STATE_GAME_OVER
+                
+        # Update controls timer
+        if self.show_controls:
+            self.controls_timer -= 1
+            if self.controls_timer <= 0:
+                self.show_controls = False
+                
+        # Update screen shake
+        if self.screen_shake > 0:
+            self.screen_shake -= 1
+            
     def run(self, screen):
-        clock = pygame.time.Clock()
+        clock = GameClock(self.FPS)
         self.reset_game()
+        clock.reset()
         running = True
         
         while running:
@@ -295,11 +335,15 @@ class GravityFlipRunner:
                         if self.game_state == self.STATE_MENU:
                             self.game_state = self.STATE_PLAYING
                         elif self.game_state == self.STATE_PLAYING:
-                            self.gravity_flip = not self.gravity_flip
+                            # Applied by the next simulation step
+                            self.flip_requested = not self.flip_requested
+                            flipped = (self.simulation.gravity_flip != 
+                                       self.flip_requested)
                             self.screen_shake = 10
                             self.particle_system.create_burst(
-                                self.player_pos.x, self.player_pos.y,
-                                -1 if self.gravity_flip else 1,
+                                self.simulation.player_x,
+                                self.simulation.player_y,
+                                -1 if flipped else 1,
                                 self.NEON_YELLOW
                             )
                     elif event.key == pygame.K_p:
@@ -311,81 +355,12 @@ class GravityFlipRunner:
                          self.game_state == self.STATE_GAME_OVER:
                         self.reset_game()
                         self.game_state = self.STATE_PLAYING
+                        clock.reset()
             
-            if self.game_state == self.STATE_PLAYING:
-                # Update game logic
-                gravity_direction = -1 if self.gravity_flip else 1
-                self.player_velocity += self.gravity * gravity_direction
-                self.player_pos.y += self.player_velocity
-                
-                # Update background
-                self.background.update(self.game_speed)
-                
-                # Update particle system
-                self.particle_system.update()
-                
-                # Update trail
-                self.update_trail()
-                
-                # Keep player in bounds
-                if self.player_pos.y < 0:
-                    self.player_pos.y = 0
-                    self.player_velocity = 0
-                elif self.player_pos.y > self.WINDOW_SIZE[1] - self.player_size:
-                    self.player_pos.y = self.WINDOW_SIZE[1] - self.player_size
-                    self.player_velocity = 0
-                    
-                # Update obstacles
-                for obstacle in self.obstacles[:]:
-                    obstacle['x'] -= self.game_speed
-                    # Update obstacle glow
-                    obstacle['glow'] = (obstacle['glow'] + 0.05) % (2 * math.pi)
-                    # Update obstacle wiggle
-                    obstacle['offset'] = math.sin(pygame.time.get_ticks() * 0.01) * 2
-                    
-                    if not obstacle['passed'] and \
-                       obstacle['x'] < self.player_pos.x:
-                        obstacle['passed'] = True
-                        self.score += 1
-                        # Increase game speed every 15 seconds
-                        if self.score % 15 == 0:
-                            self.game_speed += 0.5
-                            
-                    if obstacle['x'] < -self.obstacle_width:
-                        self.obstacles.remove(obstacle)
-                        self.spawn_obstacle(self.WINDOW_SIZE[0])
-                        
-                # Check collisions
-                player_rect = pygame.Rect(self.player_pos.x, self.player_pos.y,
-                                        self.player_size, self.player_size)
-                for obstacle in self.obstacles:
-                    top_obstacle = pygame.Rect(
-                        obstacle['x'], 0,
-                        self.obstacle_width, obstacle['height']
-                    )
-                    bottom_obstacle = pygame.Rect(
-                        obstacle['x'],
-                        obstacle['height'] + self.obstacle_gap,
-                        self.obstacle_width,
-                        self.WINDOW_SIZE[1]
-                    )
-                    
-                    if player_rect.colliderect(top_obstacle) or \
-                       player_rect.colliderect(bottom_obstacle):
-                        if self.score > self.high_score:
-                            self.high_score = self.score
-                            self.save_high_score()
-                        self.game_state = self.STATE_GAME_OVER
-                        
-                # Update controls timer
-                if self.show_controls:
-                    self.controls_timer -= 1
-                    if self.controls_timer <= 0:
-                        self.show_controls = False
-                        
-                # Update screen shake
-                if self.screen_shake > 0:
-                    self.screen_shake -= 1
+            # Advance the game in fixed steps
+            for _ in range(clock.tick()):
+                if self.game_state == self.STATE_PLAYING:
+                    self.update()
             
             # Draw everything
             screen.fill(self.BLACK)
@@ -396,47 +371,49 @@ class GravityFlipRunner:
             if self.game_state == self.STATE_MENU:
                 self.draw_menu(screen)
             else:
+                # Interpolate between the last two steps for smooth motion
+                alpha = (clock.alpha if self.game_state == self.STATE_PLAYING
+                         else 1.0)
+                scroll_offset = self.simulation.game_speed * (1 - alpha)
+                player_y = (self.previous_player_y + alpha *
+                            (self.simulation.player_y - self.previous_player_y))
+                
                 # Draw obstacles with glow effect
-                for obstacle in self.obstacles:
-                    glow_intensity = (math.sin(obstacle['glow']) + 1) / 2
+                wiggle = math.sin(
+                    self.simulation.frame * 1000 / self.FPS * 0.01) * 2
+                for obstacle in self.simulation.obstacles:
+                    x = obstacle['x'] + scroll_offset
+                    glow_intensity = glow_cache.quantize(
+                        (math.sin(obstacle['glow']) + 1) / 2)
                     glow_color = (0, 
                                 int(255 * (0.7 + 0.3 * glow_intensity)), 
                                 int(255 * (0.7 + 0.3 * glow_intensity)))
                     
                     # Draw top obstacle
                     pygame.draw.rect(screen, glow_color,
-                                   (obstacle['x'], 
-                                    0 + obstacle['offset'],
+                                   (x, 
+                                    0 + wiggle,
                                     self.obstacle_width, 
                                     obstacle['height']))
                     
                     # Draw bottom obstacle
                     pygame.draw.rect(screen, glow_color,
-                                   (obstacle['x'],
-                                    obstacle['height'] + self.obstacle_gap + obstacle['offset'],
+                                   (x,
+                                    obstacle['height'] + self.obstacle_gap + wiggle,
                                     self.obstacle_width,
                                     self.WINDOW_SIZE[1]))
                     
-                    # Draw glow effect
-                    for i in range(3):
-                        glow_alpha = int(128 * (1 - i/3) * glow_intensity)
-                        glow_surface = pygame.Surface(
-                            (self.obstacle_width + i*4, self.WINDOW_SIZE[1]), 
-                            pygame.SRCALPHA
-                        )
-                        pygame.draw.rect(glow_surface, 
-                                       (*glow_color, glow_alpha),
-                                       (0, 0, 
-                                        self.obstacle_width + i*4, 
-                                        obstacle['height']))
-                        pygame.draw.rect(glow_surface, 
-                                       (*glow_color, glow_alpha),
-                                       (0, 
-                                        obstacle['height'] + self.obstacle_gap,
-                                        self.obstacle_width + i*4,
-                                        self.WINDOW_SIZE[1]))
-                        screen.blit(glow_surface, 
-                                  (obstacle['x'] - i*2, 0))
+                    # Draw glow effect (cached column cropped to each part)
+                    glow_surface = glow_cache.get(
+                        'column', (self.obstacle_width, self.WINDOW_SIZE[1]),
+                        glow_color, glow_intensity)
+                    bottom_y = obstacle['height'] + self.obstacle_gap
+                    screen.blit(glow_surface, (x - 4, 0),
+                              (0, 0, glow_surface.get_width(),
+                               obstacle['height']))
+                    screen.blit(glow_surface, (x - 4, bottom_y),
+                              (0, bottom_y, glow_surface.get_width(),
+                               self.WINDOW_SIZE[1] - bottom_y))
                 
                 # Apply screen shake
                 shake_offset = random.randint(-self.screen_shake, 
@@ -446,44 +423,32 @@ class GravityFlipRunner:
                 self.draw_trail(screen)
                 
                 # Draw player with glow effect
-                player_surface = pygame.Surface(
-                    (self.player_size * 2, self.player_size * 2), 
-                    pygame.SRCALPHA
-                )
-                pygame.draw.circle(player_surface, 
-                                 (*self.NEON_YELLOW, 128),
-                                 (self.player_size, self.player_size),
-                                 self.player_size)
-                pygame.draw.circle(player_surface, 
-                                 self.NEON_YELLOW,
-                                 (self.player_size, self.player_size),
-                                 self.player_size - 2)
+                player_surface = glow_cache.get('orb', self.player_size,
+                                                self.NEON_YELLOW)
                 screen.blit(player_surface,
-                          (self.player_pos.x - self.player_size/2 + shake_offset,
-                           self.player_pos.y - self.player_size/2))
+                          (self.simulation.player_x - self.player_size/2 + 
+                           shake_offset,
+                           player_y - self.player_size/2))
                 
                 # Draw particles
                 self.particle_system.draw(screen)
                 
                 # Draw score
-                score_text = self.score_font.render(f"Score: {self.score}", 
-                                                  True, self.NEON_GREEN)
+                score_text = text_cache.render_counter(
+                    self.score_font, "Score: ", self.simulation.score,
+                    self.NEON_GREEN)
                 screen.blit(score_text, (10, 10))
                 
                 # Draw controls hint (fades out after 5 seconds)
                 if self.show_controls:
                     alpha = int(255 * (self.controls_timer / (5 * self.FPS)))
-                    controls_surface = pygame.Surface(
-                        (300, 40), pygame.SRCALPHA)
-                    controls_text = self.menu_font.render(
-                        "Press SPACE to Flip", True, 
-                        (*self.WHITE[:3], alpha))
+                    controls_text = text_cache.render(
+                        self.menu_font, "Press SPACE to Flip", self.WHITE,
+                        alpha=alpha)
                     controls_rect = controls_text.get_rect(
-                        center=(150, 20))
-                    controls_surface.blit(controls_text, controls_rect)
-                    screen.blit(controls_surface,
-                              (self.WINDOW_SIZE[0]//2 - 150,
-                               self.WINDOW_SIZE[1] - 60))
+                        center=(self.WINDOW_SIZE[0]//2,
+                                self.WINDOW_SIZE[1] - 40))
+                    screen.blit(controls_text, controls_rect)
                 
                 # Draw pause screen if paused
                 if self.game_state == self.STATE_PAUSED:
@@ -492,6 +457,5 @@ class GravityFlipRunner:
                     self.draw_game_over(screen)
             
             pygame.display.flip()
-            clock.tick(self.FPS)
             
         return True  # Return to main menu
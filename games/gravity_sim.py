@@ -0,0 +1,510 @@
+import random
+import numpy as np
+from collections import OrderedDict, deque
+from typing import (Callable, Deque, Dict, Iterable, Iterator, List,
+                    Optional, Tuple)
+
+class GravityFlipSimulation:
+    """Headless game rules for Gravity Flip Runner.
+
+    Holds physics, obstacle scrolling, scoring and collision with no pygame
+    display, fonts or wall-clock time. Obstacles come from an ObstacleCourse
+    seeded in reset(), so the same seed and the same sequence of step()
+    actions always produce the same states. `generation_budget` is how many
+    frames the course may spend generating ahead per step.
+    """
+
+    def __init__(self, width: int = 800, height: int = 600,
+                 player_x: float = 100, player_size: int = 30,
+                 obstacle_width: int = 50, obstacle_gap: int = 200,
+                 obstacle_spacing: int = 300, gravity: float = 0.8,
+                 start_speed: float = 5, speed_step: float = 0.5,
+                 speed_every: int = 15, generation_budget: int = 4):
+        self.width = width
+        self.height = height
+        self.player_x = player_x
+        self.player_size = player_size
+        self.obstacle_width = obstacle_width
+        self.obstacle_gap = obstacle_gap
+        self.obstacle_spacing = obstacle_spacing
+        self.gravity = gravity
+        self.start_speed = start_speed
+        self.speed_step = speed_step
+        self.speed_every = speed_every
+        self.generation_budget = generation_budget
+        self.course = self.new_course()
+        self.reset()
+
+    def new_course(self) -> 'ObstacleCourse':
+        """A course with this simulation's rules, as played by the game"""
+        return ObstacleCourse(self, start_spacing=self.obstacle_spacing)
+
+    def reset(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.frame = 0
+        self.distance = 0.0
+        self.player_y = self.height // 2
+        self.player_velocity = 0.0
+        self.gravity_flip = False
+        self.score = 0
+        self.game_speed = self.start_speed
+        self.game_over = False
+        self.course.reset(seed)
+        self.obstacles: Deque[Dict] = deque()
+        self.spawn_obstacles()
+
+    def spawn_obstacles(self):
+        """Stream in course obstacles that have reached the right edge"""
+        while self.course.peek()[0] - self.distance <= self.width:
+            position, height = self.course.pop()
+            self.obstacles.append({
+                'position': position,
+                'x': position - self.distance,
+                'height': height,
+                'passed': False,
+                'glow': 0
+            })
+
+    def step(self, flip: bool = False) -> bool:
+        """Advance one tick, flipping gravity first if asked.
+
+        Returns True while the player is alive.
+        """
+        if self.game_over:
+            return False
+        self.frame += 1
+        if flip:
+            self.gravity_flip = not self.gravity_flip
+
+        # Apply gravity
+        gravity_direction = -1 if self.gravity_flip else 1
+        self.player_velocity += self.gravity * gravity_direction
+        self.player_y += self.player_velocity
+
+        # Keep player in bounds
+        if self.player_y < 0:
+            self.player_y = 0
+            self.player_velocity = 0
+        elif self.player_y > self.height - self.player_size:
+            self.player_y = self.height - self.player_size
+            self.player_velocity = 0
+
+        # Update obstacles; all of them scroll by this frame's speed
+        self.distance += self.game_speed
+        for obstacle in self.obstacles:
+            obstacle['x'] = obstacle['position'] - self.distance
+            obstacle['glow'] = (obstacle['glow'] + 0.05) % 6.283185307179586
+
+            if not obstacle['passed'] and obstacle['x'] < self.player_x:
+                obstacle['passed'] = True
+                self.score += 1
+                if self.score % self.speed_every == 0:
+                    self.game_speed += self.speed_step
+
+        while self.obstacles and self.obstacles[0]['x'] < -self.obstacle_width:
+            self.obstacles.popleft()
+        self.spawn_obstacles()
+        self.course.pump(self.generation_budget)
+
+        # Check collisions (same integer overlap test as pygame.Rect)
+        if self.collides():
+            self.game_over = True
+        return not self.game_over
+
+    def collides(self) -> bool:
+        px = int(self.player_x)
+        py = int(self.player_y)
+        size = self.player_size
+        for obstacle in self.obstacles:
+            ox = int(obstacle['x'])
+            if not (px < ox + self.obstacle_width and ox < px + size):
+                continue
+            top = int(obstacle['height'])
+            if py < top:
+                return True
+            if top + self.obstacle_gap < py + size:
+                return True
+        return False
+
+    def get_state(self) -> Tuple:
+        """Hashable snapshot of everything that affects future steps"""
+        return (self.frame, self.distance, self.player_y, self.player_velocity,
+                self.gravity_flip, self.score, self.game_speed,
+                self.game_over,
+                tuple((o['x'], o['height'], o['passed'])
+                      for o in self.obstacles))
+
+class ObstacleCourse:
+    """Seeded obstacle stream generated ahead in feasibility-checked chunks.
+
+    Obstacles are placed at absolute course positions (distance scrolled)
+    with spacing and height swing taken from a difficulty curve. Each
+    candidate is accepted only if a scripted player, flying through the
+    course with the same arithmetic and collision test as step(), still
+    gets through it. Its flips are a concrete sequence that clears every
+    gap, so each course is passable by construction, at a few float
+    operations per frame. The player steers like tracking_policy(): it
+    flips when the point it would stop at lies more than `steer_margin`
+    pixels past the next gap's centre.
+
+    Generation runs as a resumable worker, so the simulation can spend a
+    small fixed budget of frames on it per step. The obstacles and worker
+    of the last `cache_size` seeds are kept, so reset() to one of them
+    replays its verified obstacles without flying them again.
+    """
+
+    def __init__(self, simulation: 'GravityFlipSimulation',
+                 chunk_size: int = 8, lookahead: int = 2,
+                 min_top: int = 100, max_top: int = 300,
+                 start_spacing: int = 300, min_spacing: int = 200,
+                 start_swing: int = 80, ramp: int = 150,
+                 max_attempts: int = 8, steer_margin: float = 10,
+                 cache_size: int = 16):
+        self.sim = simulation
+        self.chunk_size = chunk_size
+        self.lookahead = lookahead
+        self.min_top = min_top
+        self.max_top = max_top
+        self.start_spacing = start_spacing
+        self.min_spacing = min_spacing
+        self.start_swing = start_swing
+        self.ramp = ramp
+        self.max_attempts = max_attempts
+        self.steer_margin = steer_margin
+        self.cache_size = cache_size
+        # Seed -> (obstacles verified so far, worker that extends them)
+        self.courses: 'OrderedDict[int, Tuple[List, Iterator]]' = OrderedDict()
+        self.reset(0)
+
+    def reset(self, seed: int):
+        self.seed = seed
+        course = self.courses.get(seed)
+        if course is None:
+            placed: List[Tuple[float, int]] = []
+            course = (placed, self.generate(seed, placed))
+            self.courses[seed] = course
+            if len(self.courses) > self.cache_size:
+                self.courses.popitem(last=False)
+        else:
+            self.courses.move_to_end(seed)
+        self.placed, self.worker = course
+        self.cursor = 0  # Index in placed of the next obstacle to pop
+
+    def difficulty(self, index: int) -> float:
+        """0 for the first obstacle, ramping linearly to 1"""
+        return min(1.0, index / self.ramp)
+
+    def chunk_rng(self, seed: int, chunk: int) -> random.Random:
+        # Every chunk has its own seed so it can be replayed on its own
+        return random.Random(f"{seed}:{chunk}")
+
+    def pump(self, frames: int):
+        """Spend up to `frames` simulated frames generating ahead"""
+        target = self.cursor + self.lookahead * self.chunk_size
+        while frames > 0 and len(self.placed) < target:
+            next(self.worker)
+            frames -= 1
+
+    def pop(self) -> Tuple[float, int]:
+        """Next verified (course position, top height), generating if needed"""
+        obstacle = self.peek()
+        self.cursor += 1
+        return obstacle
+
+    def peek(self) -> Tuple[float, int]:
+        while self.cursor >= len(self.placed):
+            next(self.worker)
+        return self.placed[self.cursor]
+
+    def fly(self, player: Tuple[float, float, bool], distance: float,
+            passed: int, position: float, top: int, finish: bool
+            ) -> Iterator[None]:
+        """Worker step: fly the scripted player past one obstacle.
+
+        `player` is (height, velocity, gravity flipped). Returns whether
+        it cleared the gap, with the player, distance and passed count
+        once the obstacle is behind it. A crash ends the flight early
+        unless `finish` is set, in which case the player flies on through.
+        """
+        sim = self.sim
+        px = int(sim.player_x)
+        gravity = sim.gravity
+        floor = sim.height - sim.player_size
+        target = top + (sim.obstacle_gap - sim.player_size) / 2
+        y, velocity, flipped = player
+        cleared = True
+        while True:
+            # Steer, then move with the same arithmetic as step()
+            stop = y + velocity * abs(velocity) / (2 * gravity)
+            if flipped:
+                flipped = stop >= target - self.steer_margin
+            else:
+                flipped = stop > target + self.steer_margin
+            velocity += -gravity if flipped else gravity
+            y += velocity
+            if y < 0:
+                y = 0
+                velocity = 0
+            elif y > floor:
+                y = floor
+                velocity = 0
+
+            speed = sim.start_speed + sim.speed_step * (
+                passed // sim.speed_every)
+            x = position - distance - speed
+            if x < sim.player_x <= position - distance:
+                passed += 1
+            distance += speed
+            ox = int(x)
+            if px < ox + sim.obstacle_width and ox < px + sim.player_size:
+                py = int(y)
+                if py < top or top + sim.obstacle_gap < py + sim.player_size:
+                    cleared = False
+                    if not finish:
+                        return cleared, (y, velocity, flipped), distance, passed
+            yield
+            if ox + sim.obstacle_width <= px:
+                return cleared, (y, velocity, flipped), distance, passed
+
+    def generate(self, seed: int, placed: List[Tuple[float, int]]
+                 ) -> Iterator[None]:
+        """Worker: append verified obstacles of `seed` to `placed`"""
+        sim = self.sim
+        player = (float(sim.height // 2), 0.0, False)
+        distance = 0.0
+        passed = 0
+        position = float(sim.width)
+        top = (self.min_top + self.max_top) // 2
+        index = 0
+        chunk_number = 0
+
+        while True:
+            rng = self.chunk_rng(seed, chunk_number)
+            for _ in range(self.chunk_size):
+                level = self.difficulty(index)
+                if index:
+                    position += round(self.start_spacing + level *
+                                      (self.min_spacing - self.start_spacing))
+                swing = round(self.start_swing + level *
+                              (self.max_top - self.min_top - self.start_swing))
+
+                for attempt in range(self.max_attempts):
+                    last = attempt == self.max_attempts - 1
+                    if not last:
+                        candidate = rng.randint(max(self.min_top, top - swing),
+                                                min(self.max_top, top + swing))
+                    else:
+                        candidate = top  # Last resort: repeat the previous gap
+                    # If even that fails, the player flies on through it
+                    # rather than failing every later obstacle
+                    cleared, flown, travelled, cleared_count = yield from \
+                        self.fly(player, distance, passed, position,
+                                 candidate, last)
+                    if cleared:
+                        break
+
+                player, distance, passed = flown, travelled, cleared_count
+                top = candidate
+                placed.append((position, candidate))
+                index += 1
+            chunk_number += 1
+
+class PopulationSimulation:
+    """Many independent Gravity Flip players advanced in lockstep.
+
+    Every per-player value (height, velocity, gravity, score, speed,
+    distance) is a NumPy array and one step() advances all players with
+    the same arithmetic as GravityFlipSimulation.step(). Players are spread
+    over `courses` seeded obstacle courses, each built by the template's
+    new_course(), so a player on seed s replays a GravityFlipSimulation
+    with the same `params` reset to s exactly. Each policy call returns a
+    flip mask for the whole population. Used for difficulty sweeps instead
+    of hand-playing.
+    """
+
+    def __init__(self, players: int = 1000, courses: int = 1, seed: int = 0,
+                 **params):
+        self.template = GravityFlipSimulation(**params)
+        self.players = players
+        self.seeds = [seed + i for i in range(courses)]
+        self.course_of = np.arange(players) % courses
+
+        # Obstacles per course as (position, top) arrays, grown on demand
+        self.generators = []
+        for course_seed in self.seeds:
+            course = self.template.new_course()
+            course.reset(course_seed)
+            self.generators.append(course)
+        self.positions = np.zeros((courses, 0))
+        self.tops = np.zeros((courses, 0), dtype=np.int64)
+        self.extend_courses(64)
+        self.reset()
+
+    def extend_courses(self, count: int):
+        """Generate `count` more obstacles on every course"""
+        new = [[course.pop() for _ in range(count)]
+               for course in self.generators]
+        self.positions = np.hstack(
+            [self.positions, [[p for p, _ in rows] for rows in new]])
+        self.tops = np.hstack(
+            [self.tops, [[t for _, t in rows] for rows in new]])
+
+    def reset(self):
+        n, sim = self.players, self.template
+        self.frame = 0
+        self.player_y = np.full(n, float(sim.height // 2))
+        self.player_velocity = np.zeros(n)
+        self.gravity_flip = np.zeros(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.game_speed = np.full(n, float(sim.start_speed))
+        self.distance = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+        self.death_frame = np.full(n, -1, dtype=np.int64)
+
+    def next_obstacle(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(x, top) of each player's next unpassed obstacle"""
+        index = self.score
+        x = self.positions[self.course_of, index] - self.distance
+        return x, self.tops[self.course_of, index]
+
+    def step(self, flip: np.ndarray):
+        """Advance every live player one tick; `flip` is a bool per player"""
+        sim = self.template
+        live = self.alive
+        if self.score.max() + 2 >= self.positions.shape[1]:
+            self.extend_courses(self.positions.shape[1])
+        self.frame += 1
+        self.gravity_flip ^= flip & live
+
+        # Apply gravity
+        direction = np.where(self.gravity_flip, -1, 1)
+        velocity = self.player_velocity + sim.gravity * direction
+        y = self.player_y + velocity
+
+        # Keep players in bounds
+        floor = sim.height - sim.player_size
+        clamped = (y < 0) | (y > floor)
+        y = np.clip(y, 0, floor)
+        velocity[clamped] = 0
+        self.player_y = np.where(live, y, self.player_y)
+        self.player_velocity = np.where(live, velocity, self.player_velocity)
+
+        # Scroll, then score obstacles the player has passed
+        self.distance = np.where(live, self.distance + self.game_speed,
+                                 self.distance)
+        x, _ = self.next_obstacle()
+        passed = live & (x < sim.player_x)
+        self.score += passed
+        bump = passed & (self.score % sim.speed_every == 0)
+        self.game_speed = self.game_speed + sim.speed_step * bump
+
+        # Only the last passed and the next obstacle can overlap the player
+        px = int(sim.player_x)
+        py = np.trunc(self.player_y)
+        hit = np.zeros(self.players, dtype=bool)
+        for index in (self.score - 1, self.score):
+            valid = index >= 0
+            index = np.maximum(index, 0)
+            ox = np.trunc(self.positions[self.course_of, index] - self.distance)
+            top = self.tops[self.course_of, index]
+            overlap = (valid & (px < ox + sim.obstacle_width) &
+                       (ox < px + sim.player_size))
+            hit |= overlap & ((py < top) |
+                              (top + sim.obstacle_gap < py + sim.player_size))
+
+        died = live & hit
+        self.alive = live & ~hit
+        self.death_frame[died] = self.frame
+
+    def run(self, frames: int,
+            policy: Callable[['PopulationSimulation'], np.ndarray]) -> Dict:
+        """Play every player for up to `frames` steps.
+
+        Returns the survival curve (fraction alive after each frame), the
+        final scores and the frame each player died on (-1 if it survived).
+        """
+        self.reset()
+        survival = np.empty(frames)
+        for frame in range(frames):
+            self.step(np.asarray(policy(self), dtype=bool))
+            survival[frame] = self.alive.mean()
+            if not self.alive.any():
+                survival[frame:] = 0.0
+                break
+        return {
+            'survival': survival,
+            'scores': self.score.copy(),
+            'death_frames': self.death_frame.copy()
+        }
+
+    @staticmethod
+    def summarize(result: Dict) -> Dict[str, float]:
+        """Headline numbers for comparing parameter sets"""
+        scores = result['scores']
+        survival = result['survival']
+        half_life = np.flatnonzero(survival < 0.5)
+        return {
+            'mean_score': float(scores.mean()),
+            'median_score': float(np.median(scores)),
+            'p90_score': float(np.percentile(scores, 90)),
+            'max_score': int(scores.max()),
+            'survivors': float(survival[-1]),
+            'half_life': int(half_life[0]) + 1 if half_life.size else len(survival)
+        }
+
+    @staticmethod
+    def score_histogram(result: Dict, bins: int = 20
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        return np.histogram(result['scores'], bins=bins)
+
+def random_policy(rate: float = 0.05, seed: int = 0
+                  ) -> Callable[[PopulationSimulation], np.ndarray]:
+    """Flip each frame with a fixed probability"""
+    rng = np.random.default_rng(seed)
+    return lambda population: rng.random(population.players) < rate
+
+def tracking_policy(margin: float = 10, noise: float = 0.0, seed: int = 0
+                    ) -> Callable[[PopulationSimulation], np.ndarray]:
+    """Scripted player that steers toward the next gap's center.
+
+    Each player predicts where it would stop if gravity pulled the other
+    way and flips when that point is more than `margin` pixels on the
+    wrong side of the center. `noise` is the standard deviation, in
+    pixels, of a per-frame error in that prediction, to model less
+    precise players.
+    """
+    rng = np.random.default_rng(seed)
+    def policy(population: PopulationSimulation) -> np.ndarray:
+        sim = population.template
+        _, top = population.next_obstacle()
+        target = top + (sim.obstacle_gap - sim.player_size) / 2
+        velocity = population.player_velocity
+        stop = (population.player_y +
+                velocity * np.abs(velocity) / (2 * sim.gravity))
+        if noise:
+            stop = stop + rng.normal(0, noise, population.players)
+        # Gravity down while the stop point is above the target, up below
+        return np.where(population.gravity_flip, stop < target - margin,
+                        stop > target + margin)
+    return policy
+
+def sweep_difficulty(parameter_sets: Iterable[Dict], players: int = 2000,
+                     courses: int = 8, frames: int = 3600, seed: int = 0,
+                     policy_factory: Optional[Callable[[], Callable]] = None
+                     ) -> List[Tuple[Dict, Dict]]:
+    """Run a population per parameter set, e.g. over gravity or gap size.
+
+    Each entry of `parameter_sets` holds GravityFlipSimulation keyword
+    arguments. Returns (parameters, result) pairs; pass results to
+    PopulationSimulation.summarize() for a one-line comparison. The
+    default policy is a tracking player with 40px of prediction noise.
+    """
+    if policy_factory is None:
+        policy_factory = lambda: tracking_policy(noise=40)
+    results = []
+    for params in parameter_sets:
+        population = PopulationSimulation(players, courses, seed, **params)
+        results.append((params, population.run(frames, policy_factory())))
+    return results
@@ -0,0 +1,94 @@
+import numpy as np
+from typing import Dict, Iterable, List, Set, Tuple
+
+Cell = Tuple[int, int]
+
+class EntityGrid:
+    """Collectibles and traps of a maze, indexed by (x, y) cell.
+
+    Pickup and trap checks are one dictionary lookup each instead of a
+    scan. Collected items leave the index for good. The lists that
+    update() and draw() walk are rebuilt only when the lit cells change
+    or an item is collected:
+    - shown_collectibles: uncollected beacons, which show through the
+      fog, then the other uncollected items in lit cells.
+    - visible_traps: traps in lit cells.
+    """
+
+    def __init__(self, beacons: Iterable[str] = ()):
+        self.beacon_types = frozenset(beacons)
+        self.collectibles: Dict[Cell, object] = {}
+        self.traps: Dict[Cell, object] = {}
+        # Insertion-ordered set of uncollected beacons
+        self.beacons: Dict[object, None] = {}
+        self.lit: Set[Cell] = set()
+        self.shown_collectibles: List = []
+        self.visible_traps: List = []
+
+    def clear(self):
+        self.collectibles.clear()
+        self.traps.clear()
+        self.beacons.clear()
+        self.lit = set()
+        self.shown_collectibles = []
+        self.visible_traps = []
+
+    def add_collectible(self, collectible):
+        if collectible.collected:
+            return
+        cell = (collectible.x, collectible.y)
+        self.collectibles[cell] = collectible
+        if collectible.type in self.beacon_types:
+            self.beacons[collectible] = None
+            self.shown_collectibles.insert(len(self.beacons) - 1, collectible)
+        elif cell in self.lit:
+            self.shown_collectibles.append(collectible)
+
+    def add_trap(self, trap):
+        cell = (trap.x, trap.y)
+        self.traps[cell] = trap
+        if cell in self.lit:
+            self.visible_traps.append(trap)
+
+    def collectible_at(self, x: int, y: int):
+        return self.collectibles.get((x, y))
+
+    def trap_at(self, x: int, y: int):
+        return self.traps.get((x, y))
+
+    def collect(self, collectible):
+        """Mark an item collected and drop it from the index"""
+        collectible.collected = True
+        self.discard(collectible)
+
+    def discard(self, entity):
+        """Drop a collectible or trap, e.g. when its chunk is unloaded"""
+        cell = (entity.x, entity.y)
+        if self.collectibles.get(cell) is entity:
+            del self.collectibles[cell]
+            self.beacons.pop(entity, None)
+        elif self.traps.get(cell) is entity:
+            del self.traps[cell]
+        else:
+            return
+        self.refresh()
+
+    def set_view(self, top: int, left: int, mask: np.ndarray):
+        """Light the cells of `mask`, whose corner is at (left, top)"""
+        self.lit = {(left + x, top + y)
+                    for y, x in np.argwhere(mask).tolist()}
+        self.refresh()
+
+    def refresh(self):
+        collectibles, traps = self.collectibles, self.traps
+        shown = list(self.beacons)
+        visible_traps = []
+        for cell in self.lit:
+            collectible = collectibles.get(cell)
+            if collectible is not None and collectible not in self.beacons:
+                shown.append(collectible)
+            trap = traps.get(cell)
+            if trap is not None:
+                visible_traps.append(trap)
+        self.shown_collectibles = shown
+        self.visible_traps = visible_traps
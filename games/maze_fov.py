@@ -0,0 +1,107 @@
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Tuple
+from .maze_grid import Maze
+
+# (rows, columns) slices of the grid plus the boolean mask to put there
+Window = Tuple[Tuple[slice, slice], np.ndarray]
+
+# Transforms mapping octant 0 onto each of the eight octants
+OCTANTS = ((1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+           (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1))
+
+@lru_cache(maxsize=None)
+def circle_stencil(radius: int) -> np.ndarray:
+    """(2r + 1)^2 mask of the cells within `radius` of the center"""
+    offsets = np.arange(-radius, radius + 1)
+    stencil = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius ** 2
+    stencil.flags.writeable = False
+    return stencil
+
+def clip_window(shape: Tuple[int, int], x: int, y: int, radius: int,
+                mask: np.ndarray) -> Window:
+    """Cut a (2r + 1)^2 mask centered on (x, y) down to the grid"""
+    height, width = shape
+    top, left = max(0, y - radius), max(0, x - radius)
+    bottom = min(height, y + radius + 1)
+    right = min(width, x + radius + 1)
+    inner = mask[top - (y - radius):bottom - (y - radius),
+                 left - (x - radius):right - (x - radius)]
+    return (slice(top, bottom), slice(left, right)), inner
+
+def stencil_window(shape: Tuple[int, int], x: int, y: int,
+                   radius: int) -> Window:
+    """Everything within `radius` of (x, y), walls or not"""
+    return clip_window(shape, x, y, radius, circle_stencil(radius))
+
+class ShadowCaster:
+    """Line-of-sight field of view over a maze, cached per (cell, radius).
+
+    Recursive shadow casting: each octant is scanned row by row outward
+    from the viewer, and a wall narrows the range of slopes still lit
+    beyond it. Walls themselves are lit, so the player sees the wall
+    faces around them. A maze has few distinct (cell, radius) views, so
+    after the first visit a view costs one dictionary lookup.
+    """
+
+    def __init__(self, maze: Maze, max_views: int = 4096):
+        self.maze = maze
+        self.max_views = max_views
+        self.views: Dict[Tuple[int, int, int], Window] = {}
+
+    def view(self, x: int, y: int, radius: int) -> Window:
+        key = (x, y, radius)
+        window = self.views.get(key)
+        if window is None:
+            if len(self.views) >= self.max_views:
+                self.views.clear()
+            mask = np.zeros((2 * radius + 1, 2 * radius + 1), dtype=bool)
+            mask[radius, radius] = True
+            for transform in OCTANTS:
+                self.cast(mask, x, y, radius, 1, 1.0, 0.0, transform)
+            window = clip_window(self.maze.shape, x, y, radius, mask)
+            self.views[key] = window
+        return window
+
+    def blocks(self, x: int, y: int) -> bool:
+        height, width = self.maze.shape
+        return not (0 <= x < width and 0 <= y < height) or \
+            self.maze[y, x] != 0
+
+    def cast(self, mask: np.ndarray, x: int, y: int, radius: int, row: int,
+             start: float, end: float, transform: Tuple[int, int, int, int]):
+        """Light one octant from `row` outward between two slopes"""
+        if start < end:
+            return
+        xx, xy, yx, yy = transform
+        radius_squared = radius * radius
+        for distance in range(row, radius + 1):
+            blocked = False
+            next_start = start
+            dy = -distance
+            for dx in range(-distance, 1):
+                # Slopes through the cell's far and near corners
+                left = (dx - 0.5) / (dy + 0.5)
+                right = (dx + 0.5) / (dy - 0.5)
+                if start < right:
+                    continue
+                if end > left:
+                    break
+                offset_x = dx * xx + dy * xy
+                offset_y = dx * yx + dy * yy
+                if dx * dx + dy * dy <= radius_squared:
+                    mask[radius + offset_y, radius + offset_x] = True
+                wall = self.blocks(x + offset_x, y + offset_y)
+                if blocked:
+                    if wall:
+                        next_start = right
+                    else:
+                        blocked = False
+                        start = next_start
+                elif wall and distance < radius:
+                    blocked = True
+                    self.cast(mask, x, y, radius, distance + 1, start, left,
+                              transform)
+                    next_start = right
+            if blocked:
+                break
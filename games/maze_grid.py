@@ -0,0 +1,259 @@
+import random
+import numpy as np
+from collections import deque
+from typing import Iterable, Optional, Tuple, Union
+from .maze_pack import PackedMaze
+
+# Mazes are indexed [y, x]: 1 is wall, 0 is path. They are held as
+# PackedMaze; the functions below also take plain int grids.
+Maze = Union[PackedMaze, np.ndarray]
+
+def carve_maze(width: int, height: int, start: Tuple[int, int] = (1, 1),
+               rng: random.Random = random) -> PackedMaze:
+    """Recursive-backtracker maze, carved with an explicit stack.
+
+    Paths are carved two cells at a time from `start`. Each cell shuffles
+    its directions once, on entry, and the stack keeps where each cell is
+    in its own order, so `rng` is used exactly as a recursive carve would
+    use it while grid size is no longer bounded by the recursion limit.
+    """
+    cells = bytearray(b'\x01') * (width * height)
+    x, y = start
+    cells[y * width + x] = 0
+    directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
+    order = directions[:]
+    rng.shuffle(order)
+    stack = [(x, y, iter(order))]
+    while stack:
+        x, y, remaining = stack[-1]
+        for dx, dy in remaining:
+            new_x, new_y = x + dx, y + dy
+            if (0 <= new_x < width and 0 <= new_y < height and
+                    cells[new_y * width + new_x]):
+                cells[(y + dy // 2) * width + x + dx // 2] = 0
+                cells[new_y * width + new_x] = 0
+                order = directions[:]
+                rng.shuffle(order)
+                stack.append((new_x, new_y, iter(order)))
+                break
+        else:
+            stack.pop()
+    return PackedMaze.pack(
+        np.frombuffer(cells, dtype=np.uint8).reshape(height, width))
+
+def padded_walls(maze: Maze) -> np.ndarray:
+    """uint8 wall grid with a border of walls, so neighbours of any cell
+    inside never need a bounds check"""
+    height, width = maze.shape
+    walls = np.ones((height + 2, width + 2), dtype=np.uint8)
+    if isinstance(maze, PackedMaze):
+        walls[1:-1, 1:-1] = maze.unpack()
+    else:
+        walls[1:-1, 1:-1] = maze != 0
+    return walls
+
+def flood_fill(maze: Maze, start: Tuple[int, int]) -> np.ndarray:
+    """Boolean mask of the path cells reachable from `start`.
+
+    One breadth-first pass over flat indices of padded_walls().
+    """
+    height, width = maze.shape
+    stride = width + 2
+    walls = padded_walls(maze)
+    # Reached cells are marked as walls, so one lookup covers both checks
+    blocked = bytearray(walls.tobytes())
+    x, y = start
+    first = (y + 1) * stride + x + 1
+    if not blocked[first]:
+        blocked[first] = 1
+        queue = deque([first])
+        steps = (1, -1, stride, -stride)
+        while queue:
+            cell = queue.popleft()
+            for step in steps:
+                neighbour = cell + step
+                if not blocked[neighbour]:
+                    blocked[neighbour] = 1
+                    queue.append(neighbour)
+    filled = np.frombuffer(blocked, dtype=np.uint8).reshape(height + 2, stride)
+    return (filled > walls)[1:-1, 1:-1]
+
+def distance_field(maze: Maze, sources: Iterable[Tuple[int, int]]
+                   ) -> np.ndarray:
+    """Walking distance from the nearest source to every path cell.
+
+    Multi-source breadth-first search over flat indices. Walls and cells
+    no source can reach are -1.
+    """
+    height, width = maze.shape
+    stride = width + 2
+    walls = padded_walls(maze)
+    blocked = bytearray(walls.tobytes())
+    distances = [-1] * len(blocked)
+    queue = deque()
+    for x, y in sources:
+        cell = (y + 1) * stride + x + 1
+        if not blocked[cell]:
+            blocked[cell] = 1
+            distances[cell] = 0
+            queue.append(cell)
+    steps = (1, -1, stride, -stride)
+    while queue:
+        cell = queue.popleft()
+        distance = distances[cell] + 1
+        for step in steps:
+            neighbour = cell + step
+            if not blocked[neighbour]:
+                blocked[neighbour] = 1
+                distances[neighbour] = distance
+                queue.append(neighbour)
+    return np.array(distances).reshape(height + 2, stride)[1:-1, 1:-1].copy()
+
+def relax_distances(maze: Maze, distances: np.ndarray,
+                    source: Tuple[int, int]):
+    """Add a source to a distance_field() result, in place.
+
+    The search stops wherever the field is already no farther than the
+    new source, so only the cells that get closer are visited.
+    """
+    height, width = maze.shape
+    x, y = source
+    if maze[y, x] != 0 or distances[y, x] == 0:
+        return
+    distances[y, x] = 0
+    queue = deque([(x, y, 0)])
+    while queue:
+        x, y, distance = queue.popleft()
+        distance += 1
+        for new_x, new_y in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (0 <= new_x < width and 0 <= new_y < height and
+                    maze[new_y, new_x] == 0):
+                current = distances[new_y, new_x]
+                if current < 0 or distance < current:
+                    distances[new_y, new_x] = distance
+                    queue.append((new_x, new_y, distance))
+
+def farthest_cell(distances: np.ndarray, candidates: np.ndarray
+                  ) -> Optional[Tuple[int, int]]:
+    """(x, y) of the candidate farthest by `distances`, first in row order
+    on ties, or None if there are no reachable candidates"""
+    scores = np.where(candidates, distances, -1)
+    index = int(np.argmax(scores))
+    if scores.flat[index] < 0:
+        return None
+    y, x = divmod(index, distances.shape[1])
+    return x, y
+
+def cut_cells(maze: Maze, start: Tuple[int, int],
+              terminals: Iterable[Tuple[int, int]]
+              ) -> Tuple[np.ndarray, np.ndarray]:
+    """Which path cells can be walled off without stranding a terminal.
+
+    One iterative Tarjan depth-first search from `start`. Returns two
+    boolean masks:
+    - critical: walling the cell would cut some terminal off from
+      `start`. That is the start, the terminals and every articulation
+      point with a terminal beyond it.
+    - on_cycle: the cell lies on a cycle. Only cells sharing a cycle can
+      form a separating pair, so after walling a cell that is not on a
+      cycle the critical mask is still exact for the rest of the maze.
+    Cells not reachable from `start` are in neither mask.
+    """
+    height, width = maze.shape
+    stride = width + 2
+    walls = padded_walls(maze)
+    blocked = walls.ravel().tolist()
+    size = len(blocked)
+    critical = bytearray(size)
+    on_cycle = bytearray(size)
+
+    def unpad(mask: bytearray) -> np.ndarray:
+        return np.frombuffer(mask, dtype=bool).reshape(
+            height + 2, stride)[1:-1, 1:-1]
+
+    x, y = start
+    root = (y + 1) * stride + x + 1
+    if blocked[root]:
+        return unpad(critical), unpad(on_cycle)
+
+    # Terminals below each cell in the search tree, summed on the way up
+    below = [0] * size
+    for x, y in terminals:
+        below[(y + 1) * stride + x + 1] = 1
+        critical[(y + 1) * stride + x + 1] = 1
+    critical[root] = 1
+
+    order = [0] * size  # Discovery time, 0 while unvisited
+    low = [0] * size
+    parent = [-1] * size
+    next_step = [0] * size
+    steps = (1, -1, stride, -stride)
+    clock = 1
+    order[root] = low[root] = clock
+    stack = [root]
+    while stack:
+        cell = stack[-1]
+        step = next_step[cell]
+        if step < 4:
+            next_step[cell] = step + 1
+            neighbour = cell + steps[step]
+            if blocked[neighbour]:
+                continue
+            if not order[neighbour]:
+                clock += 1
+                order[neighbour] = low[neighbour] = clock
+                parent[neighbour] = cell
+                stack.append(neighbour)
+            elif neighbour != parent[cell]:
+                # Back edge
+                if order[neighbour] < low[cell]:
+                    low[cell] = order[neighbour]
+                on_cycle[cell] = on_cycle[neighbour] = 1
+            continue
+
+        stack.pop()
+        up = parent[cell]
+        if up < 0:
+            continue
+        if low[cell] < low[up]:
+            low[up] = low[cell]
+        below[up] += below[cell]
+        if low[cell] <= order[up]:
+            # Not a bridge
+            on_cycle[cell] = on_cycle[up] = 1
+        if low[cell] >= order[up] and below[cell]:
+            # Nothing below `cell` reaches above `up`, and a terminal does
+            critical[up] = 1
+    return unpad(critical), unpad(on_cycle)
+
+# Arrival step of cells a wavefront() never reaches
+NEVER = np.iinfo(np.int32).max
+
+def wavefront(maze: Maze, source: Tuple[int, int], max_steps: int
+              ) -> np.ndarray:
+    """Step at which a wave from `source` reaches each cell, or NEVER.
+
+    The wave spreads one cell per step through open cells only, so it
+    follows the corridors rather than passing through walls. A wall is
+    reached one step after the open cell beside it, and stops the wave.
+    Each step is a handful of whole-array operations.
+    """
+    walls = padded_walls(maze).astype(bool)
+    arrival = np.full(walls.shape, NEVER, dtype=np.int32)
+    frontier = np.zeros(walls.shape, dtype=bool)
+    x, y = source
+    frontier[y + 1, x + 1] = True
+    arrival[y + 1, x + 1] = 0
+    reached = frontier.copy()
+    grown = np.zeros(walls.shape, dtype=bool)
+    for step in range(1, max_steps + 1):
+        # Neighbours of the frontier; the border is never grown into
+        grown[1:-1, 1:-1] = (frontier[:-2, 1:-1] | frontier[2:, 1:-1] |
+                             frontier[1:-1, :-2] | frontier[1:-1, 2:])
+        new = grown & ~reached
+        if not new.any():
+            break
+        arrival[new] = step
+        reached |= new
+        frontier = new & ~walls
+    return arrival[1:-1, 1:-1].copy()
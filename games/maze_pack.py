@@ -0,0 +1,240 @@
+import atexit
+import os
+import queue
+import struct
+import threading
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Item and trap placements are (x, y, type)
+Placement = Tuple[int, int, str]
+
+class PackedMaze:
+    """Maze walls at one bit per cell.
+
+    Each row is packed on its own with np.packbits, most significant bit
+    first, so rows can be sliced, stacked and memory-mapped without
+    repacking. Indexing with [y, x] reads and writes single cells like
+    the int grids mazes used to be (1 is wall, 0 is path), so per-cell
+    code works on the packed form unchanged. Whole-grid passes call
+    unpack() for the rows they need.
+    """
+
+    __slots__ = ('bits', 'width', 'height')
+
+    def __init__(self, bits: np.ndarray, width: int):
+        self.bits = bits
+        self.width = width
+        self.height = len(bits)
+
+    @classmethod
+    def pack(cls, grid: np.ndarray) -> 'PackedMaze':
+        """Pack a grid where any non-zero cell is a wall"""
+        return cls(np.packbits(np.asarray(grid) != 0, axis=1),
+                   grid.shape[1])
+
+    @classmethod
+    def stack(cls, mazes: Sequence['PackedMaze']) -> 'PackedMaze':
+        """Mazes of one width, one below the other"""
+        return cls(np.vstack([maze.bits for maze in mazes]), mazes[0].width)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes
+
+    def __getitem__(self, cell: Tuple[int, int]) -> int:
+        y, x = cell
+        return (int(self.bits[y, x >> 3]) >> (7 - (x & 7))) & 1
+
+    def __setitem__(self, cell: Tuple[int, int], wall: int):
+        y, x = cell
+        if wall:
+            self.bits[y, x >> 3] |= 0x80 >> (x & 7)
+        else:
+            self.bits[y, x >> 3] &= ~(0x80 >> (x & 7)) & 0xFF
+
+    def copy(self) -> 'PackedMaze':
+        return PackedMaze(self.bits.copy(), self.width)
+
+    def unpack(self, top: int = 0, bottom: Optional[int] = None
+               ) -> np.ndarray:
+        """Rows top..bottom as a uint8 grid, 1 for walls"""
+        return np.unpackbits(self.bits[top:bottom], axis=1,
+                             count=self.width)
+
+    def count_walls(self) -> int:
+        # Padding bits past the last column are always zero
+        return int(np.unpackbits(self.bits).sum())
+
+# On-disk maze libraries, little-endian throughout:
+#   header   magic, format version, maze count
+#   index    one entry per maze: seed, size, table lengths, data offset
+#   data     per maze: item table, trap table, packed wall rows
+# The file is memory-mapped, so opening it reads only the header and
+# index; a maze's rows are paged in as they are touched.
+MAGIC = b'EMZL'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHI')
+INDEX_DTYPE = np.dtype([('seed', '<u8'), ('width', '<u4'), ('height', '<u4'),
+                        ('items', '<u4'), ('traps', '<u4'),
+                        ('offset', '<u8')])
+PLACEMENT_DTYPE = np.dtype([('x', '<u2'), ('y', '<u4'), ('kind', 'u1')])
+KINDS = ('key', 'coin', 'treasure', 'spikes', 'pit')
+
+def placement_table(placements: List[Placement]) -> np.ndarray:
+    return np.array([(x, y, KINDS.index(kind)) for x, y, kind in placements],
+                    dtype=PLACEMENT_DTYPE)
+
+def placement_list(table: np.ndarray) -> List[Placement]:
+    return [(int(x), int(y), KINDS[kind]) for x, y, kind in table.tolist()]
+
+def write_library(path: str,
+                  mazes: Iterable[Tuple[int, PackedMaze, List[Placement],
+                                        List[Placement]]]):
+    """Write (seed, maze, collectibles, traps) entries to one file.
+
+    The file is written next to `path` and moved into place, so a library
+    that is open elsewhere keeps its old contents mapped.
+    """
+    entries = [(seed, maze, placement_table(collectibles),
+                placement_table(traps))
+               for seed, maze, collectibles, traps in mazes]
+    index = np.zeros(len(entries), dtype=INDEX_DTYPE)
+    offset = HEADER.size + index.nbytes
+    for row, (seed, maze, items, traps) in enumerate(entries):
+        index[row] = (seed, maze.width, maze.height, len(items), len(traps),
+                      offset)
+        offset += items.nbytes + traps.nbytes + maze.nbytes
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(entries)))
+        file.write(index.tobytes())
+        for _, maze, items, traps in entries:
+            file.write(items.tobytes())
+            file.write(traps.tobytes())
+            file.write(np.ascontiguousarray(maze.bits).tobytes())
+    os.replace(temp_path, path)
+
+class MazeLibrary:
+    """Read-only, memory-mapped view of a file from write_library()"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data = np.memmap(path, dtype=np.uint8, mode='r')
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"{path} is not a maze library")
+        magic, version, count = HEADER.unpack(bytes(self.data[:HEADER.size]))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a maze library")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"{path} has maze format version {version}, "
+                f"expected {FORMAT_VERSION}")
+        self.index = self.data[HEADER.size:
+                               HEADER.size + count * INDEX_DTYPE.itemsize
+                               ].view(INDEX_DTYPE)
+        self.rows: Dict[int, int] = {
+            int(seed): row for row, seed in enumerate(self.index['seed'])}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, seed: int) -> bool:
+        return seed in self.rows
+
+    def seeds(self) -> List[int]:
+        return list(self.rows)
+
+    def load(self, seed: int
+             ) -> Tuple[PackedMaze, List[Placement], List[Placement]]:
+        """The maze stored for `seed`; its rows stay on disk until read"""
+        entry = self.index[self.rows[seed]]
+        width, height = int(entry['width']), int(entry['height'])
+        start = int(entry['offset'])
+        items_end = start + int(entry['items']) * PLACEMENT_DTYPE.itemsize
+        traps_end = items_end + int(entry['traps']) * PLACEMENT_DTYPE.itemsize
+        stride = (width + 7) // 8
+        bits = self.data[traps_end:traps_end + height * stride].reshape(
+            height, stride)
+        return (PackedMaze(bits, width),
+                placement_list(self.data[start:items_end].view(
+                    PLACEMENT_DTYPE)),
+                placement_list(self.data[items_end:traps_end].view(
+                    PLACEMENT_DTYPE)))
+
+class LibraryWriter:
+    """Adds mazes to a library file on a background thread.
+
+    save() only queues the maze, so the game loop never touches the disk.
+    The writer thread reads the current file, adds the maze, keeps the
+    newest `size` and moves the new file into place. `version` goes up
+    after every successful write, so readers know to reopen the library.
+    """
+
+    def __init__(self, path: str, size: int = 32):
+        self.path = path
+        self.size = size
+        self.writes: queue.Queue = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.version = 0
+        self.failed_writes = 0
+
+    def save(self, seed: int, maze: PackedMaze,
+             collectibles: List[Placement], traps: List[Placement]):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.writer,
+                                           name='maze-library', daemon=True)
+            self.thread.start()
+            atexit.register(self.close)
+        self.writes.put((seed, maze, collectibles, traps))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued mazes are on disk; False if timed out"""
+        if self.thread is None:
+            return True
+        done = threading.Event()
+        self.writes.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.writes.put(None)
+        self.thread.join(timeout=5)
+
+    def writer(self):
+        while True:
+            entry = self.writes.get()
+            if entry is None:
+                break
+            if isinstance(entry, threading.Event):
+                entry.set()
+                continue
+            try:
+                self.write(entry)
+            except OSError as error:
+                # The maze can still be rebuilt from its seed
+                self.failed_writes += 1
+                print(f"Could not save maze {entry[0]}: {error}")
+            else:
+                self.version += 1
+
+    def write(self, entry: Tuple[int, PackedMaze, List[Placement],
+                                 List[Placement]]):
+        entries = []
+        if os.path.exists(self.path):
+            try:
+                library: Optional[MazeLibrary] = MazeLibrary(self.path)
+            except ValueError:
+                # Not a library of this version; this write replaces it
+                library = None
+            if library is not None:
+                entries = [(seed, *library.load(seed))
+                           for seed in library.seeds() if seed != entry[0]]
+        entries.append(entry)
+        write_library(self.path, entries[-self.size:])
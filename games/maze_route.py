@@ -0,0 +1,162 @@
+import heapq
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from .maze_grid import Maze, padded_walls
+
+Cell = Tuple[int, int]
+
+INFINITY = float('inf')
+
+class DStarLite:
+    """Shortest route from a moving start to one goal, kept up to date.
+
+    D* Lite searches backwards from the goal, so when the player moves
+    only the key offset km grows, and the cells whose costs changed are
+    the only ones re-expanded. Cells are flat indices into the padded wall
+    grid, so neighbours need no bounds checks. The priority queue drops
+    stale entries lazily instead of removing them.
+    """
+
+    def __init__(self, maze: Maze, goal: Cell, blocked: Iterable[Cell] = ()):
+        self.stride = stride = maze.shape[1] + 2
+        self.walls = bytearray(padded_walls(maze).tobytes())
+        for x, y in blocked:
+            self.walls[self.index(x, y)] = 1
+        size = len(self.walls)
+        self.g = [INFINITY] * size
+        self.rhs = [INFINITY] * size
+        self.steps = (1, -1, stride, -stride)
+        self.goal = self.index(*goal)
+        self.start = self.goal
+        self.km = 0
+        self.queue: List[Tuple[float, float, int]] = []
+        self.queued: Dict[int, Tuple[float, float]] = {}
+        self.rhs[self.goal] = 0
+        self.push(self.goal)
+        self.route_cache: Optional[List[Cell]] = None
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def cell(self, index: int) -> Cell:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def heuristic(self, a: int, b: int) -> int:
+        ay, ax = divmod(a, self.stride)
+        by, bx = divmod(b, self.stride)
+        return abs(ax - bx) + abs(ay - by)
+
+    def key(self, cell: int) -> Tuple[float, float]:
+        best = min(self.g[cell], self.rhs[cell])
+        return best + self.heuristic(self.start, cell) + self.km, best
+
+    def push(self, cell: int):
+        key = self.key(cell)
+        self.queued[cell] = key
+        heapq.heappush(self.queue, (key[0], key[1], cell))
+
+    def top_key(self) -> Tuple[float, float]:
+        queue, queued = self.queue, self.queued
+        while queue:
+            k1, k2, cell = queue[0]
+            if queued.get(cell) == (k1, k2):
+                return k1, k2
+            heapq.heappop(queue)
+        return INFINITY, INFINITY
+
+    def update_cell(self, cell: int):
+        if cell != self.goal:
+            best = INFINITY
+            if not self.walls[cell]:
+                g, walls = self.g, self.walls
+                for step in self.steps:
+                    neighbour = cell + step
+                    if not walls[neighbour] and g[neighbour] + 1 < best:
+                        best = g[neighbour] + 1
+            self.rhs[cell] = best
+        self.queued.pop(cell, None)
+        if self.g[cell] != self.rhs[cell]:
+            self.push(cell)
+
+    def compute(self):
+        g, rhs, walls, queued = self.g, self.rhs, self.walls, self.queued
+        start = self.start
+        while (self.top_key() < self.key(start) or
+               rhs[start] != g[start]):
+            k1, k2, cell = heapq.heappop(self.queue)
+            del queued[cell]
+            new_key = self.key(cell)
+            if (k1, k2) < new_key:
+                self.push(cell)
+            elif g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+                for step in self.steps:
+                    if not walls[cell + step]:
+                        self.update_cell(cell + step)
+            else:
+                g[cell] = INFINITY
+                self.update_cell(cell)
+                for step in self.steps:
+                    if not walls[cell + step]:
+                        self.update_cell(cell + step)
+            if not self.queue:
+                break
+
+    def move_start(self, x: int, y: int):
+        start = self.index(x, y)
+        if start != self.start:
+            self.km += self.heuristic(self.start, start)
+            self.start = start
+            self.route_cache = None
+
+    def distance(self, start: Cell) -> Optional[int]:
+        """Steps from `start` to the goal, or None if it is cut off"""
+        self.move_start(*start)
+        self.compute()
+        distance = self.g[self.start]
+        return None if distance == INFINITY else int(distance)
+
+    def route(self, start: Cell) -> List[Cell]:
+        """Cells from `start` to the goal inclusive, empty if cut off"""
+        if self.distance(start) is None:
+            return []
+        if self.route_cache is None:
+            g, walls = self.g, self.walls
+            cell = self.start
+            route = [self.cell(cell)]
+            while cell != self.goal:
+                # Each step goes to the neighbour one closer to the goal
+                cell = min((cell + step for step in self.steps
+                            if not walls[cell + step]), key=g.__getitem__)
+                route.append(self.cell(cell))
+                if len(route) > len(g):
+                    return []
+            self.route_cache = route
+        return self.route_cache
+
+class RouteCache:
+    """One DStarLite per target, most recently used kept.
+
+    Returning to a target reuses its search, so switching between hint
+    targets or chunks costs only the repair for the player's movement.
+    """
+
+    def __init__(self, max_planners: int = 8):
+        self.max_planners = max_planners
+        self.planners: 'OrderedDict[Hashable, DStarLite]' = OrderedDict()
+
+    def get(self, key: Hashable,
+            create: Callable[[], DStarLite]) -> DStarLite:
+        planner = self.planners.get(key)
+        if planner is None:
+            planner = create()
+            self.planners[key] = planner
+            if len(self.planners) > self.max_planners:
+                self.planners.popitem(last=False)
+        else:
+            self.planners.move_to_end(key)
+        return planner
+
+    def clear(self):
+        self.planners.clear()
@@ -0,0 +1,187 @@
+import random
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from .maze_pack import PackedMaze
+
+def carve_band(width: int, cell_rows: int, rng: random.Random,
+               entrance: Optional[int] = None) -> PackedMaze:
+    """A band of maze rows carved with Eller's algorithm.
+
+    The band is 2 * cell_rows grid rows tall. Cells sit on odd rows and
+    columns, and row 0 is the wall above the band, opened at column
+    `entrance` if one is given. Eller's algorithm only keeps the set
+    labels of the current row, so memory does not grow with the number
+    of rows carved. The last row joins every remaining set, making each
+    band a perfect maze on its own; bands stacked through one entrance
+    each stay a perfect maze.
+    """
+    maze = np.ones((2 * cell_rows, width), dtype=np.uint8)
+    columns = list(range(1, width, 2))
+    if entrance is not None:
+        maze[0, entrance] = 0
+
+    sets = list(range(len(columns)))
+    next_set = len(sets)
+    for row in range(cell_rows):
+        y = 2 * row + 1
+        last = row == cell_rows - 1
+        maze[y, columns] = 0
+
+        # Join neighbouring cells of different sets, all of them last
+        for i in range(len(columns) - 1):
+            if sets[i] != sets[i + 1] and (last or rng.random() < 0.5):
+                maze[y, columns[i] + 1] = 0
+                merged = sets[i + 1]
+                sets = [sets[i] if s == merged else s for s in sets]
+        if last:
+            break
+
+        # Every set continues down through at least one of its cells
+        members: Dict[int, List[int]] = {}
+        for i, s in enumerate(sets):
+            members.setdefault(s, []).append(i)
+        below: List[Optional[int]] = [None] * len(columns)
+        for s, cells in members.items():
+            rng.shuffle(cells)
+            for n, i in enumerate(cells):
+                if n == 0 or rng.random() < 0.3:
+                    maze[y + 1, columns[i]] = 0
+                    below[i] = s
+        for i in range(len(columns)):
+            if below[i] is None:
+                below[i] = next_set
+                next_set += 1
+        sets = below
+    return PackedMaze.pack(maze)
+
+class MazeChunk:
+    """One band of an endless maze and the player's progress through it.
+
+    `top` is the band's first row in world coordinates; `visible` and
+    `visited` are indexed by local row. The game stores its items and
+    render layer on the chunk, so they are dropped along with it.
+    `collected` holds the indices of items taken on an earlier visit.
+    """
+
+    __slots__ = ('index', 'top', 'maze', 'entrance', 'exit', 'visible',
+                 'visited', 'collected', 'collectibles', 'traps', 'layer')
+
+    def __init__(self, index: int, top: int, maze: PackedMaze,
+                 entrance: Tuple[int, int], exit: Tuple[int, int]):
+        self.index = index
+        self.top = top
+        self.maze = maze
+        self.entrance = entrance
+        self.exit = exit
+        self.visible = np.zeros(maze.shape, dtype=bool)
+        self.visited = np.zeros(maze.shape, dtype=bool)
+        self.collected: Set[int] = set()
+        self.collectibles: List = []
+        self.traps: List = []
+        self.layer = None
+
+class StreamingMaze:
+    """Endless maze of fixed width that extends downwards in chunks.
+
+    Chunk i is carved from its own generator seeded with (seed, i), and
+    its entrance column is drawn from a second generator, so any chunk can
+    be rebuilt alone and knows where the next one opens. Only the
+    `max_chunks` most recently used chunks are kept. An evicted chunk
+    leaves behind its visited cells, bit-packed, and which items were
+    collected, for up to `max_saved` chunks; older chunks come back
+    unexplored. Memory therefore depends on the cache sizes, not on how
+    deep the player has gone.
+
+    `populate(chunk, rng)` places a new chunk's items, skipping those in
+    chunk.collected, and `release(chunk)` is called as a chunk is
+    evicted.
+    """
+
+    def __init__(self, width: int, cell_rows: int = 8,
+                 seed: Optional[int] = None,
+                 populate: Optional[Callable] = None,
+                 release: Optional[Callable] = None,
+                 max_chunks: int = 6, max_saved: int = 64):
+        self.width = width
+        self.cell_rows = cell_rows
+        self.chunk_height = 2 * cell_rows
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.populate = populate
+        self.release = release
+        self.max_chunks = max_chunks
+        self.max_saved = max_saved
+        self.chunks: 'OrderedDict[int, MazeChunk]' = OrderedDict()
+        self.saved: 'OrderedDict[int, Tuple[bytes, List[int]]]' = \
+            OrderedDict()
+
+    def entrance_column(self, index: int) -> int:
+        rng = random.Random(f"{self.seed}:{index}:entrance")
+        return rng.randrange(1, self.width, 2)
+
+    def chunk(self, index: int) -> MazeChunk:
+        chunk = self.chunks.get(index)
+        if chunk is not None:
+            self.chunks.move_to_end(index)
+            return chunk
+
+        rng = random.Random(f"{self.seed}:{index}")
+        top = index * self.chunk_height
+        if index == 0:
+            entrance, opening = (1, 1), None
+        else:
+            opening = self.entrance_column(index)
+            entrance = (opening, 1)
+        exit = (self.entrance_column(index + 1), self.chunk_height - 1)
+        chunk = MazeChunk(index, top,
+                          carve_band(self.width, self.cell_rows, rng, opening),
+                          entrance, exit)
+        self.restore(chunk)
+        if self.populate is not None:
+            self.populate(chunk, rng)
+
+        self.chunks[index] = chunk
+        while len(self.chunks) > self.max_chunks:
+            self.evict(next(iter(self.chunks)))
+        return chunk
+
+    def chunk_at(self, y: int) -> MazeChunk:
+        return self.chunk(y // self.chunk_height)
+
+    def chunks_between(self, top: int, bottom: int) -> List[MazeChunk]:
+        """Chunks overlapping world rows top..bottom, inclusive"""
+        first = max(0, top) // self.chunk_height
+        last = max(0, bottom) // self.chunk_height
+        return [self.chunk(index) for index in range(first, last + 1)]
+
+    def is_open(self, x: int, y: int) -> bool:
+        if y < 0 or not 0 <= x < self.width:
+            return False
+        chunk = self.chunk_at(y)
+        return chunk.maze[y - chunk.top, x] == 0
+
+    def rows(self, first_chunk: int, count: int) -> PackedMaze:
+        """Walls of `count` consecutive chunks stacked into one maze"""
+        return PackedMaze.stack([self.chunk(index).maze for index in
+                                 range(first_chunk, first_chunk + count)])
+
+    def evict(self, index: int):
+        chunk = self.chunks.pop(index)
+        collected = [i for i, item in enumerate(chunk.collectibles)
+                     if item.collected]
+        self.saved[index] = (np.packbits(chunk.visited).tobytes(), collected)
+        self.saved.move_to_end(index)
+        while len(self.saved) > self.max_saved:
+            self.saved.popitem(last=False)
+        if self.release is not None:
+            self.release(chunk)
+
+    def restore(self, chunk: MazeChunk):
+        state = self.saved.pop(chunk.index, None)
+        if state is None:
+            return
+        packed, collected = state
+        bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8),
+                             count=chunk.visited.size)
+        chunk.visited[:] = bits.reshape(chunk.visited.shape).astype(bool)
+        chunk.collected = set(collected)
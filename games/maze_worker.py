@@ -0,0 +1,289 @@
+import atexit
+import importlib
+import os
+import pickle
+import queue
+import random
+import subprocess
+import sys
+import threading
+import numpy as np
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from .maze_grid import (carve_maze, cut_cells, distance_field, farthest_cell,
+                        flood_fill, padded_walls, relax_distances)
+from .maze_pack import PackedMaze, Placement
+
+DIFFICULTIES = ('easy', 'normal', 'hard')
+
+# Score bounds between the difficulties. About a third of 20x15 mazes
+# fall in each.
+EASY_BELOW = 0.83
+HARD_FROM = 0.90
+
+class MazeLayout:
+    """A ready-to-play maze: walls, item and trap placements and grade.
+
+    `seed` rebuilds the same layout through build_layout().
+    """
+
+    __slots__ = ('seed', 'maze', 'collectibles', 'traps', 'grade',
+                 'difficulty')
+
+    def __init__(self, seed: int, maze: PackedMaze,
+                 collectibles: List[Placement], traps: List[Placement],
+                 grade: Dict[str, float]):
+        self.seed = seed
+        self.maze = maze
+        self.collectibles = collectibles
+        self.traps = traps
+        self.grade = grade
+        self.difficulty = difficulty_of(grade)
+
+def place_items(maze: PackedMaze, reachable: np.ndarray, total_keys: int,
+                total_coins: int, num_traps: int,
+                rng: random.Random = random
+                ) -> Tuple[List[Placement], List[Placement]]:
+    """Collectible and trap placements for a maze entered at (1, 1)"""
+    # Items go on accessible cells other than the start, spread by
+    # farthest-point sampling over walking distance
+    collectibles: List[Placement] = []
+    available = reachable.copy()
+    available[1, 1] = False
+    from_start = distance_field(maze, [(1, 1)])
+
+    # Place keys far from the start and from each other
+    key_positions = []
+    nearest = from_start.copy()
+    for _ in range(total_keys):
+        pos = farthest_cell(nearest, available)
+        if pos is None:
+            break
+        key_positions.append(pos)
+        available[pos[1], pos[0]] = False
+        relax_distances(maze, nearest, pos)
+        collectibles.append((pos[0], pos[1], 'key'))
+
+    # Place coins spread out between the start, the keys and each other
+    nearest = distance_field(maze, [(1, 1)] + key_positions)
+    for _ in range(total_coins):
+        pos = farthest_cell(nearest, available)
+        if pos is None:
+            break
+        available[pos[1], pos[0]] = False
+        relax_distances(maze, nearest, pos)
+        collectibles.append((pos[0], pos[1], 'coin'))
+
+    # Place treasure at the furthest accessible point from start
+    pos = farthest_cell(from_start, available)
+    if pos is not None:
+        available[pos[1], pos[0]] = False
+        collectibles.append((pos[0], pos[1], 'treasure'))
+
+    remaining_positions = [
+        (x, y) for y, x in np.argwhere(available).tolist()]
+
+    # Place traps avoiding blocking paths. A trap is as good as a wall,
+    # so it may only go where no collectible depends on passing it.
+    traps: List[Placement] = []
+    num_traps = min(num_traps, len(remaining_positions))
+    trapped = maze.copy()
+    items = [(x, y) for x, y, _ in collectibles]
+    critical, on_cycle = cut_cells(trapped, (1, 1), items)
+    valid_positions = [pos for pos in remaining_positions
+                       if not critical[pos[1], pos[0]]]
+    for _ in range(num_traps):
+        if not valid_positions:
+            break
+
+        trap_pos = rng.choice(valid_positions)
+        valid_positions.remove(trap_pos)
+        trap_type = rng.choice(['spikes', 'pit'])
+        traps.append((trap_pos[0], trap_pos[1], trap_type))
+
+        # Walling a cell off can only make cells on a shared cycle
+        # critical, so the analysis is redone only for those traps
+        trapped[trap_pos[1], trap_pos[0]] = 1
+        if on_cycle[trap_pos[1], trap_pos[0]]:
+            critical, on_cycle = cut_cells(trapped, (1, 1), items)
+            valid_positions = [pos for pos in valid_positions
+                               if not critical[pos[1], pos[0]]]
+    return collectibles, traps
+
+def grade_maze(maze: PackedMaze, reachable: np.ndarray,
+               treasure: Tuple[int, int]) -> Dict[str, float]:
+    """How hard a maze is to solve from (1, 1).
+
+    - path_length: walking distance to the treasure.
+    - dead_ends: reachable cells with a single open neighbour.
+    - branching: side exits per cell along the route to the treasure,
+      i.e. how often the player has to pick a way.
+    - score: the three combined, per reachable cell.
+    """
+    open_cells = padded_walls(maze) == 0
+    degree = (open_cells[:-2, 1:-1].astype(int) + open_cells[2:, 1:-1] +
+              open_cells[1:-1, :-2] + open_cells[1:-1, 2:])
+    degree[~reachable] = 0
+    dead_ends = int(np.count_nonzero(degree == 1))
+
+    x, y = treasure
+    from_start = distance_field(maze, [(1, 1)])
+    path_length = int(from_start[y, x])
+    # Cells on a shortest route are as far from both ends as the route
+    route = reachable & (from_start + distance_field(maze, [treasure]) ==
+                         path_length)
+    branching = float(np.maximum(degree - 2, 0)[route].sum() /
+                      max(1, np.count_nonzero(route)))
+
+    score = float((path_length * (1 + branching) + 2 * dead_ends) /
+                  max(1, np.count_nonzero(reachable)))
+    return {'path_length': path_length, 'dead_ends': dead_ends,
+            'branching': branching, 'score': score}
+
+def difficulty_of(grade: Dict[str, float]) -> str:
+    if grade['score'] < EASY_BELOW:
+        return 'easy'
+    if grade['score'] < HARD_FROM:
+        return 'normal'
+    return 'hard'
+
+def build_layout(width: int, height: int, total_keys: int, total_coins: int,
+                 num_traps: int, seed: Optional[int] = None) -> MazeLayout:
+    """Carve, populate and grade one maze, the same one for the same seed"""
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    rng = random.Random(seed)
+    while True:
+        maze = carve_maze(width, height, (1, 1), rng)
+        reachable = flood_fill(maze, (1, 1))
+        accessible = np.count_nonzero(reachable)
+
+        # Use the maze if at least 90% of paths are accessible and there
+        # is room for every item
+        paths = width * height - maze.count_walls()
+        if (accessible >= paths * 0.9 and
+                accessible >= total_keys + total_coins + 1):
+            break
+
+    collectibles, traps = place_items(maze, reachable, total_keys,
+                                      total_coins, num_traps, rng)
+    return graded_layout(seed, maze, collectibles, traps, reachable)
+
+def graded_layout(seed: int, maze: PackedMaze, collectibles: List[Placement],
+                  traps: List[Placement],
+                  reachable: Optional[np.ndarray] = None) -> MazeLayout:
+    """A layout from its parts, e.g. as read back from a MazeLibrary"""
+    if reachable is None:
+        reachable = flood_fill(maze, (1, 1))
+    treasure = next(((x, y) for x, y, kind in collectibles
+                     if kind == 'treasure'), (1, 1))
+    return MazeLayout(seed, maze, collectibles, traps,
+                      grade_maze(maze, reachable, treasure))
+
+def pregenerate(output, settings: Tuple[int, int, int, int, int]):
+    """Worker process: write layouts to `output` until the game stops reading"""
+    rng = random.Random()
+    try:
+        while True:
+            layout = build_layout(*settings, seed=rng.randrange(2 ** 32))
+            # Blocks while the pipe is full, so the worker idles once the
+            # game has enough layouts
+            pickle.dump(layout, output)
+            output.flush()
+    except OSError:
+        # The game closed its end of the pipe
+        pass
+
+class MazePregenerator:
+    """Builds mazes ahead of time in a separate process.
+
+    Maze generation is pure Python, so a thread would still take time
+    from the game loop; a process does not. The worker runs this module
+    with `python -m`, so it imports neither pygame nor the game's main
+    script. Its layouts come back pickled over a pipe, and a reader thread
+    fills a bounded queue from it. take() moves what has arrived into one
+    small buffer per difficulty before picking from the requested one.
+    take() never waits: it returns None when no matching maze is ready,
+    and the caller builds one itself. If no process can be started, every
+    take() misses.
+    """
+
+    def __init__(self, width: int, height: int, total_keys: int,
+                 total_coins: int, num_traps: int, per_difficulty: int = 2,
+                 queue_size: int = 4):
+        self.settings = (width, height, total_keys, total_coins, num_traps)
+        self.ready: Dict[str, Deque[MazeLayout]] = {
+            difficulty: deque(maxlen=per_difficulty)
+            for difficulty in DIFFICULTIES}
+        self.layouts: 'queue.Queue[MazeLayout]' = queue.Queue(queue_size)
+        self.process: Optional[subprocess.Popen] = None
+        self.started = False
+
+    def start(self):
+        """Start the worker; later calls do nothing"""
+        if self.started:
+            return
+        self.started = True
+        # The worker imports this package from the directory holding it
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, '-m', __name__,
+                 *(str(setting) for setting in self.settings)],
+                cwd=root, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+        except OSError:
+            self.process = None
+            return
+        threading.Thread(target=self.read_layouts, args=(self.process.stdout,),
+                         name='maze-pregenerator', daemon=True).start()
+        atexit.register(self.close)
+
+    def read_layouts(self, output):
+        """Reader thread: move layouts from the pipe to the queue"""
+        try:
+            while True:
+                layout = pickle.load(output)
+                while self.process is not None:
+                    try:
+                        self.layouts.put(layout, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                else:
+                    return
+        except (EOFError, OSError, ValueError, pickle.UnpicklingError):
+            # The worker exited or close() shut the pipe
+            return
+
+    def collect(self):
+        """Move finished layouts from the worker into the buffers"""
+        while True:
+            try:
+                layout = self.layouts.get_nowait()
+            except queue.Empty:
+                return
+            # Full buffers drop their oldest layout
+            self.ready[layout.difficulty].append(layout)
+
+    def take(self, difficulty: str) -> Optional[MazeLayout]:
+        self.collect()
+        ready = self.ready.get(difficulty)
+        return ready.popleft() if ready else None
+
+    def close(self):
+        process, self.process = self.process, None
+        if process is None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        process.stdout.close()
+
+if __name__ == '__main__':
+    # Layouts are built by the package module rather than __main__, so
+    # they unpickle as its classes in the game
+    worker = importlib.import_module(__spec__.name)
+    worker.pregenerate(sys.stdout.buffer,
+                       tuple(int(arg) for arg in sys.argv[1:]))
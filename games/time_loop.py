@@ -3,9 +3,20 @@ import random
 import math
 from typing import List, Dict, Tuple
 import os
+from utils.game_clock import GameClock
+from utils.glow_cache import glow_cache
+from utils.object_pool import ObjectPool
+from utils.score_store import score_store
+from utils.surface_factory import surface_factory
+from utils.text_cache import text_cache
 
 class Notification:
+    __slots__ = ('text', 'color', 'duration', 'alpha', 'fade_in')
+    
     def __init__(self, text: str, color: Tuple[int, int, int], duration: int = 120):
+        self.reset(text, color, duration)
+        
+    def reset(self, text: str, color: Tuple[int, int, int], duration: int = 120):
         self.text = text
         self.color = color
         self.duration = duration
@@ -30,8 +41,8 @@ class LoopEffect:
         self.height = height
         self.progress = 0
         self.active = False
-        self.surface = pygame.Surface((width, height))
-        self.noise_surface = pygame.Surface((width, height))
+        self.surface = surface_factory.create((width, height))
+        self.noise_surface = surface_factory.create((width, height))
         
     def start(self):
         self.active = True
@@ -90,12 +101,15 @@ class TimeLoopDefender:
         self.STATE_GAME_OVER = 'game_over'
         
         # Load fonts
-        self.title_font = pygame.font.Font(None, 74)
-        self.hud_font = pygame.font.Font(None, 36)
-        self.alert_font = pygame.font.Font(None, 48)
+        self.title_font = text_cache.get_font(74)
+        self.hud_font = text_cache.get_font(36)
+        self.alert_font = text_cache.get_font(48)
         
         # Initialize effects
         self.loop_effect = LoopEffect(self.WINDOW_SIZE[0], self.WINDOW_SIZE[1])
+        self.score_panel = None  # Gradient is drawn once, on first use
+        self.notification_pool = ObjectPool(Notification)
+        self.notifications = self.notification_pool.active
         
         # Initialize game
         self.reset_game()
@@ -112,7 +126,7 @@ class TimeLoopDefender:
         self.bullets = []
         self.past_actions = []  # Actions from previous rounds
         self.current_actions = []  # Actions in current round
-        self.notifications = []
+        self.notification_pool.release_all()
         self.stats = {
             'damage_dealt': 0,
             'enemies_defeated': 0,
@@ -120,16 +134,25 @@ class TimeLoopDefender:
         }
         
     def add_notification(self, text: str, color: Tuple[int, int, int]):
-        self.notifications.append(Notification(text, color))
+        self.notification_pool.acquire(text, color)
         
     def update_notifications(self):
-        self.notifications = [n for n in self.notifications if n.update()]
+        # Notifications are stacked on screen, so keep their order rather
+        # than swap-removing
+        live = []
+        for notification in self.notifications:
+            if notification.update():
+                live.append(notification)
+            else:
+                self.notification_pool.recycle(notification)
+        self.notifications[:] = live
         
     def draw_notifications(self, screen):
         for i, notification in enumerate(self.notifications):
-            text_surface = self.alert_font.render(notification.text, True,
-                                                notification.color)
-            text_surface.set_alpha(notification.alpha)
+            text_surface = text_cache.render(self.alert_font,
+                                             notification.text,
+                                             notification.color,
+                                             alpha=notification.alpha)
             text_rect = text_surface.get_rect(
                 center=(self.WINDOW_SIZE[0]//2,
                        self.WINDOW_SIZE[1]//2 - 100 + i*60))
@@ -146,28 +169,25 @@ class TimeLoopDefender:
         
         # Draw health bar
         health_width = int(bar_width * (self.base_health / 100))
+        health_color = (
+            min(255, 510 * (1 - self.base_health/100)),  # Red
+            min(255, 510 * (self.base_health/100)),      # Green
+            0                                            # Blue
+        )
         if health_width > 0:
-            health_color = (
-                min(255, 510 * (1 - self.base_health/100)),  # Red
-                min(255, 510 * (self.base_health/100)),      # Green
-                0                                            # Blue
-            )
             pygame.draw.rect(screen, health_color,
                            (x, y, health_width, bar_height))
             
         # Draw glow effect
-        glow_surface = pygame.Surface((bar_width + 20, bar_height + 20),
-                                    pygame.SRCALPHA)
-        glow_alpha = int(127 + 127 * math.sin(pygame.time.get_ticks() * 0.005))
-        pygame.draw.rect(glow_surface,
-                        (*health_color, glow_alpha),
-                        (0, 0, bar_width + 20, bar_height + 20),
-                        5)
+        glow_intensity = (1 + math.sin(pygame.time.get_ticks() * 0.005)) / 2
+        glow_surface = glow_cache.get('frame',
+                                      (bar_width + 20, bar_height + 20),
+                                      health_color, glow_intensity)
         screen.blit(glow_surface, (x - 10, y - 10))
         
         # Draw health text
-        health_text = self.hud_font.render(f"HEALTH: {self.base_health}",
-                                         True, self.WHITE)
+        health_text = text_cache.render_counter(self.hud_font, "HEALTH: ",
+                                                self.base_health, self.WHITE)
         screen.blit(health_text, (x + bar_width + 20, y))
         
     def draw_score_panel(self, screen):
@@ -177,18 +197,20 @@ class TimeLoopDefender:
         x = 10
         y = 40
         
-        gradient_surface = pygame.Surface((panel_width, panel_height))
-        for i in range(panel_height):
-            progress = i / panel_height
-            color = [int(c * (0.5 + 0.5 * progress)) for c in self.BLUE]
-            pygame.draw.line(gradient_surface, color,
-                           (0, i), (panel_width, i))
+        if self.score_panel is None:
+            self.score_panel = surface_factory.create((panel_width,
+                                                       panel_height))
+            for i in range(panel_height):
+                progress = i / panel_height
+                color = [int(c * (0.5 + 0.5 * progress)) for c in self.BLUE]
+                pygame.draw.line(self.score_panel, color,
+                               (0, i), (panel_width, i))
             
-        screen.blit(gradient_surface, (x, y))
+        screen.blit(self.score_panel, (x, y))
         
         # Draw score text
-        score_text = self.hud_font.render(f"SCORE: {self.score}",
-                                        True, self.WHITE)
+        score_text = text_cache.render_counter(self.hud_font, "SCORE: ",
+                                               self.score, self.WHITE)
         screen.blit(score_text, (x + 10, y + 5))
         
     def draw_timer(self, screen):
@@ -196,10 +218,11 @@ class TimeLoopDefender:
         color = self.RED if time_left <= 10 else self.WHITE
         
         # Draw digital countdown
-        timer_text = self.hud_font.render(
+        timer_text = text_cache.render(
+            self.hud_font,
             f"ROUND: {self.current_round + 1}/{self.max_rounds} | "
             f"TIME: {time_left}s",
-            True, color)
+            color)
         screen.blit(timer_text, (10, 80))
         
         # Draw circular timer
@@ -225,9 +248,8 @@ class TimeLoopDefender:
                 
     def draw_round_summary(self, screen):
         # Draw semi-transparent overlay
-        overlay = pygame.Surface(self.WINDOW_SIZE, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        screen.blit(surface_factory.get_overlay(self.WINDOW_SIZE,
+                                                self.BLACK, 200), (0, 0))
         
         # Draw terminal-style box
         box_width = 500
@@ -253,7 +275,7 @@ class TimeLoopDefender:
         ]
         
         for i, text in enumerate(stats_text):
-            text_surface = self.hud_font.render(text, True, self.CYAN)
+            text_surface = text_cache.render(self.hud_font, text, self.CYAN)
             screen.blit(text_surface, 
                        (x + 20, y + 20 + i * 30))
             
@@ -265,12 +287,11 @@ class TimeLoopDefender:
         
     def draw_pause_menu(self, screen):
         # Draw semi-transparent overlay
-        overlay = pygame.Surface(self.WINDOW_SIZE, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        screen.blit(surface_factory.get_overlay(self.WINDOW_SIZE,
+                                                self.BLACK, 200), (0, 0))
         
         # Draw pause menu
-        title = self.title_font.render("PAUSED", True, self.WHITE)
+        title = text_cache.render(self.title_font, "PAUSED", self.WHITE)
         title_rect = title.get_rect(
             center=(self.WINDOW_SIZE[0]//2, 200))
         screen.blit(title, title_rect)
@@ -282,14 +303,40 @@ class TimeLoopDefender:
         ]
         
         for i, option in enumerate(options):
-            option_text = self.hud_font.render(option, True, self.WHITE)
+            option_text = text_cache.render(self.hud_font, option, self.WHITE)
             option_rect = option_text.get_rect(
                 center=(self.WINDOW_SIZE[0]//2, 300 + i*40))
             screen.blit(option_text, option_rect)
             
+    def update(self):
+        """Advance one fixed simulation step while playing"""
+        # Update round timer
+        self.round_timer -= 1
+        
+        if self.round_timer <= 0:
+            self.current_round += 1
+            if self.current_round >= self.max_rounds:
+                self.game_state = self.STATE_GAME_OVER
+                score_store.record_run(
+                    'time_loop', self.score, rounds=self.current_round,
+                    damage_dealt=self.stats['damage_dealt'],
+                    enemies_defeated=self.stats['enemies_defeated'],
+                    shots_fired=self.stats['shots_fired'],
+                    efficiency=self.calculate_efficiency())
+            else:
+                self.round_timer = 30 * self.FPS
+                self.loop_effect.start()
+                self.add_notification("Time Loop Reset",
+                                   self.CYAN)
+                
+        # Update effects
+        self.update_notifications()
+        self.loop_effect.update()
+            
     def run(self, screen):
-        clock = pygame.time.Clock()
+        clock = GameClock(self.FPS)
         self.reset_game()
+        clock.reset()
         running = True
         
         while running:
@@ -312,40 +359,28 @@ class TimeLoopDefender:
                         if self.game_state == self.STATE_PAUSED:
                             self.reset_game()
                             self.game_state = self.STATE_PLAYING
+                            clock.reset()
                     elif event.key == pygame.K_SPACE:
                         if self.game_state == self.STATE_MENU:
                             self.game_state = self.STATE_PLAYING
                             self.add_notification("Time Loop Initiated",
                                                self.CYAN)
                             
-            if self.game_state == self.STATE_PLAYING:
-                # Update game logic here
-                self.round_timer -= 1
-                
-                if self.round_timer <= 0:
-                    self.current_round += 1
-                    if self.current_round >= self.max_rounds:
-                        self.game_state = self.STATE_GAME_OVER
-                    else:
-                        self.round_timer = 30 * self.FPS
-                        self.loop_effect.start()
-                        self.add_notification("Time Loop Reset",
-                                           self.CYAN)
-                        
-                # Update effects
-                self.update_notifications()
-                self.loop_effect.update()
+            # Advance the game in fixed steps
+            for _ in range(clock.tick()):
+                if self.game_state == self.STATE_PLAYING:
+                    self.update()
                 
             # Draw everything
             screen.fill(self.BLACK)
             
             if self.game_state == self.STATE_MENU:
                 # Draw menu
-                title = self.title_font.render("TIME LOOP DEFENDER",
-                                             True, self.WHITE)
-                subtitle = self.hud_font.render(
-                    "Trapped in a Collapsing Timeline",
-                    True, self.CYAN)
+                title = text_cache.render(self.title_font,
+                                          "TIME LOOP DEFENDER", self.WHITE)
+                subtitle = text_cache.render(
+                    self.hud_font, "Trapped in a Collapsing Timeline",
+                    self.CYAN)
                 
                 title_rect = title.get_rect(
                     center=(self.WINDOW_SIZE[0]//2, 200))
@@ -356,9 +391,8 @@ class TimeLoopDefender:
                 screen.blit(subtitle, subtitle_rect)
                 
                 if (pygame.time.get_ticks() // 500) % 2:
-                    start_text = self.hud_font.render(
-                        "Press SPACE to Start",
-                        True, self.WHITE)
+                    start_text = text_cache.render(
+                        self.hud_font, "Press SPACE to Start", self.WHITE)
                     start_rect = start_text.get_rect(
                         center=(self.WINDOW_SIZE[0]//2, 400))
                     screen.blit(start_text, start_rect)
@@ -382,20 +416,18 @@ class TimeLoopDefender:
                 
             elif self.game_state == self.STATE_GAME_OVER:
                 # Draw game over screen
-                game_over = self.title_font.render("GAME OVER",
-                                                 True, self.RED)
+                game_over = text_cache.render(self.title_font, "GAME OVER",
+                                              self.RED)
                 game_over_rect = game_over.get_rect(
                     center=(self.WINDOW_SIZE[0]//2, 200))
                 screen.blit(game_over, game_over_rect)
                 
-                score_text = self.hud_font.render(
-                    f"Final Score: {self.score}",
-                    True, self.WHITE)
+                score_text = text_cache.render(
+                    self.hud_font, f"Final Score: {self.score}", self.WHITE)
                 score_rect = score_text.get_rect(
                     center=(self.WINDOW_SIZE[0]//2, 300))
                 screen.blit(score_text, score_rect)
                 
             pygame.display.flip()
-            clock.tick(self.FPS)
             
         return True  # Return to main menu
@@ -7,7 +7,11 @@ from games.color_match import ColorMatchShooter
 from games.echo_maze import EchoMaze
 from games.time_loop import TimeLoopDefender
 from utils.audio_manager import AudioManager
+from utils.game_clock import GameClock
+from utils.score_store import score_store
 from utils.settings_menu import SettingsMenu
+from utils.surface_factory import surface_factory
+from utils.text_cache import text_cache
 
 class Star:
     def __init__(self, width, height):
@@ -27,6 +31,9 @@ class ArcadeGameLauncher:
         self.screen = pygame.display.set_mode(self.WINDOW_SIZE)
         pygame.display.set_caption("Retro Arcade Game Launcher")
         
+        # Load saved scores in the background while everything else loads
+        score_store.start()
+        
         # Initialize audio manager
         self.audio_manager = AudioManager()
         self.audio_manager.load_sounds()
@@ -43,8 +50,8 @@ class ArcadeGameLauncher:
         self.NEON_PINK = (255, 0, 255)
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 72)
-        self.button_font = pygame.font.Font(None, 36)
+        self.title_font = text_cache.get_font(72)
+        self.button_font = text_cache.get_font(36)
         
         # Button dimensions
         self.button_width = 300
@@ -141,14 +148,25 @@ class ArcadeGameLauncher:
         if button["hover"] and not old_hover:
             self.audio_manager.play_sound("hover")
         
-        # Base button color with gradient
-        gradient_surface = pygame.Surface((rect.width, rect.height))
-        for i in range(rect.height):
-            progress = i / rect.height
-            color = [int(c * (0.8 + 0.2 * progress)) 
-                    for c in button["color"]]
-            pygame.draw.line(gradient_surface, color, 
-                           (0, i), (rect.width, i))
+        # Base button color with gradient (drawn once per button)
+        if "surface" not in button:
+            gradient_surface = surface_factory.create((rect.width, rect.height))
+            for i in range(rect.height):
+                progress = i / rect.height
+                color = [int(c * (0.8 + 0.2 * progress)) 
+                        for c in button["color"]]
+                pygame.draw.line(gradient_surface, color, 
+                               (0, i), (rect.width, i))
+            button["surface"] = gradient_surface
+            
+            glow_surface = surface_factory.create_faded(
+                (rect.width + 20, rect.height + 20), 100)
+            glow_surface.fill(self.BLACK)
+            pygame.draw.rect(glow_surface, button["color"], 
+                           (0, 0, rect.width + 20, rect.height + 20), 
+                           border_radius=15)
+            button["glow"] = glow_surface
+        gradient_surface = button["surface"]
             
         # Apply hover effects
         if button["hover"]:
@@ -156,13 +174,7 @@ class ArcadeGameLauncher:
             button["scale"] = min(1.1, button["scale"] + 0.05)
             
             # Add glow effect
-            glow_surface = pygame.Surface((rect.width + 20, rect.height + 20))
-            glow_surface.fill(self.BLACK)
-            pygame.draw.rect(glow_surface, button["color"], 
-                           (0, 0, rect.width + 20, rect.height + 20), 
-                           border_radius=15)
-            glow_surface.set_alpha(100)
-            self.screen.blit(glow_surface, 
+            self.screen.blit(button["glow"], 
                            (rect.x - 10, rect.y - 10))
         else:
             button["scale"] = max(1.0, button["scale"] - 0.05)
@@ -180,7 +192,8 @@ class ArcadeGameLauncher:
                          rect.y + rect.height * (1 - button["scale"]) / 2))
         
         # Draw text
-        text_surface = self.button_font.render(button["text"], True, self.WHITE)
+        text_surface = text_cache.render(self.button_font, button["text"],
+                                         self.WHITE)
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
         
@@ -212,7 +225,7 @@ class ArcadeGameLauncher:
         color = (255, 100, 100) if hover else (255, 0, 0)
         
         pygame.draw.rect(self.screen, color, exit_rect, 2)
-        exit_text = self.button_font.render("X", True, color)
+        exit_text = text_cache.render(self.button_font, "X", color)
         exit_text_rect = exit_text.get_rect(center=exit_rect.center)
         self.screen.blit(exit_text, exit_text_rect)
         
@@ -222,7 +235,7 @@ class ArcadeGameLauncher:
         self.audio_manager.play_sound("start")
         
         # Fade out effect
-        fade_surface = pygame.Surface(self.WINDOW_SIZE)
+        fade_surface = surface_factory.create(self.WINDOW_SIZE)
         fade_surface.fill(self.BLACK)
         
         for alpha in range(0, 255, 5):
@@ -241,12 +254,22 @@ class ArcadeGameLauncher:
             pygame.display.flip()
             pygame.time.delay(5)
             
+    def update(self):
+        """Advance menu animations by one fixed step"""
+        self.time += 1
+        self.update_stars()
+        
+        # Update title glow
+        if not self.show_settings:
+            self.title_glow += 0.05 * self.title_glow_direction
+            if self.title_glow >= 1.0 or self.title_glow <= 0.0:
+                self.title_glow_direction *= -1
+            
     def run(self):
-        clock = pygame.time.Clock()
+        clock = GameClock(60)
         running = True
         
         while running:
-            self.time += 1
             mouse_pos = pygame.mouse.get_pos()
             
             for event in pygame.event.get():
@@ -270,6 +293,7 @@ class ArcadeGameLauncher:
                             if button_rect.collidepoint(mouse_pos):
                                 self.audio_manager.play_sound("click")
                                 self.transition_to_game(button["game"])
+                                clock.reset()
                                 
                         # Check settings and exit buttons
                         settings_rect = self.draw_settings_button()
@@ -285,28 +309,27 @@ class ArcadeGameLauncher:
                 elif self.show_settings:
                     self.settings_menu.handle_event(event)
             
+            # Advance animations in fixed steps
+            for _ in range(clock.tick()):
+                self.update()
+                
             # Update background
             self.screen.fill(self.BLACK)
-            self.update_stars()
             self.draw_stars()
             
             # Draw neon frame
             self.draw_neon_frame()
             
             if not self.show_settings:
-                # Update and draw title
-                self.title_glow += 0.05 * self.title_glow_direction
-                if self.title_glow >= 1.0 or self.title_glow <= 0.0:
-                    self.title_glow_direction *= -1
-                    
+                # Draw title
                 title_color = (
                     int(255 * (0.7 + 0.3 * self.title_glow)),
                     int(255 * (0.7 + 0.3 * self.title_glow)),
                     int(255 * (0.7 + 0.3 * self.title_glow))
                 )
                 
-                title_surface = self.title_font.render("CHOOSE A GAME", 
-                                                     True, title_color)
+                title_surface = text_cache.render(self.title_font,
+                                                  "CHOOSE A GAME", title_color)
                 title_rect = title_surface.get_rect(
                     center=(self.WINDOW_SIZE[0] // 2, 80)
                 )
@@ -330,8 +353,8 @@ class ArcadeGameLauncher:
                 self.settings_menu.draw(self.screen)
             
             pygame.display.flip()
-            clock.tick(60)
             
+        score_store.close()  # Finish pending score writes
         pygame.quit()
         sys.exit()
 
@@ -1,5 +1,19 @@
 from .audio_manager import AudioManager
+from .game_clock import GameClock
+from .glow_cache import GlowCache, glow_cache
+from .object_pool import ObjectPool
+from .particles import ParticleEngine
+from .score_store import ScoreStore, score_store
 from .settings_menu import SettingsMenu
+from .spatial_hash import SpatialHash
 from .sound_manager import SoundManager
+from .surface_factory import SurfaceFactory, surface_factory
+from .text_cache import TextCache, text_cache
+from .trail import Trail, TrailRenderer
 
-__all__ = ['AudioManager', 'SettingsMenu', 'SoundManager']
+__all__ = [
+    'AudioManager', 'GameClock', 'GlowCache', 'glow_cache', 'ObjectPool',
+    'ParticleEngine', 'ScoreStore', 'score_store', 'SettingsMenu',
+    'SoundManager', 'SpatialHash', 'SurfaceFactory', 'surface_factory',
+    'TextCache', 'text_cache', 'Trail', 'TrailRenderer'
+]
@@ -0,0 +1,68 @@
+import pygame
+from collections import deque
+from typing import Dict, Optional
+
+class GameClock:
+    """Fixed-timestep clock for the game loops.
+
+    Each call to tick() limits the render rate, measures the real time that
+    passed, scales it by `time_scale` and returns how many fixed simulation
+    steps to run this frame. Leftover time is kept in an accumulator and
+    exposed as `alpha` for render interpolation. Long stalls are clamped so
+    a hitch never triggers a burst of catch-up steps.
+    """
+
+    def __init__(self, step_rate: int = 60, max_fps: Optional[int] = None,
+                 max_steps: int = 5, max_frame_time: float = 0.25,
+                 history: int = 120):
+        self.step_rate = step_rate
+        self.step_time = 1.0 / step_rate
+        self.max_fps = step_rate if max_fps is None else max_fps
+        self.max_steps = max_steps
+        self.max_frame_time = max_frame_time
+        self.time_scale = 1.0
+        self.clock = pygame.time.Clock()
+
+        self.frame_times = deque(maxlen=history)
+        self.step_counts = deque(maxlen=history)
+        self.dropped_steps = 0
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def reset(self):
+        """Forget pending time, e.g. after a blocking load or a menu"""
+        self.clock.tick()
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def tick(self) -> int:
+        frame_time = self.clock.tick(self.max_fps) / 1000.0
+        self.frame_times.append(frame_time)
+
+        # Spiral-of-death protection: clamp long frames and cap the steps
+        self.accumulator += min(frame_time, self.max_frame_time) * self.time_scale
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_time
+
+        self.alpha = self.accumulator / self.step_time
+        self.step_counts.append(steps)
+        return steps
+
+    def get_stats(self) -> Dict[str, float]:
+        """Timing over the recent frame history"""
+        if not self.frame_times:
+            return {'fps': 0.0, 'frame_ms': 0.0, 'max_frame_ms': 0.0,
+                    'steps_per_frame': 0.0, 'dropped_steps': 0}
+        total = sum(self.frame_times)
+        return {
+            'fps': len(self.frame_times) / total if total else 0.0,
+            'frame_ms': 1000 * total / len(self.frame_times),
+            'max_frame_ms': 1000 * max(self.frame_times),
+            'steps_per_frame': sum(self.step_counts) / len(self.step_counts),
+            'dropped_steps': self.dropped_steps
+        }
@@ -0,0 +1,98 @@
+import pygame
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+from .surface_factory import surface_factory
+
+class GlowCache:
+    """LRU cache of pre-rendered glow and halo sprites.
+
+    Sprites are keyed by (shape, size, color, intensity level). Intensity is
+    quantized to a fixed number of levels so an animated glow cycles through
+    a small set of cached sprites instead of rebuilding one every frame.
+    """
+
+    def __init__(self, max_sprites: int = 256, levels: int = 16):
+        self.max_sprites = max_sprites
+        self.levels = levels
+        self.sprites: OrderedDict = OrderedDict()
+        self.builders: Dict[str, Callable] = {
+            'circle': self.build_circle,
+            'orb': self.build_orb,
+            'column': self.build_column,
+            'frame': self.build_frame
+        }
+
+    def quantize(self, intensity: float) -> float:
+        """Snap an intensity in [0, 1] to the level the cache will use"""
+        level = round(max(0.0, min(1.0, intensity)) * (self.levels - 1))
+        return level / (self.levels - 1)
+
+    def get(self, shape: str, size, color: Tuple[int, ...],
+            intensity: float = 1.0) -> pygame.Surface:
+        level = round(self.quantize(intensity) * (self.levels - 1))
+        key = (shape, size, tuple(int(c) for c in color), level)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+
+        sprite = self.builders[shape](size, key[2], level / (self.levels - 1))
+        sprite = surface_factory.convert(sprite, static=True)
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+    def build_circle(self, radius: int, color: Tuple[int, ...],
+                     intensity: float) -> pygame.Surface:
+        """Soft disc of the given radius centered in a (2r, 2r) sprite"""
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        alpha = color[3] if len(color) > 3 else 255
+        pygame.draw.circle(surface, (*color[:3], int(alpha * intensity)),
+                           (radius, radius), radius)
+        return surface
+
+    def build_orb(self, radius: int, color: Tuple[int, ...],
+                  intensity: float) -> pygame.Surface:
+        """Half-transparent halo with a solid core two pixels smaller"""
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color[:3], int(128 * intensity)),
+                           (radius, radius), radius)
+        pygame.draw.circle(surface, color[:3], (radius, radius), radius - 2)
+        return surface
+
+    def build_column(self, size: Tuple[int, int], color: Tuple[int, ...],
+                     intensity: float) -> pygame.Surface:
+        """Three stacked glow layers, each 4px wider and fainter.
+
+        The layers share one color, so blending them in turn equals one
+        blend with alpha 1 - prod(1 - a_i); the sprite stores that result.
+        Callers crop it vertically with the blit `area` argument.
+        """
+        width, height = size
+        surface = pygame.Surface((width + 8, height), pygame.SRCALPHA)
+        for inset in range(3):
+            # Columns covered by layers inset..2
+            covered = [int(128 * (1 - i/3) * intensity) / 255
+                       for i in range(2 - inset, 3)]
+            transparency = 1.0
+            for alpha in covered:
+                transparency *= 1 - alpha
+            alpha = int(round(255 * (1 - transparency)))
+            surface.fill((*color[:3], alpha),
+                         (inset * 2, 0, width + 8 - inset * 4, height))
+        return surface
+
+    def build_frame(self, size: Tuple[int, int], color: Tuple[int, ...],
+                    intensity: float) -> pygame.Surface:
+        """Five pixel outline around a (width, height) rectangle"""
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, (*color[:3], int(254 * intensity)),
+                         (0, 0, *size), 5)
+        return surface
+
+# Shared by every game so sprites survive switching between them
+glow_cache = GlowCache()
@@ -0,0 +1,62 @@
+from typing import Callable, Generic, List, Type, TypeVar
+
+T = TypeVar('T')
+
+class ObjectPool(Generic[T]):
+    """Free list of reusable entities plus the list of live ones.
+
+    Pooled classes construct through __init__ and re-initialize through a
+    reset() method taking the same arguments, so acquire() can hand back a
+    released object instead of allocating. `active` is unordered: release
+    swap-removes, moving the last live object into the freed slot.
+    """
+
+    def __init__(self, cls: Type[T], max_free: int = 256):
+        self.cls = cls
+        self.max_free = max_free
+        self.free: List[T] = []
+        self.active: List[T] = []
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def acquire(self, *args, **kwargs) -> T:
+        if self.free:
+            item = self.free.pop()
+            item.reset(*args, **kwargs)
+        else:
+            item = self.cls(*args, **kwargs)
+        self.active.append(item)
+        return item
+
+    def recycle(self, item: T):
+        """Return an object that is no longer in `active`"""
+        if len(self.free) < self.max_free:
+            self.free.append(item)
+
+    def release_at(self, index: int):
+        """Swap-remove the live object at `index`.
+
+        Safe while walking `active` from the back, since the object moved
+        into `index` has already been visited.
+        """
+        active = self.active
+        item = active[index]
+        active[index] = active[-1]
+        active.pop()
+        self.recycle(item)
+
+    def release_if(self, predicate: Callable[[T], bool]):
+        """Release every live object the predicate returns True for"""
+        active = self.active
+        for index in range(len(active) - 1, -1, -1):
+            if predicate(active[index]):
+                self.release_at(index)
+
+    def release_all(self):
+        for item in self.active:
+            self.recycle(item)
+        self.active.clear()
@@ -0,0 +1,154 @@
+import pygame
+import numpy as np
+from typing import Dict, List, Tuple
+from .surface_factory import surface_factory
+
+class ParticleEngine:
+    """Struct-of-arrays particle system shared by the games.
+
+    Particles live in fixed-capacity NumPy arrays and are updated in bulk.
+    Dead particles are swap-removed so the live ones always occupy the
+    first `count` slots. Sprites are cached per (color, radius, alpha step)
+    so drawing never allocates surfaces once the cache is warm.
+    """
+
+    ALPHA_STEPS = 32
+
+    def __init__(self, capacity: int = 50000, decay: float = 0.02):
+        self.capacity = capacity
+        self.decay = decay
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color_index = np.zeros(capacity, dtype=np.uint8)
+        self.arrays = [self.x, self.y, self.vx, self.vy,
+                       self.life, self.size, self.color_index]
+
+        self.colors: List[Tuple[int, int, int]] = []
+        self.color_lookup: Dict[Tuple[int, int, int], int] = {}
+        self.sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+    def get_color_index(self, color: Tuple[int, ...]) -> int:
+        """Map an RGB color to its palette index, adding it if new"""
+        color = tuple(color[:3])
+        if color not in self.color_lookup:
+            self.color_lookup[color] = len(self.colors)
+            self.colors.append(color)
+        return self.color_lookup[color]
+
+    def emit(self, x, y, vx, vy, size, color_index) -> int:
+        """Append particles from scalars or arrays, returns the number added"""
+        n = min(np.size(vx), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        for array, values in ((self.x, x), (self.y, y), (self.vx, vx),
+                              (self.vy, vy), (self.size, size),
+                              (self.color_index, color_index)):
+            values = np.asarray(values)
+            array[start:end] = values[:n] if values.ndim else values
+        self.life[start:end] = 1.0
+        self.count = end
+        return n
+
+    def create_burst(self, x: float, y: float, direction: int,
+                     color: Tuple[int, int, int], count: int = 20):
+        """Cone of particles, pointing up when direction is negative"""
+        angle = np.random.uniform(-np.pi/4, np.pi/4, count)
+        if direction < 0:  # Flipping upward
+            angle += np.pi
+        speed = np.random.uniform(2, 5, count)
+        self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                  5, self.get_color_index(color))
+
+    def create_hit_burst(self, x: float, y: float,
+                         color: Tuple[int, int, int], count: int = 20):
+        """Ring of particles flying out in every direction"""
+        angle = np.random.uniform(0, 2 * np.pi, count)
+        speed = np.random.uniform(2, 5, count)
+        self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                  np.random.uniform(2, 4, count), self.get_color_index(color))
+
+    def create_background_particle(self, width: int, height: int,
+                                   count: int = 1):
+        """Slow particles rising from below the bottom edge"""
+        palette = np.array([self.get_color_index(color) for color in [
+            (255, 0, 0), (0, 255, 0), (0, 0, 255),
+            (255, 255, 0), (0, 255, 255), (255, 0, 255)
+        ]], dtype=np.uint8)
+        self.emit(np.random.randint(0, width + 1, count),
+                  height + 10,
+                  np.random.uniform(-0.5, 0.5, count),
+                  np.random.uniform(-1, -0.5, count),
+                  np.random.uniform(3, 6, count),
+                  np.random.choice(palette, count))
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= self.decay
+
+        dead = np.flatnonzero(self.life[:n] <= 0)
+        if dead.size:
+            # Swap-remove: live particles from the tail fill the holes
+            # left by dead particles in the head
+            new_count = n - dead.size
+            holes = dead[dead < new_count]
+            tail = np.arange(new_count, n)
+            movers = tail[self.life[new_count:n] > 0]
+            for array in self.arrays:
+                array[holes] = array[movers]
+            self.count = new_count
+
+    def clear(self):
+        self.count = 0
+
+    def get_sprite(self, color_index: int, radius: int,
+                   alpha_step: int) -> pygame.Surface:
+        key = (color_index, radius, alpha_step)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            alpha = 255 * alpha_step // self.ALPHA_STEPS
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*self.colors[color_index], alpha),
+                               (radius, radius), radius)
+            sprite = surface_factory.convert(sprite, static=True)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        n = self.count
+        if n == 0:
+            return
+        life = self.life[:n]
+        radius = (self.size[:n] * life).astype(np.int32)
+        
+        # Cull particles that are too small or entirely off screen
+        x, y = self.x[:n], self.y[:n]
+        width, height = screen.get_size()
+        shown = np.flatnonzero((radius > 0) &
+                               (x + radius >= 0) & (x - radius < width) &
+                               (y + radius >= 0) & (y - radius < height))
+        if not shown.size:
+            return
+        radius = radius[shown]
+        alpha_step = np.ceil(life[shown] * self.ALPHA_STEPS).astype(np.int32)
+        left = (self.x[shown].astype(np.int32) - radius).tolist()
+        top = (self.y[shown].astype(np.int32) - radius).tolist()
+
+        # Resolve each distinct sprite once, then fan out by index
+        keys = ((self.color_index[shown].astype(np.int32) << 16) |
+                (radius << 8) | alpha_step)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        table = [self.get_sprite(key >> 16, (key >> 8) & 0xFF, key & 0xFF)
+                 for key in unique.tolist()]
+        sprites = map(table.__getitem__, inverse.tolist())
+        screen.blits(zip(sprites, zip(left, top)), doreturn=False)
@@ -0,0 +1,202 @@
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+class ScoreStore:
+    """Per-game high scores, run history and stats in one SQLite file.
+
+    All disk I/O happens on a background writer thread. The game loop only
+    touches an in-memory cache: record_run() updates the cache right away
+    and queues the write, and reads never hit the disk. Each run is written
+    in one transaction, so a crash mid-write cannot leave a corrupt score.
+    The cache is filled by the writer thread on startup; the first read
+    waits for that load, which happens while the games are being created.
+    """
+
+    HISTORY_LENGTH = 50
+
+    # High scores kept in text files by earlier versions, imported once
+    LEGACY_FILES = {
+        'gravity_flip': 'high_score.txt',
+        'color_match': 'color_match_high_score.txt'
+    }
+
+    def __init__(self, path: str = 'scores.db'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.loaded = threading.Event()
+        self.writes: queue.Queue = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.failed_writes = 0
+
+        self.high_scores: Dict[str, int] = {}
+        self.history: Dict[str, Deque[Dict]] = {}
+        self.totals: Dict[str, Dict[str, int]] = {}
+
+    def start(self):
+        """Start the writer thread and begin loading the cache"""
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self.writer,
+                                           name='score-store', daemon=True)
+            self.thread.start()
+        atexit.register(self.close)
+
+    # Reads (game thread, cache only)
+
+    def get_high_score(self, game: str) -> int:
+        self.wait_loaded()
+        with self.lock:
+            return self.high_scores.get(game, 0)
+
+    def get_history(self, game: str, limit: int = 10) -> List[Dict]:
+        """Most recent runs first"""
+        self.wait_loaded()
+        with self.lock:
+            runs = list(self.history.get(game, ()))
+        return runs[:-limit - 1:-1] if limit else runs[::-1]
+
+    def get_stats(self, game: str) -> Dict[str, float]:
+        self.wait_loaded()
+        with self.lock:
+            totals = dict(self.totals.get(game, {'runs': 0, 'score': 0}))
+            best = self.high_scores.get(game, 0)
+        runs = totals['runs']
+        return {
+            'runs': runs,
+            'high_score': best,
+            'average_score': totals['score'] / runs if runs else 0.0
+        }
+
+    def wait_loaded(self):
+        if not self.loaded.is_set():
+            self.start()
+            self.loaded.wait()
+
+    # Writes (game thread queues, writer thread persists)
+
+    def record_run(self, game: str, score: int, **stats) -> bool:
+        """Record a finished run; returns True if it set a new high score"""
+        self.wait_loaded()
+        run = {'score': int(score), 'played_at': time.time(), 'stats': stats}
+        with self.lock:
+            new_best = run['score'] > self.high_scores.get(game, 0)
+            if new_best:
+                self.high_scores[game] = run['score']
+            self.history.setdefault(
+                game, deque(maxlen=self.HISTORY_LENGTH)).append(run)
+            totals = self.totals.setdefault(game, {'runs': 0, 'score': 0})
+            totals['runs'] += 1
+            totals['score'] += run['score']
+        self.writes.put((game, run))
+        return new_best
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued writes are on disk; False if timed out"""
+        if self.thread is None:
+            return True
+        done = threading.Event()
+        self.writes.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.writes.put(None)
+        self.thread.join(timeout=5)
+
+    # Writer thread
+
+    def writer(self):
+        connection = None
+        try:
+            connection = sqlite3.connect(self.path)
+            self.load(connection)
+        except sqlite3.Error:
+            # Scores still work in memory for this session
+            connection = None
+        finally:
+            self.loaded.set()
+
+        while True:
+            item = self.writes.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            if connection is None:
+                continue
+            game, run = item
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO runs (game, score, played_at, stats) "
+                        "VALUES (?, ?, ?, ?)",
+                        (game, run['score'], run['played_at'],
+                         json.dumps(run['stats'])))
+                    connection.execute(
+                        "INSERT INTO high_scores (game, score) VALUES (?, ?) "
+                        "ON CONFLICT(game) DO UPDATE SET "
+                        "score = MAX(score, excluded.score)",
+                        (game, run['score']))
+            except sqlite3.Error:
+                self.failed_writes += 1
+        if connection is not None:
+            connection.close()
+
+    def load(self, connection: sqlite3.Connection):
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "id INTEGER PRIMARY KEY, game TEXT NOT NULL, "
+                "score INTEGER NOT NULL, played_at REAL NOT NULL, "
+                "stats TEXT NOT NULL)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS runs_by_game ON runs (game, id)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS high_scores ("
+                "game TEXT PRIMARY KEY, score INTEGER NOT NULL)")
+            self.import_legacy(connection)
+
+        high_scores = dict(connection.execute(
+            "SELECT game, score FROM high_scores"))
+        totals = {game: {'runs': runs, 'score': score or 0}
+                  for game, runs, score in connection.execute(
+                      "SELECT game, COUNT(*), SUM(score) FROM runs "
+                      "GROUP BY game")}
+        history: Dict[str, Deque[Dict]] = {}
+        for game in totals:
+            rows = connection.execute(
+                "SELECT score, played_at, stats FROM runs WHERE game = ? "
+                "ORDER BY id DESC LIMIT ?", (game, self.HISTORY_LENGTH))
+            history[game] = deque(
+                ({'score': score, 'played_at': played_at,
+                  'stats': json.loads(stats)}
+                 for score, played_at, stats in reversed(rows.fetchall())),
+                maxlen=self.HISTORY_LENGTH)
+
+        with self.lock:
+            self.high_scores = high_scores
+            self.history = history
+            self.totals = totals
+
+    def import_legacy(self, connection: sqlite3.Connection):
+        for game, file_name in self.LEGACY_FILES.items():
+            try:
+                with open(file_name, 'r') as f:
+                    score = int(f.read().strip())
+            except (OSError, ValueError):
+                continue
+            connection.execute(
+                "INSERT OR IGNORE INTO high_scores (game, score) VALUES (?, ?)",
+                (game, score))
+
+# Shared by every game and the launcher
+score_store = ScoreStore()
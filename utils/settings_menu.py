@@ -1,5 +1,7 @@
 import pygame
 import os
+from .surface_factory import surface_factory
+from .text_cache import text_cache
 
 class SettingsMenu:
     def __init__(self, screen_size, audio_manager):
@@ -13,8 +15,8 @@ class SettingsMenu:
         self.NEON_BLUE = (0, 255, 255)
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 48)
-        self.option_font = pygame.font.Font(None, 36)
+        self.title_font = text_cache.get_font(48)
+        self.option_font = text_cache.get_font(36)
         
         # Menu dimensions
         self.width = 400
@@ -35,9 +37,8 @@ class SettingsMenu:
         
     def draw(self, screen):
         # Draw semi-transparent background
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
+        screen.blit(surface_factory.get_overlay(self.screen_size,
+                                                self.BLACK, 128), (0, 0))
         
         # Draw settings panel
         pygame.draw.rect(screen, self.BLACK, 
@@ -46,7 +47,7 @@ class SettingsMenu:
                         (self.x, self.y, self.width, self.height), 2)
         
         # Draw title
-        title = self.title_font.render("Settings", True, self.WHITE)
+        title = text_cache.render(self.title_font, "Settings", self.WHITE)
         title_rect = title.get_rect(centerx=self.x + self.width//2, 
                                   y=self.y + 20)
         screen.blit(title, title_rect)
@@ -60,7 +61,8 @@ class SettingsMenu:
                                     40)
             
             # Draw option text
-            text = self.option_font.render(option["text"], True, self.WHITE)
+            text = text_cache.render(self.option_font, option["text"],
+                                     self.WHITE)
             screen.blit(text, (option_rect.x, option_rect.y + 10))
             
             # Draw control based on type
@@ -0,0 +1,112 @@
+from collections import defaultdict
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+class SpatialHash:
+    """Uniform grid broad-phase for circles.
+
+    Each item is stored in every cell its bounding box touches. update()
+    is incremental: an item that moved but still covers the same cells is
+    not touched, so a frame's rebuild only pays for items crossing a cell
+    border. Buckets are dicts, so results come back in insertion order.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Dict[Hashable, None]] = \
+            defaultdict(dict)
+        self.bounds: Dict[Hashable, Tuple[float, float, float]] = {}
+        self.ranges: Dict[Hashable, Tuple[int, int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.bounds
+
+    def cell_range(self, x: float, y: float, radius: float
+                   ) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (int((x - radius) // size), int((y - radius) // size),
+                int((x + radius) // size), int((y + radius) // size))
+
+    def update(self, item: Hashable, x: float, y: float, radius: float = 0):
+        """Insert an item or move it to a new position and radius"""
+        self.bounds[item] = (x, y, radius)
+        size = self.cell_size
+        new = (int((x - radius) // size), int((y - radius) // size),
+               int((x + radius) // size), int((y + radius) // size))
+        old = self.ranges.get(item)
+        if new == old:
+            return
+        if old is not None:
+            self.unlink(item, old)
+        left, top, right, bottom = new
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                self.cells[(cx, cy)][item] = None
+        self.ranges[item] = new
+
+    def remove(self, item: Hashable):
+        if item in self.ranges:
+            self.unlink(item, self.ranges.pop(item))
+            del self.bounds[item]
+
+    def unlink(self, item: Hashable, cell_range: Tuple[int, int, int, int]):
+        left, top, right, bottom = cell_range
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                bucket = self.cells[(cx, cy)]
+                del bucket[item]
+                if not bucket:
+                    del self.cells[(cx, cy)]
+
+    def clear(self):
+        self.cells.clear()
+        self.bounds.clear()
+        self.ranges.clear()
+
+    def candidates(self, x: float, y: float, radius: float = 0
+                   ) -> Iterator[Hashable]:
+        """Items sharing a cell with the box around (x, y), each once"""
+        left, top, right, bottom = self.cell_range(x, y, radius)
+        if left == right and top == bottom:
+            yield from self.cells.get((left, top), ())
+            return
+        seen = set()
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                for item in self.cells.get((cx, cy), ()):
+                    if item not in seen:
+                        seen.add(item)
+                        yield item
+
+    def query_radius(self, x: float, y: float, radius: float = 0
+                     ) -> List[Hashable]:
+        """Items whose circle overlaps the circle at (x, y).
+
+        With radius 0 this is every item whose circle contains the point.
+        """
+        found = []
+        for item in self.candidates(x, y, radius):
+            ix, iy, iradius = self.bounds[item]
+            dx, dy = ix - x, iy - y
+            reach = iradius + radius
+            if dx * dx + dy * dy < reach * reach:
+                found.append(item)
+        return found
+
+    def pairs(self, other: Optional['SpatialHash'] = None
+              ) -> Dict[Hashable, List[Hashable]]:
+        """Overlapping pairs, as {item in other: [items in self]}.
+
+        Without `other` the pairs are found within this hash and each item
+        maps to the items it overlaps, excluding itself.
+        """
+        other = self if other is None else other
+        result: Dict[Hashable, List[Hashable]] = {}
+        for item, (x, y, radius) in other.bounds.items():
+            hits = [hit for hit in self.query_radius(x, y, radius)
+                    if hit is not item]
+            if hits:
+                result[item] = hits
+        return result
@@ -0,0 +1,81 @@
+import pygame
+from typing import Dict, Tuple
+
+class SurfaceFactory:
+    """Creates surfaces in the display's pixel format.
+
+    A surface whose format differs from the display is converted on every
+    blit, so everything the games generate goes through here. The alpha
+    mode is chosen by usage: opaque surfaces use convert(), surfaces with
+    one alpha for every pixel use per-surface alpha (much cheaper to blend
+    than per-pixel alpha), and sprites use convert_alpha(). Static surfaces
+    also get RLE acceleration, which skips transparent runs when blitting;
+    it is left off surfaces that are redrawn, since SDL re-encodes an RLE
+    surface after every change.
+    """
+
+    def __init__(self):
+        self.overlays: Dict[Tuple, pygame.Surface] = {}
+
+    def display_ready(self) -> bool:
+        return (pygame.display.get_init() and
+                pygame.display.get_surface() is not None)
+
+    def convert(self, surface: pygame.Surface, static: bool = False
+                ) -> pygame.Surface:
+        """Convert a finished surface, keeping its alpha mode.
+
+        Palettized 8-bit surfaces are left in their format on purpose (they
+        trade blit speed for memory), but still get RLE when static.
+        """
+        if self.display_ready() and surface.get_bitsize() > 8:
+            colorkey = surface.get_colorkey()
+            if surface.get_flags() & pygame.SRCALPHA:
+                surface = surface.convert_alpha()
+            else:
+                alpha = surface.get_alpha()
+                surface = surface.convert()
+                if alpha is not None and alpha < 255:
+                    surface.set_alpha(alpha)
+                if colorkey is not None:
+                    surface.set_colorkey(colorkey)
+        if static:
+            self.set_rle(surface)
+        return surface
+
+    def set_rle(self, surface: pygame.Surface):
+        if surface.get_colorkey() is not None:
+            surface.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+        elif surface.get_flags() & pygame.SRCALPHA:
+            surface.set_alpha(255, pygame.RLEACCEL)
+
+    def create(self, size: Tuple[int, int], alpha: bool = False
+               ) -> pygame.Surface:
+        """Blank surface to draw on; per-pixel alpha when `alpha` is set"""
+        return self.convert(pygame.Surface(size, pygame.SRCALPHA if alpha
+                                           else 0))
+
+    def create_faded(self, size: Tuple[int, int], alpha: int
+                     ) -> pygame.Surface:
+        """Opaque surface blended with one alpha for every pixel"""
+        surface = self.create(size)
+        surface.set_alpha(alpha)
+        return surface
+
+    def get_overlay(self, size: Tuple[int, int], color: Tuple[int, int, int],
+                    alpha: int) -> pygame.Surface:
+        """Shared full-screen tint, e.g. behind pause and summary screens"""
+        key = (tuple(size), tuple(color[:3]), alpha)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = self.create_faded(size, alpha)
+            overlay.fill(color[:3])
+            self.overlays[key] = overlay
+        return overlay
+
+    def clear(self):
+        """Forget cached overlays, e.g. after the display mode changes"""
+        self.overlays.clear()
+
+# Shared so overlays are reused across games and menus
+surface_factory = SurfaceFactory()
@@ -0,0 +1,105 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+from .surface_factory import surface_factory
+
+class TextCache:
+    """Shared fonts and an LRU cache of rendered text.
+
+    Fonts are created once per (name, size) for the whole process. Rendered
+    strings are keyed by (font, text, color, antialias), so static labels
+    and prompts are rasterized once. Counters that change every few frames
+    go through render_counter(), which composes the label and pre-rendered
+    digit glyphs instead of rasterizing the new string.
+    """
+
+    DIGITS = '0123456789-'
+
+    def __init__(self, max_surfaces: int = 512):
+        self.max_surfaces = max_surfaces
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.surfaces: OrderedDict = OrderedDict()
+        self.glyphs: Dict[Tuple, Dict[str, pygame.Surface]] = {}
+        self.counters: Dict[Tuple, Tuple[str, pygame.Surface]] = {}
+
+    def get_font(self, size: int, name: Optional[str] = None
+                 ) -> pygame.font.Font:
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font: pygame.font.Font, text: str,
+               color: Tuple[int, int, int], antialias: bool = True,
+               alpha: Optional[int] = None) -> pygame.Surface:
+        """Cached font.render(). The surface is shared, so its alpha is
+        set on every call rather than by the caller."""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = surface_factory.convert(
+                font.render(text, antialias, color))
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_surfaces:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        surface.set_alpha(255 if alpha is None else alpha)
+        return surface
+
+    def render_counter(self, font: pygame.font.Font, label: str,
+                       value: Union[int, str], color: Tuple[int, int, int],
+                       antialias: bool = True) -> pygame.Surface:
+        """`label` followed by `value`, built from cached digit glyphs.
+
+        Each (font, label, color) keeps only its latest surface, so a
+        changing score does not push static text out of the LRU cache.
+        """
+        digits = str(value)
+        key = (font, label, tuple(color), antialias)
+        last = self.counters.get(key)
+        if last is not None and last[0] == digits:
+            return last[1]
+
+        glyphs = self.get_glyphs(font, key[2], antialias)
+        if not all(char in glyphs for char in digits):
+            surface = surface_factory.convert(
+                font.render(label + digits, antialias, color))
+        else:
+            prefix = self.render(font, label, color, antialias)
+            surface = surface_factory.create(font.size(label + digits),
+                                             alpha=True)
+            # Glyphs never overlap, so MAX copies them exactly onto the
+            # transparent surface instead of blending against black
+            surface.blit(prefix, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            # Advances are not whole pixels, so each glyph is placed by
+            # measuring the text up to its right edge (size() does not
+            # rasterize)
+            for index, char in enumerate(digits, 1):
+                glyph = glyphs[char]
+                x = font.size(label + digits[:index])[0] - glyph.get_width()
+                surface.blit(glyph, (x, 0),
+                             special_flags=pygame.BLEND_RGBA_MAX)
+        self.counters[key] = (digits, surface)
+        return surface
+
+    def get_glyphs(self, font: pygame.font.Font, color: Tuple[int, int, int],
+                   antialias: bool) -> Dict[str, pygame.Surface]:
+        key = (font, color, antialias)
+        glyphs = self.glyphs.get(key)
+        if glyphs is None:
+            glyphs = {char: font.render(char, antialias, color)
+                      for char in self.DIGITS}
+            self.glyphs[key] = glyphs
+        return glyphs
+
+    def clear(self):
+        """Drop rendered text; fonts are kept"""
+        self.surfaces.clear()
+        self.glyphs.clear()
+        self.counters.clear()
+
+# Shared so fonts and rendered labels are reused across games and menus
+text_cache = TextCache()
@@ -0,0 +1,59 @@
+import pygame
+from array import array
+from typing import Iterable, Iterator, Sequence, Tuple
+from .surface_factory import surface_factory
+
+class Trail:
+    """Fixed-size ring buffer of the most recent positions"""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.xs = array('d', [0.0] * length)
+        self.ys = array('d', [0.0] * length)
+        self.head = 0  # Slot the next position is written to
+        self.count = 0
+
+    def push(self, x: float, y: float):
+        self.xs[self.head] = x
+        self.ys[self.head] = y
+        self.head = (self.head + 1) % self.length
+        self.count = min(self.count + 1, self.length)
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def positions(self) -> Iterator[Tuple[float, float]]:
+        """Yield stored positions from newest to oldest"""
+        xs, ys, length = self.xs, self.ys, self.length
+        for age in range(self.count):
+            index = (self.head - 1 - age) % length
+            yield xs[index], ys[index]
+
+class TrailRenderer:
+    """Pre-rendered dots for one trail style, drawn with one blits() call.
+
+    `sizes` and `alphas` give the dot diameter and alpha for each age, where
+    age 0 is the newest point. Any number of trails sharing the style are
+    submitted together.
+    """
+
+    def __init__(self, color: Tuple[int, int, int], sizes: Sequence[int],
+                 alphas: Sequence[int]):
+        self.color = color
+        self.dots = []
+        for size, alpha in zip(sizes, alphas):
+            size = max(1, int(size))
+            dot = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(dot, (*color[:3], max(0, int(alpha))),
+                               (size / 2, size / 2), size / 2)
+            self.dots.append((surface_factory.convert(dot, static=True),
+                              size / 2))
+
+    def draw(self, screen, trails: Iterable[Trail]):
+        dots = self.dots
+        screen.blits([(dots[age][0], (x - dots[age][1], y - dots[age][1]))
+                      for trail in trails
+                      for age, (x, y) in enumerate(trail.positions())
+                      if age < len(dots)],
+                     doreturn=False)